@@ -9,29 +9,97 @@ Ce module constitue le cœur du moteur VeriQual-Core.
 """
 
 import os
+import copy
+import asyncio
+import hashlib
 import logging
-from typing import Optional, Dict, List, Any, Tuple
+import threading
+import contextlib
+import multiprocessing
+import multiprocessing.connection
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Dict, List, Any, Tuple, Literal
 from tools.common.profiling import profile_dataframe_columns, infer_semantic_types,detect_sensitive_data 
+from tools.common.profiling import (
+    ColumnProfileAccumulator,
+    accumulate_dataframe_columns,
+    profile_accumulated_columns,
+    infer_accumulated_semantic_types,
+    detect_accumulated_sensitive_data,
+)
+from tools.common.duplicates import DuplicateRowAccumulator
+from tools.common.hashing import hash_dataframe_rows
+from tools.common.sketches import HyperLogLog
+from tools.common.report_cache import ReportCache
+from tools.common.report_writer import BatchSummaryWriter, resolve_report_serializer, write_report, report_summary
+from tools.common.instrumentation import PerformanceRecorder
+from tools.common.incremental import (
+    supports_incremental_encoding,
+    prefix_signature,
+    verify_prefix,
+    state_path_for,
+    load_incremental_state,
+    save_incremental_state,
+)
+from tools.common.sampling import (
+    Z_95,
+    ReservoirSampler,
+    SystematicSampler,
+    retype_sample,
+    proportion_confidence_interval,
+    undetected_prevalence_upper_bound,
+)
 
 from pydantic import BaseModel, Field, ValidationError
-from tools.common.files import get_csv_files_in_directory
+from tools.common.files import iter_csv_files, CSV_FILE_PATTERNS, split_compression_extension
 import traceback
 import pandas as pd
 import json
 import csv 
 
-from tools.common.logs import configure_logging
+from tools.common.logs import configure_logging, process_log_queue, route_logging_to_queue
 from tools.common.files import (
     check_file_exists,
     check_file_readable,
     check_file_extension,
     check_file_not_empty,
-    detect_file_encoding,
-    check_file_empty_content,
-    detect_csv_separator,
+    detect_compression,
+    scan_file_structure,
+    detect_csv_dialect,
+    validate_csv_prefix,
+    PREFIX_VALIDATION_ROWS,
+    PREFIX_MAX_RAGGED_RATIO,
+    DIALECT_SAMPLE_LINES,
+    DIALECT_SAMPLE_CHARS,
     load_dataframe_robustly,
+    load_dataframe_memory_optimized,
+    iter_dataframe_chunks,
+    describe_dataframe_load_error,
 )
 
+# Version du moteur d'audit, incluse dans la clé du cache de rapports : à incrémenter à chaque
+# évolution du contenu des rapports pour invalider les rapports en cache
+ENGINE_VERSION = "1.5.11"
+# Options d'exécution sans effet sur le contenu du rapport, exclues de la clé du cache
+_CACHE_NEUTRAL_OPTIONS = {
+    "batch_workers", "column_workers", "column_executor", "duplicate_spill_dir", "cache_dir", "cache_max_size_mb",
+    "async_max_concurrency", "report_serializer", "report_pretty", "batch_summary_file",
+    "batch_recursive", "batch_include", "batch_exclude", "batch_schedule", "log_to_file", "log_file",
+}
+# Logger partagé par tous les audits du processus
+_AUDIT_LOGGER = "veriqual.audit"
+# Fichier de log du logger d'audit dans ce processus (None : console uniquement)
+_audit_log_file: Optional[str] = None
+
+
+class AuditCancelledError(asyncio.CancelledError):
+    """
+    Audit interrompu par AuditRunner.cancel() (ou l'annulation de run_audit_async), au point de
+    contrôle suivant : début d'étape ou bloc lu. Comme asyncio.CancelledError, dont elle hérite,
+    elle n'est pas interceptée par les `except Exception` des étapes.
+    """
+
 class VeriQualConfigV1(BaseModel):
     scoring_profile: Dict[str, int] = Field(
         default_factory=lambda: {
@@ -42,6 +110,90 @@ class VeriQualConfigV1(BaseModel):
             "conformite": 10,
         }
     )
+    # Mode streaming : lecture par blocs de `chunk_size` lignes pour les fichiers plus grands que la RAM
+    streaming: bool = False
+    chunk_size: int = Field(default=100_000, gt=0)
+    # Estimation HyperLogLog du nombre de valeurs distinctes (mémoire fixe par colonne)
+    approximate_distinct: bool = False
+    hll_precision: int = Field(default=14, ge=4, le=18)
+    # Estimation des quantiles numériques par sketch KLL fusionnable (median, q1, q3, p1, p99)
+    quantile_sketch: bool = False
+    kll_k: int = Field(default=200, ge=8)
+    # Résumé Misra-Gries à mémoire bornée pour top_frequencies / most_frequent_value
+    heavy_hitters: bool = False
+    heavy_hitters_capacity: int = Field(default=64, ge=5)
+    # Détection des doublons par empreintes de lignes (64 ou 128 bits), avec déversement sur
+    # disque au-delà de `duplicate_memory_budget_mb` (None : tout en mémoire)
+    duplicate_fingerprint_bits: Literal[64, 128] = 64
+    duplicate_memory_budget_mb: Optional[float] = Field(default=None, gt=0)
+    duplicate_spill_dir: Optional[str] = None
+    # Moteur de recherche des PII : module re, ou RE2 via pyarrow.compute si pyarrow est installé
+    pii_engine: Literal["python", "pyarrow"] = "python"
+    # Mode échantillonnage : audit d'un échantillon reproductible de `sample_size` lignes,
+    # métriques estimées avec intervalles de confiance à 95 % (section "sampling" du rapport)
+    sampling: bool = False
+    sampling_method: Literal["reservoir", "systematic"] = "reservoir"
+    sample_size: int = Field(default=10_000, gt=0)
+    sample_seed: int = 0
+    # Traitement parallèle des colonnes pour le profilage, le typage et la détection PII
+    # (mode complet et échantillonnage) : "thread" sans copie, "process" sans contention du GIL
+    column_workers: int = Field(default=1, ge=1)
+    column_executor: Literal["thread", "process"] = "thread"
+    # Nombre de lignes examinées par la détection du dialecte CSV (délimiteur, citation, en-tête)
+    dialect_sample_lines: int = Field(default=DIALECT_SAMPLE_LINES, gt=0)
+    # Validation préalable de l'en-tête et des `prefix_validation_rows` premières lignes avant le
+    # chargement complet (section "prefix_validation" du rapport) : arrêt immédiat si l'en-tête n'a
+    # aucun nom ou si plus de `prefix_max_ragged_ratio` des lignes seraient écartées par le chargement
+    # (lignes trop longues ; avec le moteur Arrow, toute ligne au nombre de champs différent de l'en-tête)
+    prefix_validation: bool = True
+    prefix_validation_rows: int = Field(default=PREFIX_VALIDATION_ROWS, gt=0)
+    prefix_max_ragged_ratio: float = Field(default=PREFIX_MAX_RAGGED_RATIO, ge=0, le=1)
+    # Nombre de processus de run_batch_audit (1 : audit séquentiel dans le processus courant)
+    batch_workers: int = Field(default=1, ge=1)
+    # Fichiers d'un lot : parcours des sous-répertoires (rapports rangés dans la même
+    # arborescence), motifs glob retenus et exclus (nom, ou chemin relatif si le motif contient "/")
+    batch_recursive: bool = False
+    batch_include: List[str] = list(CSV_FILE_PATTERNS)
+    batch_exclude: List[str] = []
+    # Ordre de lancement des audits d'un lot : par chemin, plus gros fichiers d'abord (durée
+    # totale du lot sur plusieurs processus) ou plus petits d'abord (premiers résultats au plus tôt)
+    batch_schedule: Literal["name", "largest_first", "smallest_first"] = "name"
+    # Moteur de chargement du mode complet : parseur pandas, ou lecteur CSV multithread de pyarrow
+    # (colonnes Arrow profilées sans conversion en objets Python). Les modes streaming et
+    # échantillonnage lisent toujours par blocs avec pandas.
+    load_engine: Literal["pandas", "arrow"] = "pandas"
+    # Chargement optimisé en mémoire du mode complet (moteur pandas) : dtypes compacts choisis sur
+    # les `memory_sample_rows` premières lignes (catégories, entiers nullables réduits, float32 sans
+    # perte, chaînes Arrow) ; empreinte obtenue dans la section "memory_footprint" du rapport
+    memory_optimized_load: bool = False
+    memory_sample_rows: int = Field(default=10_000, gt=0)
+    # Cache disque des rapports de run_batch_audit (None : désactivé), indexé par le contenu des
+    # fichiers et la configuration, borné à `cache_max_size_mb` (éviction des moins récemment utilisés)
+    cache_dir: Optional[str] = None
+    cache_max_size_mb: float = Field(default=512, gt=0)
+    # Audit incrémental des fichiers alimentés par ajout de lignes : l'état des accumulateurs du
+    # mode streaming (données JSON et numpy, sans pickle) est sauvegardé avec la position atteinte
+    # et l'empreinte du début déjà audité (à côté du fichier, ou dans `incremental_state_dir`) ;
+    # aux audits suivants, le début n'est relu que pour vérifier son empreinte, seule la fin est analysée
+    incremental: bool = False
+    incremental_state_dir: Optional[str] = None
+    # Mesures par étape (temps écoulé et CPU, débit, octets lus, pic de mémoire) dans la section
+    # "performance" du rapport ; pic de mémoire par RSS (coût négligeable) ou tracemalloc (précis, plus lent)
+    instrumentation: bool = False
+    instrumentation_memory: Literal["rss", "tracemalloc"] = "rss"
+    # Nombre maximal d'audits simultanés de run_batch_audit_async
+    async_max_concurrency: int = Field(default=4, ge=1)
+    # Rapports de run_batch_audit : sérialiseur ("json", "orjson", "auto" : orjson s'il est installé,
+    # ou un nom enregistré par register_report_serializer) et mise en forme indentée ou compacte
+    report_serializer: str = "json"
+    report_pretty: bool = True
+    # Journal NDJSON du lot (une ligne par fichier, ajoutée dès son résultat connu), dans le
+    # répertoire de sortie ou à un chemin absolu ; None : pas de journal
+    batch_summary_file: Optional[str] = None
+    # Journal d'exécution du moteur : copie des logs de la console dans `log_file`. Avec plusieurs
+    # processus (batch_workers), seul le processus principal écrit dans le fichier.
+    log_to_file: bool = False
+    log_file: str = "app.log"
 
 class AuditRunner:
     def __init__(self, filepath: str, config_dict: Optional[Dict[str, Any]] = None):
@@ -50,27 +202,30 @@ class AuditRunner:
         Initialise le moteur d'audit à partir d'une configuration utilisateur brute.
         """
         self.filepath = filepath
-        self.logger = configure_logging(
-            name="veriqual.audit",
-            level="INFO",
-            log_to_console=True,
-            log_to_file=True,
-            force=True
-            )
-        self.logger.info("Logger initialisé pour AuditRunner.")
         
         if config_dict is None:
             config_dict = {}
 
         try:
             self.config = VeriQualConfigV1(**config_dict)
-            self.logger.info("Configuration chargée et validée avec succès.")
         except ValidationError as e:
+            self.logger = _configure_audit_logger(None)
             self.logger.error("Erreur de validation de la configuration :")
             self.logger.error(e.json(indent=2))
             raise ValueError("Configuration invalide fournie au moteur VeriQual-Core.")
+        self.logger = _configure_audit_logger(self.config)
+        self.logger.info("Logger initialisé pour AuditRunner.")
+        self.logger.info("Configuration chargée et validée avec succès.")
 
         self.profile = self.config.scoring_profile
+        # Mesures par étape de run_audit (API : performance.stages, performance.summary())
+        self.performance = PerformanceRecorder(self.config.instrumentation, self.config.instrumentation_memory)
+        # Demande d'arrêt (cancel), vérifiée au début de chaque étape et à chaque bloc lu
+        self._cancel_event = threading.Event()
+        # Audit incrémental effectif (désactivé pour un fichier compressé, voir _run_audit_stages)
+        self._incremental = self.config.incremental
+        # Dialecte CSV détecté (citation, échappement, fins de ligne), transmis à chaque lecture
+        self._dialect = None
         
         # Définir profile_used_name dynamiquement en fonction de la présence de scoring_profile dans config_dict
         if config_dict and "scoring_profile" in config_dict:
@@ -82,11 +237,13 @@ class AuditRunner:
             "file_info": {
                 "file_name": None,
                 "file_size_kb": None,
+                "compression": None,
                 "total_rows": None,
                 "total_columns": None,
                 "detected_encoding": None,
                 "encoding_confidence": None,
-                "detected_separator": None
+                "detected_separator": None,
+                "detected_dialect": None
             },
             "header_info": {
                 "has_normalization_alerts": False,
@@ -115,6 +272,22 @@ class AuditRunner:
             "structural_errors": []
         }
 
+    def cancel(self) -> None:
+        """
+        Demande l'arrêt de l'audit en cours (appelable depuis un autre thread) : run_audit lève
+        AuditCancelledError au début de l'étape suivante ou au bloc lu suivant.
+        """
+        self._cancel_event.set()
+
+    def _check_cancelled(self) -> None:
+        if self._cancel_event.is_set():
+            raise AuditCancelledError(f"Audit de {self.filepath} annulé.")
+
+    def _stage(self, name: str, rows: Optional[int] = None, bytes_read: Optional[int] = None) -> Any:
+        """Point de contrôle d'annulation, puis mesure de l'étape (voir PerformanceRecorder.stage)."""
+        self._check_cancelled()
+        return self.performance.stage(name, rows, bytes_read)
+
     def _normalize_headers(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, str], bool]:
         """
         Nettoie les noms de colonnes d’un DataFrame en supprimant les espaces superflus 
@@ -150,10 +323,23 @@ class AuditRunner:
         
         return df, header_map, has_normalization_alerts
 
+    def _new_duplicate_accumulator(self) -> DuplicateRowAccumulator:
+        """Accumulateur de doublons configuré (taille d'empreinte, budget mémoire, répertoire de déversement)."""
+        budget_mb = self.config.duplicate_memory_budget_mb
+        return DuplicateRowAccumulator(
+            fingerprint_bits=self.config.duplicate_fingerprint_bits,
+            memory_budget_bytes=int(budget_mb * 1024 * 1024) if budget_mb is not None else None,
+            spill_dir=self.config.duplicate_spill_dir,
+        )
+
     def _detect_duplicates(self, df: pd.DataFrame) -> Tuple[int, float]:
         """
         Détecte les lignes strictement dupliquées dans un DataFrame.
 
+        Sans budget mémoire configuré, la comparaison est faite par `DataFrame.duplicated`.
+        Avec un budget, les lignes sont traitées par tranches de `chunk_size` via des
+        empreintes de lignes, déversées sur disque au-delà du budget.
+
         Args:
             df (pd.DataFrame): Le DataFrame analysé.
 
@@ -163,6 +349,12 @@ class AuditRunner:
         if len(df) == 0:
             return 0, 0.0
 
+        if self.config.duplicate_memory_budget_mb is not None:
+            duplicates = self._new_duplicate_accumulator()
+            for start in range(0, len(df), self.config.chunk_size):
+                duplicates.update(df.iloc[start:start + self.config.chunk_size])
+            return duplicates.result()
+
         duplicate_count = int(df.duplicated().sum())
         duplicate_ratio = round(float(duplicate_count) / len(df), 4)
 
@@ -256,10 +448,591 @@ class AuditRunner:
         
         return global_score, component_scores
 
+    def _run_in_memory_stages(self, encoding: str, separator: str) -> bool:
+        """
+        Charge le fichier complet en mémoire puis exécute les étapes F-01 (chargement) à F-06.
+
+        Args:
+            encoding (str): Encodage détecté du fichier.
+            separator (str): Séparateur détecté du fichier.
+
+        Returns:
+            bool: False si une erreur structurelle bloquante a interrompu l'audit.
+        """
+        # F-01: Chargement robuste du DataFrame et vérification structure rectangulaire
+        with self._stage("F-01 chargement", bytes_read=os.path.getsize(self.filepath)) as stage:
+            if self.config.memory_optimized_load and self.config.load_engine == "pandas":
+                df, final_separator, df_load_error_msg, df_load_error_code, footprint = load_dataframe_memory_optimized(
+                    self.filepath,
+                    encoding,
+                    separator,
+                    sample_rows=self.config.memory_sample_rows,
+                    dialect=self._dialect
+                )
+                self.audit_report["memory_footprint"] = footprint
+                if footprint["dataframe_bytes"] is not None:
+                    self.logger.info(f"Empreinte mémoire du DataFrame : {footprint['dataframe_bytes']} octets.")
+            else:
+                df, final_separator, df_load_error_msg, df_load_error_code = load_dataframe_robustly(
+                    self.filepath,
+                    encoding,
+                    separator, # Utilise le séparateur détecté avec le dialecte
+                    engine=self.config.load_engine,
+                    dialect=self._dialect
+                )
+            stage["rows"] = df.shape[0] if df is not None else 0
+        
+        if df_load_error_msg:
+            self.logger.error(f"Erreur détectée : {df_load_error_msg}")
+            self.audit_report["structural_errors"].append({
+                "error_code": df_load_error_code, # Utilise le code d'erreur direct de load_dataframe_robustly
+                "message": df_load_error_msg,
+                "is_blocking": True
+            })
+            return False
+        
+        # Mise à jour du séparateur dans file_info (si un repli a été utilisé)
+        # Note: final_separator est le séparateur qui a réellement fonctionné pour Pandas
+        self.audit_report["file_info"]["detected_separator"] = final_separator 
+        
+        # Mise à jour des dimensions du fichier
+        self.audit_report["file_info"]["total_rows"] = df.shape[0]
+        self.audit_report["file_info"]["total_columns"] = df.shape[1]
+
+        return self._analyze_dataframe(df)
+
+    def _analyze_dataframe(self, df: pd.DataFrame) -> bool:
+        """
+        Exécute les étapes F-02 (en-têtes) à F-06 (doublons) sur un DataFrame chargé.
+
+        Args:
+            df (pd.DataFrame): Le DataFrame du fichier (ou l'échantillon analysé).
+
+        Returns:
+            bool: True (aucune de ces étapes n'interrompt l'audit).
+        """
+        rows = len(df)
+        # F-02: Normalisation des En-têtes
+        with self._stage("F-02 en-têtes", rows=rows):
+            self.logger.info("Démarrage de la normalisation des en-têtes (F-02).")
+            df, header_map, has_alerts = self._normalize_headers(df)
+            self.audit_report['header_info']['has_normalization_alerts'] = has_alerts
+            self.audit_report['header_info']['header_map'] = header_map
+            if has_alerts:
+                self.logger.info("Des modifications ont été apportées aux en-têtes.")
+
+        # F-03: Profilage de Données
+        with self._stage("F-03 profilage", rows=rows):
+            self.logger.info("Démarrage du profilage des colonnes (F-03).")
+            column_profiles = profile_dataframe_columns(
+                df,
+                header_map,
+                approximate_distinct=self.config.approximate_distinct,
+                hll_precision=self.config.hll_precision,
+                quantile_sketch=self.config.quantile_sketch,
+                kll_k=self.config.kll_k,
+                heavy_hitters=self.config.heavy_hitters,
+                heavy_hitters_capacity=self.config.heavy_hitters_capacity,
+                workers=self.config.column_workers,
+                executor=self.config.column_executor
+            ) # Appel à la fonction de profiling
+            self.audit_report["column_analysis"] = column_profiles
+
+        # F-04: Typage Sémantique
+        with self._stage("F-04 typage", rows=rows):
+            self.logger.info("Démarrage du typage sémantique (F-04).")
+            column_profiles = infer_semantic_types(
+                column_profiles, df, self.config.column_workers, self.config.column_executor
+            ) # Appel à la fonction de typage sémantique
+            self.audit_report["column_analysis"] = column_profiles # Mise à jour avec les types sémantiques
+        # F-05: Détection de PII/DCP
+        with self._stage("F-05 PII", rows=rows):
+            self.logger.info("Démarrage de la détection PII/DCP (F-05).") 
+            contains_sensitive, pii_columns = detect_sensitive_data(
+                df, column_profiles, self.config.pii_engine, self.config.column_workers, self.config.column_executor
+            )
+            self.audit_report["sensitive_data_report"]["contains_sensitive_data"] = contains_sensitive
+            self.audit_report["sensitive_data_report"]["detected_columns"] = pii_columns
+        # F-06: Détection doublons
+        with self._stage("F-06 doublons", rows=rows):
+            self.logger.info("Démarrage de la détection de lignes dupliquées (F-06).")
+            duplicate_count, duplicate_ratio = self._detect_duplicates(df)
+            self.audit_report["duplicate_rows_report"]["duplicate_row_count"] = duplicate_count
+            self.audit_report["duplicate_rows_report"]["duplicate_row_ratio"] = duplicate_ratio
+
+        return True
+
+    def _accumulator_options(self) -> Dict[str, Any]:
+        """Options des accumulateurs de colonnes du mode streaming, dérivées de la configuration."""
+        return {
+            "hll_precision": self.config.hll_precision if self.config.approximate_distinct else None,
+            "kll_k": self.config.kll_k if self.config.quantile_sketch else None,
+            "heavy_hitters_capacity": self.config.heavy_hitters_capacity if self.config.heavy_hitters else None,
+            "pii_engine": self.config.pii_engine,
+        }
+
+    def _run_streaming_stages(self, encoding: str, separator: str) -> bool:
+        """
+        Exécute les étapes F-01 (chargement) à F-06 en lisant le fichier par blocs de
+        `chunk_size` lignes. Chaque bloc alimente les accumulateurs fusionnables de
+        profilage, typage, PII et doublons : la mémoire est bornée par la taille d'un bloc
+        et le rapport produit a le même schéma qu'en mode complet.
+
+        Args:
+            encoding (str): Encodage détecté du fichier.
+            separator (str): Séparateur détecté du fichier.
+
+        Returns:
+            bool: False si une erreur structurelle bloquante a interrompu l'audit.
+        """
+        self.logger.info(f"Mode streaming : lecture par blocs de {self.config.chunk_size} lignes.")
+        # Mode incrémental : lecture arrêtée à la taille constatée ici, même si le fichier grossit entre-temps
+        end_offset = os.path.getsize(self.filepath) if self._incremental else None
+        accumulators = None
+        duplicates = self._new_duplicate_accumulator()
+        header_map, has_alerts = {}, False
+        total_columns = 0
+
+        bytes_read = end_offset if end_offset is not None else os.path.getsize(self.filepath)
+        with self._stage("F-01 à F-06 lecture par blocs", bytes_read=bytes_read) as stage:
+            try:
+                for chunk in iter_dataframe_chunks(self.filepath, encoding, separator, self.config.chunk_size, end_offset=end_offset,
+                                                   dialect=self._dialect):
+                    self._check_cancelled()
+                    # F-02: Normalisation des En-têtes (identique pour tous les blocs)
+                    chunk, header_map, has_alerts = self._normalize_headers(chunk)
+                    total_columns = chunk.shape[1]
+                    # F-03 à F-05 : accumulateurs par colonne ; F-06 : empreintes de lignes
+                    accumulators = accumulate_dataframe_columns(chunk, accumulators, header_map, **self._accumulator_options())
+                    duplicates.update(chunk)
+            except Exception as e:
+                error_msg, error_code = describe_dataframe_load_error(e)
+                self.logger.error(f"Erreur détectée : {error_msg}")
+                self.audit_report["structural_errors"].append({
+                    "error_code": error_code,
+                    "message": error_msg,
+                    "is_blocking": True
+                })
+                return False
+            stage["rows"] = duplicates.total_rows
+
+        # Colonnes lues comme numériques dans certains blocs et comme texte dans d'autres :
+        # seconde lecture avec le dtype final imposé, pour des métriques et des doublons exacts
+        conflicting_columns = [
+            name for name, accumulator in (accumulators or {}).items() if accumulator.has_type_conflict
+        ]
+        if conflicting_columns:
+            self.logger.warning(
+                f"Types hétérogènes entre blocs pour les colonnes {conflicting_columns} : relecture avec types figés."
+            )
+            forced_dtypes = {accumulators[name].original_name: accumulators[name].dtype for name in conflicting_columns}
+            reread = {
+                name: ColumnProfileAccumulator(name, accumulators[name].original_name, **self._accumulator_options())
+                for name in conflicting_columns
+            }
+            with self._stage("F-01 à F-06 relecture (types figés)", bytes_read=bytes_read) as stage:
+                duplicates = self._new_duplicate_accumulator()
+                try:
+                    for chunk in iter_dataframe_chunks(self.filepath, encoding, separator, self.config.chunk_size, dtype=forced_dtypes,
+                                                       end_offset=end_offset, dialect=self._dialect):
+                        self._check_cancelled()
+                        chunk, _, _ = self._normalize_headers(chunk)
+                        accumulate_dataframe_columns(chunk[conflicting_columns], reread)
+                        duplicates.update(chunk)
+                except Exception as e:
+                    error_msg, error_code = describe_dataframe_load_error(e)
+                    self.logger.error(f"Erreur détectée : {error_msg}")
+                    self.audit_report["structural_errors"].append({
+                        "error_code": error_code,
+                        "message": error_msg,
+                        "is_blocking": True
+                    })
+                    return False
+                stage["rows"] = duplicates.total_rows
+            accumulators.update(reread)
+
+        if duplicates.total_rows == 0 and total_columns > 0:
+            error_msg = "Le fichier ne contient pas de données après l'en-tête."
+            self.logger.error(f"Erreur détectée : {error_msg}")
+            self.audit_report["structural_errors"].append({
+                "error_code": "file_empty_after_header",
+                "message": error_msg,
+                "is_blocking": True
+            })
+            return False
+
+        if self._incremental:
+            self._save_incremental_state(encoding, separator, end_offset, accumulators, duplicates, header_map, has_alerts, total_columns)
+
+        self._report_accumulated_stages(separator, accumulators, duplicates, header_map, has_alerts, total_columns)
+        return True
+
+    def _report_accumulated_stages(
+        self,
+        separator: str,
+        accumulators: Dict[str, ColumnProfileAccumulator],
+        duplicates: DuplicateRowAccumulator,
+        header_map: Dict[str, str],
+        has_alerts: bool,
+        total_columns: int
+    ) -> None:
+        """Finalise les étapes F-02 à F-06 à partir des accumulateurs (modes streaming et incrémental)."""
+        self.audit_report["file_info"]["detected_separator"] = separator
+        self.audit_report["file_info"]["total_rows"] = duplicates.total_rows
+        self.audit_report["file_info"]["total_columns"] = total_columns
+
+        self.audit_report['header_info']['has_normalization_alerts'] = has_alerts
+        self.audit_report['header_info']['header_map'] = header_map
+        if has_alerts:
+            self.logger.info("Des modifications ont été apportées aux en-têtes.")
+
+        with self._stage("F-03 profilage", rows=duplicates.total_rows):
+            self.logger.info("Finalisation du profilage des colonnes (F-03).")
+            column_profiles = profile_accumulated_columns(accumulators)
+            self.audit_report["column_analysis"] = column_profiles
+
+        with self._stage("F-04 typage", rows=duplicates.total_rows):
+            self.logger.info("Finalisation du typage sémantique (F-04).")
+            column_profiles = infer_accumulated_semantic_types(column_profiles, accumulators)
+            self.audit_report["column_analysis"] = column_profiles
+
+        with self._stage("F-05 PII", rows=duplicates.total_rows):
+            self.logger.info("Finalisation de la détection PII/DCP (F-05).")
+            contains_sensitive, pii_columns = detect_accumulated_sensitive_data(accumulators, column_profiles)
+            self.audit_report["sensitive_data_report"]["contains_sensitive_data"] = contains_sensitive
+            self.audit_report["sensitive_data_report"]["detected_columns"] = pii_columns
+
+        with self._stage("F-06 doublons", rows=duplicates.total_rows):
+            self.logger.info("Finalisation de la détection de lignes dupliquées (F-06).")
+            duplicate_count, duplicate_ratio = duplicates.result()
+            self.audit_report["duplicate_rows_report"]["duplicate_row_count"] = duplicate_count
+            self.audit_report["duplicate_rows_report"]["duplicate_row_ratio"] = duplicate_ratio
+
+    def _incremental_state_key(self) -> Dict[str, Any]:
+        """Options dont dépend le contenu de l'état incrémental (un état d'autres options est ignoré)."""
+        return {
+            "engine_version": ENGINE_VERSION,
+            "filepath": os.path.abspath(self.filepath),
+            "accumulator_options": self._accumulator_options(),
+            "duplicate_fingerprint_bits": self.config.duplicate_fingerprint_bits,
+        }
+
+    def _save_incremental_state(
+        self,
+        encoding: str,
+        separator: str,
+        offset: int,
+        accumulators: Dict[str, ColumnProfileAccumulator],
+        duplicates: DuplicateRowAccumulator,
+        header_map: Dict[str, str],
+        has_alerts: bool,
+        total_columns: int,
+        prefix_hasher: Optional[Any] = None,
+        hashed_bytes: int = 0
+    ) -> None:
+        """
+        Sauvegarde l'état des accumulateurs et la position atteinte dans le fichier, avec
+        l'empreinte du préfixe audité (prolongée depuis `hashed_bytes` si `prefix_hasher` est
+        fourni). Les empreintes déversées sur disque ne survivent pas à l'audit : l'état n'est
+        alors pas sauvegardé.
+        """
+        if not supports_incremental_encoding(encoding):
+            self.logger.warning(f"Audit incrémental impossible pour l'encodage {encoding} : état non sauvegardé.")
+            return
+        if duplicates.spilled:
+            self.logger.warning("Empreintes de doublons déversées sur disque : état incrémental non sauvegardé.")
+            return
+        state_path = state_path_for(self.filepath, self.config.incremental_state_dir)
+        try:
+            save_incremental_state(state_path, {
+                "key": self._incremental_state_key(),
+                "prefix": prefix_signature(self.filepath, offset, prefix_hasher, hashed_bytes),
+                "encoding": encoding,
+                "encoding_confidence": self.audit_report["file_info"]["encoding_confidence"],
+                "separator": separator,
+                "dialect": self._dialect,
+                "columns": [accumulator.original_name for accumulator in accumulators.values()],
+                "accumulators": {name: accumulator.to_state() for name, accumulator in accumulators.items()},
+                "duplicates": duplicates.to_state(),
+                "header_map": header_map,
+                "has_alerts": has_alerts,
+                "total_columns": total_columns,
+            })
+            self.logger.info(f"État incrémental sauvegardé ({offset} octets audités) : {state_path}")
+        except (OSError, TypeError) as e:
+            self.logger.warning(f"Impossible de sauvegarder l'état incrémental : {e}")
+
+    def _resume_incremental_audit(self) -> Optional[bool]:
+        """
+        Reprend l'audit à partir de l'état sauvegardé : seules les lignes ajoutées depuis le
+        précédent audit sont lues, puis intégrées aux accumulateurs. L'état est ensuite mis à jour.
+
+        Returns:
+            Optional[bool]: True si le rapport a été produit par reprise, None si un audit complet
+                            est nécessaire (pas d'état, options différentes, préfixe modifié,
+                            lignes ajoutées illisibles ou de types incompatibles).
+        """
+        state_path = state_path_for(self.filepath, self.config.incremental_state_dir)
+        state = load_incremental_state(state_path)
+        if state is None:
+            self.logger.info("Aucun état incrémental exploitable : audit complet.")
+            return None
+        if state["key"] != self._incremental_state_key():
+            self.logger.info("État incrémental produit avec d'autres options : audit complet.")
+            return None
+        try:
+            accumulators = {
+                name: ColumnProfileAccumulator.from_state(accumulator) for name, accumulator in state["accumulators"].items()
+            }
+            budget_mb = self.config.duplicate_memory_budget_mb
+            duplicates = DuplicateRowAccumulator.from_state(
+                state["duplicates"],
+                memory_budget_bytes=int(budget_mb * 1024 * 1024) if budget_mb is not None else None,
+                spill_dir=self.config.duplicate_spill_dir,
+            )
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            self.logger.warning(f"État incrémental incohérent ({e}) : audit complet.")
+            return None
+        prefix_hasher = verify_prefix(self.filepath, state["prefix"])
+        if prefix_hasher is None:
+            self.logger.warning("Le fichier ne prolonge plus la partie déjà auditée (préfixe modifié ou dernière ligne complétée) : audit complet.")
+            return None
+
+        encoding, separator = state["encoding"], state["separator"]
+        self._dialect = state["dialect"]
+        if self.config.prefix_validation:
+            # Les lignes ajoutées peuvent entrer dans le début contrôlé d'un fichier court
+            prefix_result, prefix_errors = self._validate_prefix(encoding)
+            if prefix_errors:
+                self.logger.warning("Validation préalable en échec après ajout de lignes : audit complet.")
+                return None
+            self.audit_report["prefix_validation"] = prefix_result
+        self.audit_report["file_info"]["detected_dialect"] = self._dialect
+        self.audit_report["file_info"]["detected_encoding"] = encoding
+        self.audit_report["file_info"]["encoding_confidence"] = state["encoding_confidence"]
+        start_offset, end_offset = state["prefix"]["offset"], os.path.getsize(self.filepath)
+        self.logger.info(f"Audit incrémental : lecture des octets {start_offset} à {end_offset}.")
+        if end_offset > start_offset:
+            with self._stage("F-01 à F-06 reprise incrémentale", bytes_read=end_offset - start_offset) as stage:
+                rows_before = duplicates.total_rows
+                try:
+                    for chunk in iter_dataframe_chunks(self.filepath, encoding, separator, self.config.chunk_size,
+                                                       start_offset=start_offset, end_offset=end_offset, names=state["columns"],
+                                                       dialect=self._dialect):
+                        self._check_cancelled()
+                        if chunk.empty:
+                            continue
+                        chunk, _, _ = self._normalize_headers(chunk)
+                        accumulate_dataframe_columns(chunk, accumulators)
+                        duplicates.update(chunk)
+                except Exception as e:
+                    self.logger.warning(f"Lecture des lignes ajoutées impossible ({e}) : audit complet.")
+                    return None
+                if any(accumulator.has_type_conflict for accumulator in accumulators.values()):
+                    self.logger.warning("Types des lignes ajoutées incompatibles avec l'état sauvegardé : audit complet.")
+                    return None
+                stage["rows"] = duplicates.total_rows - rows_before
+            self._save_incremental_state(encoding, separator, end_offset, accumulators, duplicates,
+                                         state["header_map"], state["has_alerts"], state["total_columns"],
+                                         prefix_hasher, start_offset)
+
+        self._report_accumulated_stages(separator, accumulators, duplicates, state["header_map"], state["has_alerts"], state["total_columns"])
+        return True
+
+    def _run_sampling_stages(self, encoding: str, separator: str, expected_rows: int) -> bool:
+        """
+        Audit par échantillonnage, pour le tri rapide des gros fichiers. La lecture par blocs
+        ne sert qu'à tirer l'échantillon (réservoir ou systématique, reproductible) et à
+        alimenter un sketch HyperLogLog des empreintes de lignes ; les étapes F-02 à F-06
+        s'exécutent sur l'échantillon seul. Les métriques de "column_analysis" sont donc
+        celles de l'échantillon ; les estimations des ratios de valeurs manquantes et de
+        doublons, de la présence de PII et des scores, avec leurs intervalles de confiance
+        à 95 %, sont consignées dans la section "sampling" du rapport.
+
+        Args:
+            encoding (str): Encodage détecté du fichier.
+            separator (str): Séparateur détecté du fichier.
+            expected_rows (int): Nombre de lignes attendu (pas de l'échantillon systématique).
+
+        Returns:
+            bool: False si une erreur structurelle bloquante a interrompu l'audit.
+        """
+        method = self.config.sampling_method
+        self.logger.info(f"Mode échantillonnage ({method}) : échantillon de {self.config.sample_size} lignes.")
+        if method == "systematic":
+            sampler = SystematicSampler(self.config.sample_size, expected_rows, self.config.sample_seed)
+        else:
+            sampler = ReservoirSampler(self.config.sample_size, self.config.sample_seed)
+        # Nombre de lignes distinctes de la population, pour estimer le ratio de doublons
+        # (précision maximale : 256 Ko, erreur-type relative de 0.2 %)
+        distinct_rows = HyperLogLog(18)
+
+        with self._stage("F-01 échantillonnage", bytes_read=os.path.getsize(self.filepath)) as stage:
+            try:
+                # Blocs lus en texte : leurs lignes restent comparables, le typage est fait sur l'échantillon
+                for chunk in iter_dataframe_chunks(self.filepath, encoding, separator, self.config.chunk_size, dtype=str, dialect=self._dialect):
+                    self._check_cancelled()
+                    sampler.update(chunk)
+                    distinct_rows.update_hashes(hash_dataframe_rows(chunk))
+            except Exception as e:
+                error_msg, error_code = describe_dataframe_load_error(e)
+                self.logger.error(f"Erreur détectée : {error_msg}")
+                self.audit_report["structural_errors"].append({
+                    "error_code": error_code,
+                    "message": error_msg,
+                    "is_blocking": True
+                })
+                return False
+            stage["rows"] = sampler.rows_seen
+
+        population_rows = sampler.rows_seen
+        sample = sampler.result()
+        if population_rows == 0 or sample is None:
+            error_msg = "Le fichier ne contient pas de données après l'en-tête."
+            self.logger.error(f"Erreur détectée : {error_msg}")
+            self.audit_report["structural_errors"].append({
+                "error_code": "file_empty_after_header",
+                "message": error_msg,
+                "is_blocking": True
+            })
+            return False
+
+        sample = retype_sample(sample)
+        sample_rows = len(sample)
+        exhaustive = sample_rows >= population_rows
+        self.audit_report["file_info"]["detected_separator"] = separator
+        self.audit_report["file_info"]["total_rows"] = population_rows
+        self.audit_report["file_info"]["total_columns"] = sample.shape[1]
+        self._analyze_dataframe(sample)
+
+        # Ratios de valeurs manquantes : proportions observées sur l'échantillon
+        missing_intervals = {}
+        for col, missing_count in zip(self.audit_report["column_analysis"], sample.isna().sum().tolist()):
+            missing_intervals[col["column_name"]] = {
+                "estimate": col["metrics"]["missing_values_ratio"],
+                "confidence_interval_95": list(proportion_confidence_interval(int(missing_count), sample_rows, population_rows)),
+            }
+
+        # Ratio de doublons : 1 - lignes distinctes / lignes, le nombre de lignes distinctes étant
+        # estimé sur toute la population (un échantillon ne contient que rarement les deux
+        # exemplaires d'une ligne dupliquée)
+        duplicates_report = self.audit_report["duplicate_rows_report"]
+        if exhaustive:
+            duplicate_interval = {
+                "method": "exact",
+                "estimate": duplicates_report["duplicate_row_ratio"],
+                "confidence_interval_95": [duplicates_report["duplicate_row_ratio"]] * 2,
+            }
+        else:
+            distinct = min(distinct_rows.estimate(), population_rows)
+            margin = Z_95 * distinct_rows.relative_standard_error * distinct
+            duplicate_ratio = max(0.0, 1 - distinct / population_rows)
+            duplicates_report["duplicate_row_count"] = int(round(duplicate_ratio * population_rows))
+            duplicates_report["duplicate_row_ratio"] = round(duplicate_ratio, 4)
+            duplicate_interval = {
+                "method": "hyperloglog",
+                "estimate": round(duplicate_ratio, 4),
+                "confidence_interval_95": [
+                    round(max(0.0, 1 - min(population_rows, distinct + margin) / population_rows), 4),
+                    round(max(0.0, 1 - max(1.0, distinct - margin) / population_rows), 4),
+                ],
+            }
+
+        # PII : une détection sur l'échantillon est certaine ; une absence ne l'est pas
+        contains_sensitive = self.audit_report["sensitive_data_report"]["contains_sensitive_data"]
+        sensitive_estimate = {
+            "contains_sensitive_data": contains_sensitive,
+            "undetected_prevalence_upper_bound_95": 0.0 if exhaustive else undetected_prevalence_upper_bound(sample_rows),
+        }
+
+        # Scores : bornes obtenues en recalculant le score avec les bornes défavorables puis favorables
+        bounds = []
+        for side in (1, 0): # borne supérieure des ratios (pessimiste), puis inférieure (optimiste)
+            report = copy.deepcopy(self.audit_report)
+            for col in report["column_analysis"]:
+                col["metrics"]["missing_values_ratio"] = missing_intervals[col["column_name"]]["confidence_interval_95"][side]
+            report["duplicate_rows_report"]["duplicate_row_ratio"] = duplicate_interval["confidence_interval_95"][side]
+            if side == 1 and not exhaustive:
+                report["sensitive_data_report"]["contains_sensitive_data"] = True
+            bounds.append(self._calculate_quality_score(report, None))
+        (low_global, low_components), (high_global, high_components) = bounds
+
+        self.audit_report["sampling"] = {
+            "method": method,
+            "seed": self.config.sample_seed,
+            "sample_size": sample_rows,
+            "population_rows": population_rows,
+            "confidence_level": 0.95,
+            "missing_values_ratio": missing_intervals,
+            "duplicate_row_ratio": duplicate_interval,
+            "sensitive_data": sensitive_estimate,
+            "quality_score": {
+                "global_score": [low_global, high_global],
+                "component_scores": {dim: [low_components[dim], high_components[dim]] for dim in low_components},
+            },
+        }
+        return True
+
     def run_audit(self) -> Dict[str, Any]:
         """
         Lance le processus d’audit et retourne un dictionnaire JSON normalisé.
+
+        Avec `instrumentation`, le rapport comporte une section "performance" : mesures par
+        étape (temps écoulé et CPU, lignes/s, octets lus, pic de mémoire), également
+        disponibles par l'attribut `performance` du moteur.
+        """
+        try:
+            report = self._run_audit_stages()
+        finally:
+            self.performance.stop()
+        if self.config.instrumentation:
+            report["performance"] = self.performance.summary()
+        return report
+
+    async def run_audit_async(
+        self,
+        executor: Optional[Executor] = None,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> Dict[str, Any]:
         """
+        Version asyncio de run_audit, pour les services qui auditent sans bloquer leur boucle
+        d'événements : l'audit, lectures du fichier comprises, s'exécute dans `executor`.
+
+        L'annulation de la tâche arrête l'audit au point de contrôle suivant (début d'étape ou
+        bloc lu) ; la coroutine attend cet arrêt avant de propager l'annulation, de sorte qu'un
+        audit annulé n'occupe plus ni l'exécuteur ni le sémaphore. Avec un ProcessPoolExecutor,
+        l'audit tourne dans un autre processus : annulé avant son démarrage, il n'est pas lancé ;
+        déjà commencé, il s'achève et son rapport est ignoré. Pour que ses processus journalisent
+        par le processus principal, le ProcessPoolExecutor est créé avec
+        `initializer=route_logging_to_queue, initargs=("veriqual.audit", process_log_queue("veriqual.audit"))`.
+
+        Args:
+            executor (Optional[Executor]): Exécuteur de l'audit (None : exécuteur par défaut de la boucle, à threads).
+            semaphore (Optional[asyncio.Semaphore]): Sémaphore, éventuellement partagé entre moteurs,
+                                                     bornant le nombre d'audits simultanés.
+
+        Returns:
+            Dict[str, Any]: Le rapport d'audit (voir run_audit).
+        """
+        async with semaphore if semaphore is not None else contextlib.nullcontext():
+            loop = asyncio.get_running_loop()
+            if isinstance(executor, ProcessPoolExecutor):
+                # Le moteur (logger, verrous) n'est pas transmissible : audit recréé dans le processus
+                config_dict = self.config.model_dump(exclude_unset=True)
+                self.audit_report = await loop.run_in_executor(executor, _run_audit_report, self.filepath, config_dict)
+                return self.audit_report
+            future = loop.run_in_executor(executor, self.run_audit)
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                self.cancel()
+                # L'étape en cours se poursuit dans l'exécuteur jusqu'au point de contrôle suivant
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await future
+                raise
+
+    def _run_audit_stages(self) -> Dict[str, Any]:
+        """Étapes F-01 à F-08 de run_audit."""
         self.logger.info("Début de l'audit.")
         
         # Analyse structurelle F-01 (toujours active en V1)
@@ -302,8 +1075,29 @@ class AuditRunner:
                 "is_blocking": True
             })
             return self.audit_report
+
+        # Fichier compressé : décompressé à la volée par chaque lecture, sans fichier intermédiaire
+        compression = detect_compression(self.filepath)
+        self.audit_report["file_info"]["compression"] = compression
+        if compression is not None:
+            self.logger.info(f"Fichier compressé ({compression}) : décompression à la volée.")
+            if self._incremental:
+                # Les positions de reprise sont des positions dans le fichier : audit complet par blocs
+                self.logger.warning("Audit incrémental impossible pour un fichier compressé : audit complet.")
+                self._incremental = False
+
+        if self._incremental and not self.config.sampling and self._resume_incremental_audit():
+            return self._score_report()
         
-        detected_encoding, encoding_confidence, encoding_error_msg = detect_file_encoding(self.filepath)
+        # F-01: Encodage, contenu vide, nombre de lignes et échantillon en une seule lecture
+        self.logger.info("Analyse structurelle du fichier (encodage, contenu) en une seule passe.")
+        with self._stage("F-01 encodage", bytes_read=os.path.getsize(self.filepath)) as stage:
+            # Échantillon assez long pour couvrir les lignes examinées par la détection du dialecte
+            scan = scan_file_structure(self.filepath, text_sample_size=DIALECT_SAMPLE_CHARS)
+            stage["rows"] = scan["line_count"]
+        detected_encoding = scan["encoding"]
+        encoding_confidence = scan["encoding_confidence"]
+        encoding_error_msg = scan["encoding_error"]
         if encoding_error_msg:
             self.logger.error(f"Erreur détectée : {encoding_error_msg}")
             self.audit_report["structural_errors"].append({
@@ -315,9 +1109,10 @@ class AuditRunner:
         
         self.audit_report["file_info"]["detected_encoding"] = detected_encoding
         self.audit_report["file_info"]["encoding_confidence"] = encoding_confidence
+        self.logger.info(f"Nombre de lignes physiques : {scan['line_count']}")
         
-        is_content_ok, content_error_msg = check_file_empty_content(self.filepath, detected_encoding)
-        if not is_content_ok:
+        if not scan["has_content"]:
+            content_error_msg = "Le fichier est vide de contenu significatif (seulement des espaces ou lignes vides)."
             self.logger.error(f"Erreur détectée : {content_error_msg}")
             self.audit_report["structural_errors"].append({
                 "error_code": "file_empty_content",
@@ -326,9 +1121,21 @@ class AuditRunner:
             })
             return self.audit_report
         
-        # F-01: Détection du séparateur
-        detected_separator_sniffer, separator_error_msg = detect_csv_separator(self.filepath, detected_encoding)
-        print("sep:" , detected_separator_sniffer)
+        # F-01: Détection du dialecte (séparateur, citation, échappement, fins de ligne, en-tête)
+        with self._stage("F-01 séparateur"):
+            dialect, separator_error_msg = detect_csv_dialect(
+                self.filepath,
+                detected_encoding,
+                sample=scan["sample"], # Réutilise l'échantillon du scan, sans relire le fichier
+                max_lines=self.config.dialect_sample_lines,
+                sample_complete=scan["sample_complete"]
+            )
+        detected_separator_sniffer = dialect["delimiter"]
+        self._dialect = dialect
+        self.audit_report["file_info"]["detected_dialect"] = dialect
+        self.logger.info(f"Séparateur détecté : {detected_separator_sniffer!r}")
+        if not dialect["has_header"]:
+            self.logger.warning("La première ligne ressemble à une ligne de données : en-tête probablement absent.")
         if separator_error_msg:
             self.logger.error(f"Erreur détectée  : {separator_error_msg}")
             self.audit_report["structural_errors"].append({
@@ -337,204 +1144,578 @@ class AuditRunner:
                 "is_blocking": True
             })
             return self.audit_report
+
+        # F-01: Validation préalable (en-tête et premières lignes), avant la lecture complète
+        if self.config.prefix_validation:
+            prefix_result, prefix_errors = self._validate_prefix(detected_encoding)
+            self.audit_report["prefix_validation"] = prefix_result
+            if prefix_result["duplicate_column_names"] or prefix_result["empty_column_names"]:
+                self.logger.warning(
+                    f"En-tête : noms de colonnes en double {prefix_result['duplicate_column_names']}, "
+                    f"vides aux positions {prefix_result['empty_column_names']}."
+                )
+            if prefix_errors:
+                for error in prefix_errors:
+                    self.logger.error(f"Erreur détectée : {error['message']}")
+                self.audit_report["structural_errors"].extend(prefix_errors)
+                return self.audit_report
         
-        # F-01: Chargement robuste du DataFrame et vérification structure rectangulaire
-        df, final_separator, df_load_error_msg, df_load_error_code = load_dataframe_robustly(
-            self.filepath,
-            detected_encoding,
-            detected_separator_sniffer # Utilise le séparateur détecté par Sniffer
-        )
-        
-        if df_load_error_msg:
-            self.logger.error(f"Erreur détectée : {df_load_error_msg}")
-            self.audit_report["structural_errors"].append({
-                "error_code": df_load_error_code, # Utilise le code d'erreur direct de load_dataframe_robustly
-                "message": df_load_error_msg,
-                "is_blocking": True
-            })
+        if self.config.sampling:
+            # F-02 à F-06 sur un échantillon ; estimations et intervalles de confiance
+            stages_ok = self._run_sampling_stages(detected_encoding, detected_separator_sniffer, max(0, scan["line_count"] - 1))
+        elif self.config.streaming or self.config.incremental:
+            # F-01 à F-06 en une seule lecture par blocs, sans charger le DataFrame complet
+            stages_ok = self._run_streaming_stages(detected_encoding, detected_separator_sniffer)
+        else:
+            stages_ok = self._run_in_memory_stages(detected_encoding, detected_separator_sniffer)
+        if not stages_ok:
             return self.audit_report
-        
-        # Mise à jour du séparateur dans file_info (si un repli a été utilisé)
-        # Note: final_separator est le séparateur qui a réellement fonctionné pour Pandas
-        self.audit_report["file_info"]["detected_separator"] = final_separator 
-        
-        # Mise à jour des dimensions du fichier
-        self.audit_report["file_info"]["total_rows"] = df.shape[0]
-        self.audit_report["file_info"]["total_columns"] = df.shape[1]
-
-        # F-02: Normalisation des En-têtes
-        self.logger.info("Démarrage de la normalisation des en-têtes (F-02).")
-        df, header_map, has_alerts = self._normalize_headers(df)
-        self.audit_report['header_info']['has_normalization_alerts'] = has_alerts
-        self.audit_report['header_info']['header_map'] = header_map
-        if has_alerts:
-            self.logger.info("Des modifications ont été apportées aux en-têtes.")
 
-        # F-03: Profilage de Données
-        self.logger.info("Démarrage du profilage des colonnes (F-03).")
-        column_profiles = profile_dataframe_columns(df, header_map) # Appel à la fonction de profiling
-        self.audit_report["column_analysis"] = column_profiles
+        return self._score_report()
 
-        # F-04: Typage Sémantique
-        self.logger.info("Démarrage du typage sémantique (F-04).")
-        column_profiles = infer_semantic_types(column_profiles, df) # Appel à la fonction de typage sémantique
-        self.audit_report["column_analysis"] = column_profiles # Mise à jour avec les types sémantiques
-        # F-05: Détection de PII/DCP
-        self.logger.info("Démarrage de la détection PII/DCP (F-05).") 
-        contains_sensitive, pii_columns = detect_sensitive_data(df, column_profiles)
-        self.audit_report["sensitive_data_report"]["contains_sensitive_data"] = contains_sensitive
-        self.audit_report["sensitive_data_report"]["detected_columns"] = pii_columns
-        # F-06: Détection doublons
-        self.logger.info("Démarrage de la détection de lignes dupliquées (F-06).")
-        duplicate_count, duplicate_ratio = self._detect_duplicates(df)
-        self.audit_report["duplicate_rows_report"]["duplicate_row_count"] = duplicate_count
-        self.audit_report["duplicate_rows_report"]["duplicate_row_ratio"] = duplicate_ratio
+    def _validate_prefix(self, encoding: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Validation préalable de l'en-tête et des premières lignes (voir validate_csv_prefix)."""
+        # Seul le mode complet lit avec le moteur configuré ; les lectures par blocs passent par pandas
+        by_chunks = self.config.streaming or self.config.sampling or self.config.incremental
+        engine = "pandas" if by_chunks else self.config.load_engine
+        with self._stage("F-01 validation préalable") as stage:
+            prefix_result, prefix_errors = validate_csv_prefix(
+                self.filepath,
+                encoding,
+                self._dialect,
+                max_rows=self.config.prefix_validation_rows,
+                max_ragged_ratio=self.config.prefix_max_ragged_ratio,
+                engine=engine
+            )
+            stage["rows"] = prefix_result["rows_checked"]
+        return prefix_result, prefix_errors
 
-        # F-07/F-08 : Calcul du score de qualité
-        self.logger.info("Démarrage du calcul du score de qualité (F-07/F-08).")
-        global_score, component_scores = self._calculate_quality_score(self.audit_report, df) # df sera supprimé du paramètre
-        self.audit_report["quality_score"]["global_score"] = global_score
-        self.audit_report["quality_score"]["component_scores"] = component_scores
+    def _score_report(self) -> Dict[str, Any]:
+        """F-07/F-08 : calcule le score de qualité et retourne le rapport complété."""
+        with self._stage("F-07/F-08 score"):
+            self.logger.info("Démarrage du calcul du score de qualité (F-07/F-08).")
+            global_score, component_scores = self._calculate_quality_score(self.audit_report, None) # df sera supprimé du paramètre
+            self.audit_report["quality_score"]["global_score"] = global_score
+            self.audit_report["quality_score"]["component_scores"] = component_scores
 
         return self.audit_report
     
-    def _detect_duplicates(self, df: pd.DataFrame) -> Tuple[int, float]:
+    def run_batch_audit(self, directory_path: str, output_dir: str) -> dict:
         """
-        Détecte les lignes strictement dupliquées dans un DataFrame.
+        Lance l'audit sur tous les fichiers CSV d'un répertoire donné
+        et sauvegarde chaque rapport dans un répertoire de sortie.
 
-        Args:
-            df (pd.DataFrame): Le DataFrame analysé.
+        Chaque fichier est audité avec la configuration de ce moteur. Avec `batch_workers` > 1,
+        les fichiers sont répartis sur un pool de processus ; l'échec d'un fichier (exception,
+        ou arrêt brutal de son processus) n'interrompt pas les autres. Chaque rapport est écrit
+        de façon atomique sous un nom unique dérivé du fichier d'entrée, et le résultat est
+        ordonné comme la liste triée des fichiers, quel que soit l'ordre d'achèvement.
 
-        Returns:
-            Tuple[int, float]: Nombre de doublons et ratio des doublons.
-        """
-        if len(df) == 0:
-            return 0, 0.0
+        Avec `cache_dir`, un fichier dont le contenu a déjà été audité avec la même configuration
+        (et la même version du moteur) reçoit le rapport en cache sans être relu, et les fichiers
+        de contenu identique d'un même lot ne sont audités qu'une fois.
 
-        duplicate_count = int(df.duplicated().sum())
-        duplicate_ratio = round(float(duplicate_count) / len(df), 4)
+        Avec `batch_summary_file`, chaque résultat (statut, score, dimensions, erreurs structurelles,
+        origine du rapport) est ajouté à un journal NDJSON dès qu'il est connu.
 
-        return duplicate_count, duplicate_ratio
+        Avec `batch_recursive`, les sous-répertoires sont parcourus et les rapports rangés dans la
+        même arborescence sous `output_dir`. `batch_schedule` fixe l'ordre de lancement des audits
+        (les plus gros d'abord réduisent la durée d'un lot réparti sur plusieurs processus).
     
-    def _calculate_quality_score(
-            self,
-            audit_report: Dict[str, Any],
-            df: pd.DataFrame # Ce paramètre sera supprimé
-            ) -> Tuple[int, Dict[str, int]]:
-        """
-        Calcule le score global de qualité du fichier CSV ainsi que les scores
-        individuels pour chaque composante (Structure, complétude, validité, unicité,
-        conformité).
-        
-        Le calcul s'appuie sur les résultats de l'audit('audit_report') et les 
-        pondérations définies dans 'self.profile' .
-        
         Args:
-            audit_report (Dict[str, Any]): Résultat complet de l'audit.
-            # df (pd.DataFrame): Données du fichier analysé. # Le DataFrame n'est plus nécessaire ici
-
+            directory_path (str): Chemin du répertoire contenant les fichiers CSV.
+            output_dir (str): Répertoire où les rapports JSON seront enregistrés.
+    
         Returns:
-            Tuple[int, Dict[str, int]]: 
-                - global_score : Score global pondéré (/100) 
-                - component_scores : Détail des scores par composante
+            dict: Mapping {nom_fichier: "success" | "error message"} (chemin relatif au répertoire,
+                  séparateur "/", pour les fichiers des sous-répertoires).
         """
-        
-        component_scores = {key: 0 for key in self.profile}
-
-        # 1. Fiabilité Structurelle (F-01 + F-02)
-        structure_score = 100
-        blocking_errors = [
-            e for e in audit_report.get("structural_errors", [])
-            if e.get("is_blocking", False)
-        ]
-        if blocking_errors:
-            structure_score = 0
-        elif audit_report.get("header_info", {}).get("has_normalization_alerts", False):
-            structure_score = 90 # Déduction si seulement des alertes de normalisation
+        files = self._discover_batch_files(directory_path)
+    
+        os.makedirs(output_dir, exist_ok=True)
+        with _BatchOutput(self.config, output_dir) as output:
+            statuses = self._run_batch(files, directory_path, output_dir, output)
+        return {_batch_file_key(filepath, directory_path): statuses[filepath] for filepath in files}
 
-        component_scores["fiabilite_structurelle"] = structure_score
+    def _discover_batch_files(self, directory_path: str) -> Dict[str, int]:
+        """Fichiers d'un lot, triés par chemin, avec leur taille en octets (options `batch_*`)."""
+        if not os.path.isdir(directory_path):
+            return {}
+        files = dict(sorted(iter_csv_files(
+            directory_path,
+            recursive=self.config.batch_recursive,
+            include=self.config.batch_include,
+            exclude=self.config.batch_exclude,
+            on_error=lambda e: self.logger.warning(f"Lot : entrée ignorée ({e})."),
+        )))
+        self.logger.info(f"Lot : {len(files)} fichier(s) trouvé(s) dans {directory_path}.")
+        return files
 
-        # 2. Complétude (F-03)
-        column_profiles = audit_report.get("column_analysis", [])
-        if not column_profiles:
-            component_scores["completude"] = 0
-        else:
-            # Calcul de la moyenne des ratios de complétude par colonne
-            missing_ratios = [col.get("metrics", {}).get("missing_values_ratio", 1.0) for col in column_profiles]
-            avg_missing_ratio = sum(missing_ratios) / len(missing_ratios) if missing_ratios else 1.0
-            component_scores["completude"] = int(round(100 - (avg_missing_ratio * 100)))
+    def _run_batch(self, files: Dict[str, int], directory_path: str, output_dir: str, output: "_BatchOutput") -> Dict[str, str]:
+        """Audits de run_batch_audit (cache, pool de processus) ; retourne {chemin: statut}."""
+        # Configuration transmise telle que fournie (profil "Standard" conservé par défaut)
+        config_dict = self.config.model_dump(exclude_unset=True)
+        tasks = _batch_tasks(list(files), directory_path, output_dir, config_dict)
 
-        # 3. Validité (F-04)
-        if not column_profiles:
-            component_scores["validite"] = 0
-        else:
-            # Pour V1, score basé sur la présence de types "Inconnu"
-            has_unknown = any(col.get("data_type_detected", "").lower() == "inconnu"
-                              for col in column_profiles
+        statuses, pending_copies = {}, {}
+        cache = ReportCache(self.config.cache_dir, int(self.config.cache_max_size_mb * 1024 * 1024)) if self.config.cache_dir else None
+        if cache is not None:
+            cache_key = _report_cache_key(self.config, self.profile_used_name)
+            tasks, pending_copies = _resolve_batch_from_cache(cache, cache_key, tasks, statuses, output)
+            self.logger.info(
+                f"Cache de rapports : {len(statuses)} fichier(s) repris du cache, "
+                f"{sum(len(copies) for _, copies in pending_copies.values())} doublon(s) de contenu dans le lot."
             )
-            # Si aucun type inconnu, score 100. Sinon, 50 (logique stricte pour V1)
-            component_scores["validite"] = 50 if has_unknown else 100
-            
-            # Optionnel: Pour une validité plus fine, on pourrait vérifier la cohérence du dtype pandas
-            # avec le type sémantique détecté. Ex: si data_type_detected est "Entier" mais pandas_dtype est "object"
-            # et la colonne contient des non-numériques. Pour V1, on reste simple.
+        tasks = _schedule_batch_tasks(tasks, files, self.config.batch_schedule)
 
-        # 4. Unicité (F-06)
-        duplicate_ratio = audit_report.get("duplicate_rows_report", {}).get("duplicate_row_ratio", None)
-        if duplicate_ratio is None: # Si le rapport de doublons est absent (ne devrait pas arriver si F-06 est exécutée)
-            component_scores["unicite"] = 0
+        workers = min(self.config.batch_workers, len(tasks))
+        if workers > 1:
+            self.logger.info(f"Audit de {len(tasks)} fichiers sur {workers} processus.")
+            statuses.update(_run_batch_in_pool(tasks, workers, output))
         else:
-            unicite_score = 100 - (duplicate_ratio * 100)
-            component_scores["unicite"] = int(round(unicite_score))
+            for task in tasks:
+                statuses[task[0]], summary = _audit_file_to_report(*task)
+                output.record(task[0], task[1], statuses[task[0]], summary)
 
-        # 5. Conformité (F-05)
-        contains_pii = audit_report.get("sensitive_data_report", {}).get("contains_sensitive_data", False) # Default False si rapport absent
-        component_scores["conformite"] = 0 if contains_pii else 100 # 0 si PII détectées, 100 sinon
+        if cache is not None:
+            self._update_batch_cache(cache, cache_key, tasks, pending_copies, statuses, output)
 
-        # Calcul du score global pondéré (F-08)
-        total_weight = sum(self.profile.values())
-        if total_weight == 0: # Éviter division par zéro si les pondérations sont toutes à 0
-            global_score = 0
-        else:
-            weighted_sum = sum(
-                component_scores[dim] * self.profile[dim]
-                for dim in component_scores
-            )
-            global_score = int(round(weighted_sum / total_weight))
-        
-        return global_score, component_scores
-    
-    def run_batch_audit(self, directory_path: str, output_dir: str) -> dict:
+        return statuses
+
+    async def run_batch_audit_async(self, directory_path: str, output_dir: str, executor: Optional[Executor] = None) -> dict:
         """
-        Lance l'audit sur tous les fichiers CSV d'un répertoire donné
-        et sauvegarde chaque rapport dans un répertoire de sortie.
-    
+        Version asyncio de run_batch_audit : au plus `async_max_concurrency` audits simultanés
+        (voir run_audit_async), listage du répertoire, cache et écriture des rapports hors de la
+        boucle d'événements. L'annulation interrompt les audits en cours ; les rapports déjà
+        écrits sont conservés.
+
         Args:
             directory_path (str): Chemin du répertoire contenant les fichiers CSV.
             output_dir (str): Répertoire où les rapports JSON seront enregistrés.
-    
+            executor (Optional[Executor]): Exécuteur des audits. None : pool de `batch_workers`
+                                           processus si batch_workers > 1, sinon pool de threads.
+
         Returns:
-            dict: Mapping {nom_fichier: "success" | "error message"}.
+            dict: Mapping {nom_fichier: "success" | "error message"} (voir run_batch_audit).
         """
-        batch_results = {}
-        csv_files = get_csv_files_in_directory(directory_path)
-    
-        os.makedirs(output_dir, exist_ok=True)
-    
-        for filepath in csv_files:
-            filename = os.path.basename(filepath)
-            output_path = os.path.join(output_dir, filename.replace('.csv', '.json'))
-    
+        files = await asyncio.to_thread(self._discover_batch_files, directory_path)
+        await asyncio.to_thread(os.makedirs, output_dir, exist_ok=True)
+        output = await asyncio.to_thread(_BatchOutput, self.config, output_dir)
+        try:
+            statuses = await self._run_batch_async(files, directory_path, output_dir, executor, output)
+        finally:
+            await asyncio.to_thread(output.close)
+        return {_batch_file_key(filepath, directory_path): statuses[filepath] for filepath in files}
+
+    async def _run_batch_async(
+        self,
+        files: Dict[str, int],
+        directory_path: str,
+        output_dir: str,
+        executor: Optional[Executor],
+        output: "_BatchOutput"
+    ) -> Dict[str, str]:
+        """Audits de run_batch_audit_async ; retourne {chemin: statut}."""
+        config_dict = self.config.model_dump(exclude_unset=True)
+        tasks = await asyncio.to_thread(_batch_tasks, list(files), directory_path, output_dir, config_dict)
+
+        statuses, pending_copies = {}, {}
+        cache = None
+        if self.config.cache_dir:
+            cache = await asyncio.to_thread(ReportCache, self.config.cache_dir, int(self.config.cache_max_size_mb * 1024 * 1024))
+            cache_key = _report_cache_key(self.config, self.profile_used_name)
+            tasks, pending_copies = await asyncio.to_thread(_resolve_batch_from_cache, cache, cache_key, tasks, statuses, output)
+        tasks = _schedule_batch_tasks(tasks, files, self.config.batch_schedule)
+
+        owned_executor = None
+        if executor is None:
+            if self.config.batch_workers > 1:
+                owned_executor = ProcessPoolExecutor(
+                    max_workers=self.config.batch_workers,
+                    initializer=_pool_initializer,
+                    initargs=_pool_initializer_args()
+                )
+            else:
+                owned_executor = ThreadPoolExecutor(max_workers=self.config.async_max_concurrency)
+            executor = owned_executor
+        semaphore = asyncio.Semaphore(self.config.async_max_concurrency)
+        try:
+            results = await asyncio.gather(*(_audit_file_to_report_async(*task, executor, semaphore, output) for task in tasks))
+        finally:
+            if owned_executor is not None:
+                owned_executor.shutdown(wait=False, cancel_futures=True)
+        statuses.update(zip((task[0] for task in tasks), results))
+
+        if cache is not None:
+            await asyncio.to_thread(self._update_batch_cache, cache, cache_key, tasks, pending_copies, statuses, output)
+
+        return statuses
+
+    def _update_batch_cache(
+        self,
+        cache: ReportCache,
+        cache_key: str,
+        tasks: List[Tuple[str, str, Dict[str, Any]]],
+        pending_copies: Dict[str, Tuple[str, List[Tuple[str, str]]]],
+        statuses: Dict[str, str],
+        output: "_BatchOutput"
+    ) -> None:
+        """Fin de lot : mise en cache des rapports produits, copies des doublons de contenu, éviction."""
+        _store_batch_in_cache(cache, cache_key, pending_copies, {task[0]: task[1] for task in tasks}, statuses, output)
+        evicted = cache.evict()
+        if evicted:
+            self.logger.info(f"Cache de rapports : {evicted} rapport(s) évincé(s).")
+        cache.save()
+
+
+def _configure_audit_logger(config: Optional[VeriQualConfigV1]) -> logging.Logger:
+    """
+    Logger partagé par tous les audits du processus, écrit par un thread d'écoute (pas de
+    handler recréé par fichier). Il n'est reconfiguré que si le fichier de log demandé change ;
+    sans configuration valide (`config` None), la configuration en place est conservée. Dans un
+    processus d'un pool d'audit, il reste routé vers le processus principal (_pool_initializer).
+    """
+    global _audit_log_file
+    if config is None:
+        return configure_logging(name=_AUDIT_LOGGER, level="INFO", log_to_console=True, queued=True)
+    log_file = config.log_file if config.log_to_file else None
+    logger = configure_logging(
+        name=_AUDIT_LOGGER,
+        level="INFO",
+        log_to_console=True,
+        log_to_file=log_file is not None,
+        log_file=config.log_file,
+        force=log_file != _audit_log_file,
+        queued=True
+        )
+    _audit_log_file = log_file
+    return logger
+
+
+def _pool_initializer_args() -> Tuple[Any, ...]:
+    """Arguments de _pool_initializer : file (dépilée par le processus courant) des logs des processus d'audit."""
+    return (process_log_queue(_AUDIT_LOGGER),)
+
+
+def _pool_initializer(log_queue: Any) -> None:
+    """Initialisation d'un processus d'audit : ses logs passent par le processus principal, seul à écrire le fichier de log."""
+    route_logging_to_queue(_AUDIT_LOGGER, log_queue)
+
+
+def _report_cache_key(config: VeriQualConfigV1, profile_used_name: str) -> str:
+    """Clé de configuration du cache : options influant sur le rapport, nom du profil et version du moteur."""
+    options = config.model_dump(exclude=_CACHE_NEUTRAL_OPTIONS)
+    payload = json.dumps([ENGINE_VERSION, profile_used_name, options], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class _BatchOutput:
+    """
+    Sorties d'un lot : rapports écrits avec le sérialiseur configuré, et journal NDJSON des
+    résultats (option `batch_summary_file`) alimenté au fil de l'eau.
+    """
+
+    def __init__(self, config: VeriQualConfigV1, output_dir: str):
+        # Sérialiseur inconnu : erreur avant le premier audit
+        resolve_report_serializer(config.report_serializer)
+        self.serializer = config.report_serializer
+        self.pretty = config.report_pretty
+        self.summary = None
+        if config.batch_summary_file:
+            self.summary = BatchSummaryWriter(os.path.join(output_dir, config.batch_summary_file))
+
+    def write_copy(self, report: Dict[str, Any], filepath: str, output_path: str) -> None:
+        """Écrit le rapport d'un fichier de contenu identique, sous le nom de `filepath`."""
+        report = copy.deepcopy(report)
+        report["file_info"]["file_name"] = os.path.basename(filepath)
+        write_report(report, output_path, self.serializer, self.pretty)
+
+    def record(
+        self,
+        filepath: str,
+        output_path: str,
+        status: str,
+        summary: Optional[Dict[str, Any]],
+        source: str = "audit"
+    ) -> None:
+        """Ajoute le résultat d'un fichier au journal (source : "audit", "cache" ou "duplicate")."""
+        if self.summary is None:
+            return
+        succeeded = status == "success"
+        self.summary.write({
+            "file_name": os.path.basename(filepath),
+            "file_path": filepath,
+            "status": "success" if succeeded else "error",
+            "error": None if succeeded else status,
+            "source": source,
+            "report_path": output_path if succeeded else None,
+            **(summary if summary is not None else report_summary({})),
+        })
+
+    def close(self) -> None:
+        if self.summary is not None:
+            self.summary.close()
+
+    def __enter__(self) -> "_BatchOutput":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _resolve_batch_from_cache(
+    cache: ReportCache,
+    cache_key: str,
+    tasks: List[Tuple[str, str, Dict[str, Any]]],
+    statuses: Dict[str, str],
+    output: _BatchOutput
+) -> Tuple[List[Tuple[str, str, Dict[str, Any]]], Dict[str, Tuple[str, List[Tuple[str, str]]]]]:
+    """
+    Sert depuis le cache les fichiers dont le contenu a déjà été audité avec cette configuration,
+    et regroupe les fichiers de contenu identique pour n'en auditer qu'un par lot. Les fichiers
+    vides (0 octet) ou illisibles sont toujours audités : leur rapport cite leur chemin.
+
+    Returns:
+        Tuple:
+            - les tâches restant à auditer,
+            - {chemin audité: (empreinte, [(chemin, chemin_rapport) des fichiers identiques])}.
+    """
+    groups, remaining = {}, []
+    for task in tasks:
+        try:
+            fingerprint = cache.fingerprint(task[0]) if os.path.getsize(task[0]) > 0 else None
+        except OSError:
+            fingerprint = None
+        if fingerprint is None:
+            remaining.append(task)
+        else:
+            groups.setdefault(fingerprint, []).append(task)
+
+    pending_copies = {}
+    for fingerprint, group in groups.items():
+        report = cache.get(fingerprint, cache_key)
+        if report is not None:
+            summary = report_summary(report)
+            for filepath, output_path, _ in group:
+                try:
+                    output.write_copy(report, filepath, output_path)
+                    statuses[filepath] = "success"
+                except Exception as e:
+                    statuses[filepath] = f"Échec : {str(e)}"
+                output.record(filepath, output_path, statuses[filepath], summary, source="cache")
+        else:
+            remaining.append(group[0])
+            pending_copies[group[0][0]] = (fingerprint, [(filepath, output_path) for filepath, output_path, _ in group[1:]])
+    remaining.sort(key=lambda task: task[0])
+    return remaining, pending_copies
+
+
+def _store_batch_in_cache(
+    cache: ReportCache,
+    cache_key: str,
+    pending_copies: Dict[str, Tuple[str, List[Tuple[str, str]]]],
+    output_paths: Dict[str, str],
+    statuses: Dict[str, str],
+    output: _BatchOutput
+) -> None:
+    """Met en cache les rapports produits et les recopie pour les fichiers de contenu identique."""
+    for audited_path, (fingerprint, copies) in pending_copies.items():
+        status = statuses[audited_path]
+        report = None
+        if status == "success":
             try:
-                runner = AuditRunner(filepath=filepath)
-                report = runner.run_audit()
-    
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(report, f, ensure_ascii=False, indent=2)
-    
-                batch_results[filename] = "success"
+                with open(output_paths[audited_path], 'r', encoding='utf-8') as f:
+                    report = json.load(f)
+                cache.put(fingerprint, cache_key, report)
+            except (OSError, ValueError) as e:
+                # Cache indisponible : le rapport produit reste valable, seules ses copies en dépendent
+                if report is None:
+                    status = f"Échec : {str(e)}"
+        summary = report_summary(report) if report is not None else None
+        for filepath, output_path in copies:
+            if report is None:
+                statuses[filepath] = status
+            else:
+                try:
+                    output.write_copy(report, filepath, output_path)
+                    statuses[filepath] = "success"
+                except Exception as e:
+                    statuses[filepath] = f"Échec : {str(e)}"
+            output.record(filepath, output_path, statuses[filepath], summary, source="duplicate")
+
+
+def _batch_file_key(filepath: str, directory_path: str) -> str:
+    """Clé d'un fichier dans le résultat d'un lot : chemin relatif au répertoire, séparateur "/"."""
+    return os.path.relpath(filepath, directory_path).replace(os.sep, '/')
+
+
+def _batch_report_names(csv_files: List[str], directory_path: str) -> Dict[str, str]:
+    """
+    Chemin du rapport JSON de chaque fichier, relatif au répertoire de sortie : même
+    sous-répertoire que le fichier, nom "<nom sans extension>.json" (ex. "a.json" pour "a.csv.gz"),
+    ou "<nom complet>.json" si ce nom est déjà pris (ex. "a.csv" et "a.CSV", indiscernables sur
+    certains systèmes, ou "a.csv" et "a.csv.gz").
+    """
+    names, taken = {}, set()
+    for filepath in csv_files:
+        relative_path = os.path.relpath(filepath, directory_path)
+        name = os.path.splitext(split_compression_extension(relative_path)[0])[0] + ".json"
+        if name.lower() in taken:
+            name = relative_path + ".json"
+        taken.add(name.lower())
+        names[filepath] = name
+    return names
+
+
+def _batch_tasks(
+    csv_files: List[str],
+    directory_path: str,
+    output_dir: str,
+    config_dict: Dict[str, Any]
+) -> List[Tuple[str, str, Dict[str, Any]]]:
+    """Tâches (fichier, chemin du rapport, configuration) d'un lot ; crée les sous-répertoires de sortie."""
+    report_names = _batch_report_names(csv_files, directory_path)
+    tasks = [
+        (filepath, os.path.join(output_dir, report_names[filepath]), config_dict)
+        for filepath in csv_files
+    ]
+    for directory in {os.path.dirname(task[1]) for task in tasks}:
+        os.makedirs(directory, exist_ok=True)
+    return tasks
+
+
+def _schedule_batch_tasks(
+    tasks: List[Tuple[str, str, Dict[str, Any]]],
+    sizes: Dict[str, int],
+    schedule: str
+) -> List[Tuple[str, str, Dict[str, Any]]]:
+    """
+    Ordonne les tâches d'un lot (triées par chemin) selon `batch_schedule`. La taille sert
+    d'estimation de la durée d'audit : lancer les plus gros fichiers d'abord évite qu'un gros
+    fichier, lancé en dernier, n'occupe seul le pool en fin de lot ; lancer les plus petits
+    d'abord produit les premiers rapports au plus tôt. Le tri est stable (égalités par chemin).
+    """
+    if schedule == "largest_first":
+        return sorted(tasks, key=lambda task: -sizes.get(task[0], 0))
+    if schedule == "smallest_first":
+        return sorted(tasks, key=lambda task: sizes.get(task[0], 0))
+    return tasks
+
+
+def _audit_file_to_report(filepath: str, output_path: str, config_dict: Dict[str, Any]) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    Audite un fichier et enregistre son rapport JSON (dans le processus courant ou un processus du pool).
+
+    Returns:
+        Tuple[str, Optional[Dict[str, Any]]]: "success" ou le message d'échec, et le résumé du
+                                              rapport pour le journal du lot (None en cas d'échec).
+    """
+    try:
+        runner = AuditRunner(filepath=filepath, config_dict=config_dict)
+        report = runner.run_audit()
+        write_report(report, output_path, runner.config.report_serializer, runner.config.report_pretty)
+
+        return "success", report_summary(report)
+    except Exception as e:
+        return f"Échec : {str(e)}", None
+
+
+def _run_audit_report(filepath: str, config_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Rapport d'audit d'un fichier, calculé dans un processus de l'exécuteur de run_audit_async."""
+    return AuditRunner(filepath=filepath, config_dict=config_dict).run_audit()
+
+
+async def _audit_file_to_report_async(
+    filepath: str,
+    output_path: str,
+    config_dict: Dict[str, Any],
+    executor: Optional[Executor],
+    semaphore: asyncio.Semaphore,
+    output: _BatchOutput
+) -> str:
+    """
+    Version asyncio de _audit_file_to_report (voir run_batch_audit_async).
+
+    Returns:
+        str: "success", ou le message d'échec.
+    """
+    summary = None
+    try:
+        runner = AuditRunner(filepath=filepath, config_dict=config_dict)
+        report = await runner.run_audit_async(executor, semaphore)
+        await asyncio.to_thread(write_report, report, output_path, output.serializer, output.pretty)
+        status, summary = "success", report_summary(report)
+    except Exception as e:
+        status = f"Échec : {str(e)}"
+    await asyncio.to_thread(output.record, filepath, output_path, status, summary)
+    return status
+
+
+def _run_batch_in_pool(tasks: List[Tuple[str, str, Dict[str, Any]]], workers: int, output: _BatchOutput) -> Dict[str, str]:
+    """
+    Exécute les audits sur un pool de `workers` processus ; chaque résultat est ajouté au
+    journal du lot dès la fin de son audit.
+
+    Returns:
+        Dict[str, str]: Mapping {chemin_fichier: "success" | "error message"}.
+    """
+    statuses, interrupted = {}, []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_pool_initializer, initargs=_pool_initializer_args()) as executor:
+        futures = {executor.submit(_audit_file_to_report, *task): task for task in tasks}
+        for future in as_completed(futures):
+            task = futures[future]
+            summary = None
+            try:
+                statuses[task[0]], summary = future.result()
+            except BrokenProcessPool:
+                interrupted.append(task)
+                continue
             except Exception as e:
-                batch_results[filename] = f"Échec : {str(e)}"
-    
-        return batch_results
+                statuses[task[0]] = f"Échec : {str(e)}"
+            output.record(task[0], task[1], statuses[task[0]], summary)
+    if interrupted:
+        # Un processus a été tué (mémoire, signal) : tout le pool est alors inutilisable. Les
+        # fichiers non terminés sont relancés un processus par fichier, pour isoler le fautif.
+        order = {task[0]: position for position, task in enumerate(tasks)}
+        interrupted.sort(key=lambda task: order[task[0]])
+        statuses.update(_run_batch_isolated(interrupted, workers, output))
+    return statuses
 
+
+def _audit_file_in_child(connection: Any, log_queue: Any, filepath: str, output_path: str, config_dict: Dict[str, Any]) -> None:
+    _pool_initializer(log_queue)
+    connection.send(_audit_file_to_report(filepath, output_path, config_dict))
+    connection.close()
+
+
+def _run_batch_isolated(tasks: List[Tuple[str, str, Dict[str, Any]]], workers: int, output: _BatchOutput) -> Dict[str, str]:
+    """
+    Exécute chaque audit dans un processus dédié (au plus `workers` simultanés) : l'arrêt
+    brutal d'un processus n'affecte que son fichier.
+
+    Returns:
+        Dict[str, str]: Mapping {chemin_fichier: "success" | "error message"}.
+    """
+    context = multiprocessing.get_context()
+    log_queue = process_log_queue(_AUDIT_LOGGER)
+    statuses, pending, running = {}, list(tasks), {}
+    while pending or running:
+        while pending and len(running) < workers:
+            filepath, output_path, config_dict = pending.pop(0)
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(target=_audit_file_in_child, args=(sender, log_queue, filepath, output_path, config_dict))
+            process.start()
+            sender.close()
+            running[receiver] = (process, filepath, output_path)
+        for receiver in multiprocessing.connection.wait(list(running)):
+            process, filepath, output_path = running.pop(receiver)
+            summary = None
+            try:
+                statuses[filepath], summary = receiver.recv()
+            except EOFError:
+                process.join()
+                statuses[filepath] = f"Échec : le processus d'audit s'est arrêté brutalement (code {process.exitcode})."
+            receiver.close()
+            process.join()
+            output.record(filepath, output_path, statuses[filepath], summary)
+    return statuses
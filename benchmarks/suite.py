@@ -0,0 +1,330 @@
+# VeriQual/benchmarks/suite.py
+"""
+Suite de benchmarks de VeriQual-Core : pipeline complet (run_audit) et fonctions de
+tools/common/files.py, tools/common/profiling.py et tools/common/report_writer.py, sur un
+fichier synthétique déterministe.
+
+Chaque benchmark est exécuté `repeat` fois (meilleur temps retenu), puis une dernière fois sous
+tracemalloc pour mesurer son pic d'allocations (allocations Python et NumPy ; la mémoire
+allouée par Arrow n'est pas suivie). Les résultats (secondes, lignes/s, Mo/s, pic de
+mémoire) sont comparés à une référence enregistrée : les temps dépendent de la machine, la
+référence doit donc être produite sur la machine qui compare (--save-baseline).
+
+Usage :
+    python -m benchmarks.suite                      # mesure et comparaison à benchmarks/baseline.json
+    python -m benchmarks.suite --rows 200000 --filter profiling.
+    python -m benchmarks.suite --save-baseline      # enregistre les mesures comme nouvelle référence
+"""
+
+import os
+import sys
+import gzip
+import json
+import time
+import logging
+import argparse
+import platform
+import shutil
+import tempfile
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from benchmarks.synthetic import generate_csv
+from VeriQual_Core.audit_runner import AuditRunner, ENGINE_VERSION
+from tools.common import files, profiling, report_writer
+from tools.common.sketches import HeavyHittersSketch, KLLSketch
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+# Écart de temps toléré avant de signaler une régression (25 %)
+DEFAULT_TOLERANCE = 0.25
+# En deçà de cette durée, l'écart mesuré tient surtout du bruit : le benchmark n'est pas comparé
+MIN_COMPARABLE_SECONDS = 0.005
+# Paramètres de génération comparés avant d'utiliser une référence
+_GENERATION_KEYS = ("rows", "columns", "type_mix", "encoding", "separator", "null_rate", "duplicate_rate", "pii_density", "seed")
+
+# Un benchmark : nom, fonction préparée, nombre de lignes traitées (None : sans objet),
+# nombre d'octets lus (None : sans objet)
+Benchmark = Tuple[str, Callable[[], Any], Optional[int], Optional[int]]
+
+
+def _first_column(df: pd.DataFrame, col_type: str) -> Optional[str]:
+    return next((name for name in df.columns if name.startswith(col_type + "_")), None)
+
+
+def build_benchmarks(filepath: str, spec: Dict[str, Any]) -> List[Benchmark]:
+    """
+    Prépare les benchmarks sur le fichier `filepath` généré avec `spec` (voir generate_csv).
+    Les données nécessaires (DataFrame chargé, profils, accumulateurs...) sont calculées ici,
+    hors des mesures.
+    """
+    encoding, separator, rows, size = spec["encoding"], spec["separator"], spec["rows"], spec["size_bytes"]
+    directory = os.path.dirname(filepath)
+    df = pd.read_csv(filepath, sep=separator, encoding=encoding)
+    profiles = profiling.profile_dataframe_columns(df)
+    profiles = profiling.infer_semantic_types(profiles, df)
+    date_column = df[_first_column(df, "date")] if _first_column(df, "date") else df.iloc[:, 0].astype(str)
+    pii_column = df[_first_column(df, "pii")] if _first_column(df, "pii") else df.iloc[:, 0].astype(str)
+    date_counts = date_column.value_counts(dropna=True, sort=False)
+    chunk_size = max(1, rows // 10)
+    dialect, _ = files.detect_csv_dialect(filepath, encoding)
+
+    def accumulate() -> Dict[str, profiling.ColumnProfileAccumulator]:
+        accumulators = None
+        for chunk in files.iter_dataframe_chunks(filepath, encoding, separator, chunk_size):
+            accumulators = profiling.accumulate_dataframe_columns(chunk, accumulators)
+        return accumulators
+
+    accumulators = accumulate()
+    accumulated_profiles = profiling.infer_accumulated_semantic_types(profiling.profile_accumulated_columns(accumulators), accumulators)
+    numeric_values = df.select_dtypes("number").iloc[:, 0].dropna().to_numpy() if not df.select_dtypes("number").empty else []
+    heavy_hitters = HeavyHittersSketch(64)
+    heavy_hitters.update(pii_column)
+    quantiles = KLLSketch(200)
+    quantiles.update(numeric_values)
+    report = AuditRunner(filepath).run_audit()
+    # Même fichier compressé (gzip), audité avec décompression à la volée
+    gzip_filepath = filepath + ".gz"
+    with open(filepath, 'rb') as source, gzip.open(gzip_filepath, 'wb') as target:
+        shutil.copyfileobj(source, target)
+
+    def audit(config: Dict[str, Any], path: str = filepath) -> Callable[[], Any]:
+        return lambda: AuditRunner(path, config).run_audit()
+
+    benchmarks: List[Benchmark] = [
+        # Pipeline complet
+        ("run_audit[memoire]", audit({}), rows, size),
+        ("run_audit[streaming]", audit({"streaming": True, "chunk_size": chunk_size}), rows, size),
+        ("run_audit[echantillonnage]", audit({"sampling": True, "sample_size": max(1, rows // 10)}), rows, size),
+        ("run_audit[memoire_optimisee]", audit({"memory_optimized_load": True}), rows, size),
+        ("run_audit[gzip]", audit({}, gzip_filepath), rows, size),
+        # tools/common/files.py
+        ("files.check_file_exists", lambda: files.check_file_exists(filepath), None, None),
+        ("files.check_file_readable", lambda: files.check_file_readable(filepath), None, None),
+        ("files.check_file_extension", lambda: files.check_file_extension(filepath), None, None),
+        ("files.check_file_not_empty", lambda: files.check_file_not_empty(filepath), None, None),
+        ("files.detect_file_encoding", lambda: files.detect_file_encoding(filepath), rows, size),
+        ("files.check_file_empty_content", lambda: files.check_file_empty_content(filepath, encoding), rows, size),
+        ("files.scan_file_structure", lambda: files.scan_file_structure(filepath), rows, size),
+        ("files.scan_file_structure[gzip]", lambda: files.scan_file_structure(gzip_filepath), rows, size),
+        ("files.detect_csv_separator", lambda: files.detect_csv_separator(filepath, encoding), None, None),
+        ("files.detect_csv_dialect", lambda: files.detect_csv_dialect(filepath, encoding), None, None),
+        ("files.validate_csv_prefix", lambda: files.validate_csv_prefix(filepath, encoding, dialect), None, None),
+        ("files.load_dataframe_robustly[pandas]", lambda: files.load_dataframe_robustly(filepath, encoding, separator), rows, size),
+        ("files.load_dataframe_memory_optimized", lambda: files.load_dataframe_memory_optimized(filepath, encoding, separator), rows, size),
+        ("files.infer_compact_dtypes", lambda: files.infer_compact_dtypes(filepath, encoding, separator), None, None),
+        ("files.downcast_numeric_columns", lambda: files.downcast_numeric_columns(df.copy()), rows, None),
+        ("files.iter_dataframe_chunks", lambda: sum(len(chunk) for chunk in files.iter_dataframe_chunks(filepath, encoding, separator, chunk_size)), rows, size),
+        ("files.get_csv_files_in_directory", lambda: files.get_csv_files_in_directory(directory), None, None),
+        ("files.iter_csv_files[recursif]", lambda: sum(1 for _ in files.iter_csv_files(directory)), None, None),
+        ("files.describe_dataframe_load_error", lambda: files.describe_dataframe_load_error(UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid")), None, None),
+        # tools/common/profiling.py
+        ("profiling.profile_dataframe_columns", lambda: profiling.profile_dataframe_columns(df), rows, None),
+        ("profiling.profile_dataframe_columns[sketches]", lambda: profiling.profile_dataframe_columns(
+            df, approximate_distinct=True, quantile_sketch=True, heavy_hitters=True), rows, None),
+        ("profiling.infer_semantic_types", lambda: profiling.infer_semantic_types([dict(p) for p in profiles], df), rows, None),
+        ("profiling.detect_sensitive_data", lambda: profiling.detect_sensitive_data(df, profiles), rows, None),
+        ("profiling.scan_pii_values[python]", lambda: profiling.scan_pii_values(pii_column), rows, None),
+        ("profiling.candidate_date_formats", lambda: profiling.candidate_date_formats(date_column), rows, None),
+        ("profiling.count_date_matches", lambda: profiling.count_date_matches(date_counts, profiling.COMMON_DATE_FORMATS[0]), rows, None),
+        ("profiling.map_columns", lambda: profiling.map_columns(len, [(df[name],) for name in df.columns]), None, None),
+        ("profiling.accumulate_dataframe_columns", accumulate, rows, size),
+        # Finalisation à partir des accumulateurs : indépendante du nombre de lignes
+        ("profiling.profile_accumulated_columns", lambda: profiling.profile_accumulated_columns(accumulators), None, None),
+        ("profiling.infer_accumulated_semantic_types", lambda: profiling.infer_accumulated_semantic_types(
+            [dict(p) for p in accumulated_profiles], accumulators), None, None),
+        ("profiling.detect_accumulated_sensitive_data", lambda: profiling.detect_accumulated_sensitive_data(accumulators, accumulated_profiles), None, None),
+        ("profiling.heavy_hitter_metrics", lambda: profiling.heavy_hitter_metrics(heavy_hitters), None, None),
+        ("profiling.sketch_quantile_metrics", lambda: profiling.sketch_quantile_metrics(quantiles), None, None),
+        # tools/common/report_writer.py : sérialisation d'un rapport (indépendante du nombre de lignes)
+        ("report_writer.serialize[json,pretty]", lambda: report_writer.resolve_report_serializer("json")(report, True), None, None),
+        ("report_writer.serialize[json,compact]", lambda: report_writer.resolve_report_serializer("json")(report, False), None, None),
+    ]
+    # Moteurs optionnels : mesurés seulement si pyarrow est installé
+    if files.pa_csv is not None:
+        benchmarks.append(("files.load_dataframe_robustly[arrow]", lambda: files.load_dataframe_robustly(filepath, encoding, separator, engine="arrow"), rows, size))
+    if profiling.pc is not None:
+        benchmarks.append(("profiling.scan_pii_values[pyarrow]", lambda: profiling.scan_pii_values(pii_column, engine="pyarrow"), rows, None))
+    if report_writer.orjson is not None:
+        benchmarks.append(("report_writer.serialize[orjson,compact]", lambda: report_writer.resolve_report_serializer("orjson")(report, False), None, None))
+    return benchmarks
+
+
+def measure(func: Callable[[], Any], repeat: int = 3) -> Tuple[float, int]:
+    """
+    Meilleur temps (secondes) sur `repeat` exécutions, et pic d'allocations (octets) d'une
+    exécution supplémentaire sous tracemalloc (mesuré à part : tracemalloc ralentit l'exécution).
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def run_benchmarks(
+    spec: Dict[str, Any],
+    repeat: int = 3,
+    name_filter: Optional[str] = None,
+    workdir: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Génère le fichier synthétique décrit par `spec` (paramètres de generate_csv) et exécute les benchmarks.
+
+    Args:
+        spec (Dict[str, Any]): Paramètres de génération.
+        repeat (int): Nombre d'exécutions chronométrées par benchmark.
+        name_filter (Optional[str]): Sous-chaîne du nom des benchmarks à exécuter.
+        workdir (Optional[str]): Répertoire du fichier généré (temporaire si None).
+
+    Returns:
+        Dict[str, Any]: environment, generation (paramètres et taille du fichier) et results
+                        ({nom: seconds, rows_per_s, mb_per_s, peak_memory_bytes}).
+    """
+    # Les journaux du moteur ne font pas partie de la mesure
+    logging.getLogger("veriqual.audit").disabled = True
+    with tempfile.TemporaryDirectory(prefix="veriqual_bench_", dir=workdir) as directory:
+        filepath = os.path.join(directory, "synthetic.csv")
+        generation = generate_csv(filepath, **spec)
+        results = {}
+        for name, func, rows, size in build_benchmarks(filepath, generation):
+            if name_filter and name_filter not in name:
+                continue
+            seconds, peak = measure(func, repeat)
+            results[name] = {
+                "seconds": round(seconds, 6),
+                "rows_per_s": round(rows / seconds, 1) if rows and seconds > 0 else None,
+                "mb_per_s": round(size / 1e6 / seconds, 2) if size and seconds > 0 else None,
+                "peak_memory_bytes": peak,
+            }
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "engine_version": ENGINE_VERSION,
+        },
+        "generation": generation,
+        "results": results,
+    }
+
+
+def compare_to_baseline(run: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = DEFAULT_TOLERANCE) -> Dict[str, Dict[str, Any]]:
+    """
+    Compare les temps d'une exécution à ceux d'une référence produite avec les mêmes paramètres
+    de génération. Les benchmarks de moins de MIN_COMPARABLE_SECONDS ne sont pas comparés.
+
+    Un benchmark absent de la référence est signalé ("missing", sans ratio) plutôt qu'ignoré.
+    Si la référence a été produite par une autre version du moteur, les benchmarks du pipeline
+    complet (run_audit) ne sont pas jugés ("stale") : leurs étapes ont pu changer.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: {nom: ratio (temps / temps de référence, None si absent de la
+                                   référence) et status ("regression", "improvement", "ok",
+                                   "missing" ou "stale")}.
+
+    Raises:
+        ValueError: Si la référence a été produite avec d'autres paramètres de génération.
+    """
+    mismatched = [key for key in _GENERATION_KEYS if run["generation"].get(key) != baseline["generation"].get(key)]
+    if mismatched:
+        raise ValueError(f"Référence produite avec d'autres paramètres de génération : {', '.join(mismatched)}.")
+    stale_engine = run.get("environment", {}).get("engine_version") != baseline.get("environment", {}).get("engine_version")
+    comparison = {}
+    for name, result in run["results"].items():
+        reference = baseline["results"].get(name)
+        if not reference:
+            comparison[name] = {"ratio": None, "status": "missing"}
+            continue
+        if max(result["seconds"], reference["seconds"]) < MIN_COMPARABLE_SECONDS:
+            continue
+        ratio = result["seconds"] / reference["seconds"]
+        if stale_engine and name.startswith("run_audit"):
+            status = "stale"
+        else:
+            status = "regression" if ratio > 1 + tolerance else "improvement" if ratio < 1 / (1 + tolerance) else "ok"
+        comparison[name] = {"ratio": round(ratio, 3), "status": status}
+    return comparison
+
+
+def format_results(run: Dict[str, Any], comparison: Optional[Dict[str, Dict[str, Any]]] = None) -> str:
+    """Tableau texte des résultats (et de la comparaison à la référence)."""
+    lines = [f"{'benchmark':<48} {'secondes':>10} {'lignes/s':>13} {'Mo/s':>8} {'pic mém. (Mo)':>14} {'vs réf.':>16}"]
+    for name, result in run["results"].items():
+        versus = ""
+        if comparison and name in comparison:
+            ratio = comparison[name]["ratio"]
+            versus = comparison[name]["status"] if ratio is None else f"x{ratio:.2f} {comparison[name]['status']}"
+        rows_per_s = f"{result['rows_per_s']:,.0f}" if result["rows_per_s"] else "-"
+        mb_per_s = f"{result['mb_per_s']:.1f}" if result["mb_per_s"] else "-"
+        lines.append(
+            f"{name:<48} {result['seconds']:>10.4f} {rows_per_s:>13} {mb_per_s:>8} "
+            f"{result['peak_memory_bytes'] / 1e6:>14.1f} {versus:>16}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks de VeriQual-Core sur un fichier CSV synthétique.")
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--columns", type=int, default=9)
+    parser.add_argument("--type-mix", type=json.loads, default=None, help='ex. \'{"int": 1, "text": 3, "pii": 1}\'')
+    parser.add_argument("--encoding", default="utf-8")
+    parser.add_argument("--separator", default=",")
+    parser.add_argument("--null-rate", type=float, default=0.05)
+    parser.add_argument("--duplicate-rate", type=float, default=0.01)
+    parser.add_argument("--pii-density", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--filter", default=None, help="sous-chaîne du nom des benchmarks à exécuter")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="fichier de référence")
+    parser.add_argument("--save-baseline", action="store_true", help="enregistre les mesures comme référence")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--output", default=None, help="fichier JSON des résultats")
+    args = parser.parse_args(argv)
+
+    spec = {
+        "rows": args.rows, "columns": args.columns, "type_mix": args.type_mix, "encoding": args.encoding,
+        "separator": args.separator, "null_rate": args.null_rate, "duplicate_rate": args.duplicate_rate,
+        "pii_density": args.pii_density, "seed": args.seed,
+    }
+    run = run_benchmarks(spec, args.repeat, args.filter)
+
+    comparison, exit_code = None, 0
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(run, f, ensure_ascii=False, indent=2)
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        try:
+            comparison = compare_to_baseline(run, baseline, args.tolerance)
+        except ValueError as e:
+            print(f"Comparaison impossible : {e}", file=sys.stderr)
+    print(format_results(run, comparison))
+    if comparison:
+        regressions = [name for name, result in comparison.items() if result["status"] == "regression"]
+        if regressions:
+            print(f"\nRégressions (> +{args.tolerance:.0%}) : {', '.join(regressions)}", file=sys.stderr)
+            exit_code = 1
+        outdated = [name for name, result in comparison.items() if result["status"] in ("missing", "stale")]
+        if outdated:
+            print(f"\nAbsents de la référence ou d'une autre version du moteur (--save-baseline) : {', '.join(outdated)}",
+                  file=sys.stderr)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({**run, "comparison": comparison}, f, ensure_ascii=False, indent=2)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+# VeriQual/benchmarks/synthetic.py
+"""
+Générateur déterministe de fichiers CSV synthétiques pour les benchmarks.
+
+Un même jeu de paramètres (dont `seed`) produit toujours le même fichier, octet pour octet :
+les mesures de deux exécutions, ou de deux versions du moteur, portent sur des données identiques.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional
+
+# Types de colonnes générés
+COLUMN_TYPES = ("int", "float", "text", "date", "bool", "pii")
+
+# Répartition par défaut des types de colonnes (poids relatifs)
+DEFAULT_TYPE_MIX = {"int": 2, "float": 2, "text": 2, "date": 1, "bool": 1, "pii": 1}
+
+_WORDS = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel", "india", "juliett",
+          "kilo", "lima", "mike", "novembre", "oscar", "papa", "québec", "romeo", "sierra", "tango"]
+
+
+def column_types_for(columns: int, type_mix: Optional[Dict[str, float]] = None) -> List[str]:
+    """
+    Types des `columns` colonnes, répartis selon les poids de `type_mix` (méthode du plus fort
+    reste : la répartition est exacte à une colonne près et ne dépend d'aucun tirage).
+    """
+    type_mix = type_mix or DEFAULT_TYPE_MIX
+    unknown = set(type_mix) - set(COLUMN_TYPES)
+    if unknown:
+        raise ValueError(f"Types de colonnes inconnus : {sorted(unknown)} (attendu : {', '.join(COLUMN_TYPES)}).")
+    weights = {col_type: float(weight) for col_type, weight in type_mix.items() if weight > 0}
+    if not weights:
+        raise ValueError("La répartition des types de colonnes doit comporter au moins un poids positif.")
+    total = sum(weights.values())
+    quotas = {col_type: columns * weight / total for col_type, weight in weights.items()}
+    counts = {col_type: int(quota) for col_type, quota in quotas.items()}
+    by_remainder = sorted(quotas, key=lambda col_type: quotas[col_type] - counts[col_type], reverse=True)
+    for col_type in by_remainder[:columns - sum(counts.values())]:
+        counts[col_type] += 1
+    # Types entrelacés (int, float, text, ..., int, float, ...) plutôt que regroupés
+    result, remaining = [], dict(counts)
+    while len(result) < columns:
+        for col_type in COLUMN_TYPES:
+            if remaining.get(col_type, 0) > 0:
+                result.append(col_type)
+                remaining[col_type] -= 1
+    return result
+
+
+def _generate_column(col_type: str, rows: int, pii_density: float, rng: np.random.Generator) -> pd.Series:
+    if col_type == "int":
+        return pd.Series(rng.integers(0, 1_000_000, rows))
+    if col_type == "float":
+        return pd.Series(np.round(rng.normal(100.0, 25.0, rows), 3))
+    if col_type == "text":
+        words = np.array(_WORDS, dtype=object)
+        return pd.Series(words[rng.integers(0, len(words), rows)] + "_" + rng.integers(0, 500, rows).astype(str))
+    if col_type == "date":
+        days = rng.integers(0, 3650, rows)
+        return pd.Series((pd.Timestamp("2015-01-01") + pd.to_timedelta(days, unit="D")).strftime("%Y-%m-%d"))
+    if col_type == "bool":
+        return pd.Series(np.where(rng.random(rows) < 0.5, "True", "False"))
+    # Colonne texte dont une fraction `pii_density` des valeurs sont des e-mails ou des téléphones
+    identifiers = rng.integers(0, 100_000, rows).astype(str)
+    values = np.char.add("client_", identifiers).astype(object)
+    is_pii = rng.random(rows) < pii_density
+    is_email = rng.random(rows) < 0.5
+    emails = np.char.add(np.char.add("client", identifiers), "@exemple.fr").astype(object)
+    phones = np.char.add("06", np.char.zfill(identifiers, 8)).astype(object)
+    values[is_pii & is_email] = emails[is_pii & is_email]
+    values[is_pii & ~is_email] = phones[is_pii & ~is_email]
+    return pd.Series(values)
+
+
+def generate_dataframe(
+    rows: int = 10_000,
+    columns: int = 9,
+    type_mix: Optional[Dict[str, float]] = None,
+    null_rate: float = 0.05,
+    duplicate_rate: float = 0.01,
+    pii_density: float = 0.1,
+    seed: int = 0
+) -> pd.DataFrame:
+    """
+    Génère un DataFrame synthétique (valeurs déjà mises en forme pour l'écriture CSV).
+
+    Args:
+        rows (int): Nombre de lignes.
+        columns (int): Nombre de colonnes.
+        type_mix (Optional[Dict[str, float]]): Poids relatifs des types de colonnes (voir COLUMN_TYPES).
+        null_rate (float): Proportion de valeurs manquantes (hors première colonne).
+        duplicate_rate (float): Proportion de lignes copiées d'une ligne précédente.
+        pii_density (float): Proportion de valeurs PII dans les colonnes "pii".
+        seed (int): Graine du générateur.
+
+    Returns:
+        pd.DataFrame: Les données, colonnes nommées "<type>_<rang>".
+    """
+    for name, rate in (("null_rate", null_rate), ("duplicate_rate", duplicate_rate), ("pii_density", pii_density)):
+        if not 0 <= rate <= 1:
+            raise ValueError(f"{name} doit être compris entre 0 et 1 : {rate}")
+    rng = np.random.default_rng(seed)
+    data = {}
+    for position, col_type in enumerate(column_types_for(columns, type_mix)):
+        values = _generate_column(col_type, rows, pii_density, rng).astype(object)
+        # La première colonne reste complète : aucune ligne n'est entièrement vide
+        if position > 0 and null_rate > 0:
+            values[rng.random(rows) < null_rate] = None
+        data[f"{col_type}_{position}"] = values
+    df = pd.DataFrame(data)
+    duplicates = np.flatnonzero(rng.random(rows) < duplicate_rate)
+    duplicates = duplicates[duplicates > 0]
+    if len(duplicates):
+        sources = (rng.random(len(duplicates)) * duplicates).astype(np.int64)
+        df.iloc[duplicates] = df.iloc[sources].to_numpy()
+    return df
+
+
+def generate_csv(
+    filepath: str,
+    rows: int = 10_000,
+    columns: int = 9,
+    type_mix: Optional[Dict[str, float]] = None,
+    encoding: str = "utf-8",
+    separator: str = ",",
+    null_rate: float = 0.05,
+    duplicate_rate: float = 0.01,
+    pii_density: float = 0.1,
+    seed: int = 0
+) -> Dict[str, Any]:
+    """
+    Écrit un fichier CSV synthétique (voir generate_dataframe pour les paramètres de contenu).
+
+    Args:
+        filepath (str): Chemin du fichier à écrire.
+        encoding (str): Encodage du fichier.
+        separator (str): Séparateur de colonnes.
+
+    Returns:
+        Dict[str, Any]: Paramètres de génération, avec le nombre de lignes et la taille du fichier.
+    """
+    df = generate_dataframe(rows, columns, type_mix, null_rate, duplicate_rate, pii_density, seed)
+    df.to_csv(filepath, sep=separator, encoding=encoding, index=False, lineterminator="\n")
+    with open(filepath, 'rb') as f:
+        size_bytes = f.seek(0, 2)
+    return {
+        "rows": rows,
+        "columns": columns,
+        "type_mix": type_mix or DEFAULT_TYPE_MIX,
+        "encoding": encoding,
+        "separator": separator,
+        "null_rate": null_rate,
+        "duplicate_rate": duplicate_rate,
+        "pii_density": pii_density,
+        "seed": seed,
+        "size_bytes": size_bytes,
+    }
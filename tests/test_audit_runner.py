@@ -3,9 +3,23 @@ import pytest
 from unittest.mock import patch
 import json
 import pandas as pd
+import numpy as np
 import tempfile
-
-from VeriQual_Core.audit_runner import AuditRunner
+import random
+import importlib.util
+import pickle
+import time
+import asyncio
+import gzip
+import bz2
+import lzma
+import multiprocessing
+
+from VeriQual_Core.audit_runner import AuditRunner, AuditCancelledError
+from tools.common.report_cache import ReportCache
+from tools.common.sketches import KLLSketch, KLL_MIN_CAPACITY
+from tools.common.logs import process_log_queue, route_logging_to_queue
+from tools.common.files import scan_file_structure
 
 def test_run_audit_file_not_found():
     runner = AuditRunner(filepath="fichier_inexistant.csv")
@@ -93,26 +107,23 @@ def test_non_rectangular_structure(tmp_path):
     test_file = tmp_path / "non_rect.csv"
     test_file.write_text(file_content, encoding="utf-8")
 
-    # Mock detect_csv_separator pour qu'il retourne un séparateur valide
-    with patch("VeriQual_Core.audit_runner.detect_csv_separator") as mock_detect_separator:
-        mock_detect_separator.return_value = (",", None) # Force le séparateur à être la virgule
-        with patch("VeriQual_Core.audit_runner.load_dataframe_robustly") as mock_load_df:
-            # Simuler un échec de parsing (structure non rectangulaire)
-            mocked_message = "Message de test pour structure non rectangulaire."
-            mock_load_df.return_value = (
-                None,
-                None,
-                mocked_message,
-                "non_rectangular_structure"
-            )
-
-            runner = AuditRunner(str(test_file))
-            report = runner.run_audit()
-            print(json.dumps(report, indent=2))
-
-            assert report["structural_errors"][0]["error_code"] == "non_rectangular_structure"
-            assert report["structural_errors"][0]["is_blocking"] is True
-            assert report["structural_errors"][0]["message"] == mocked_message
+    with patch("VeriQual_Core.audit_runner.load_dataframe_robustly") as mock_load_df:
+        # Simuler un échec de parsing (structure non rectangulaire)
+        mocked_message = "Message de test pour structure non rectangulaire."
+        mock_load_df.return_value = (
+            None,
+            None,
+            mocked_message,
+            "non_rectangular_structure"
+        )
+
+        runner = AuditRunner(str(test_file))
+        report = runner.run_audit()
+        print(json.dumps(report, indent=2))
+
+        assert report["structural_errors"][0]["error_code"] == "non_rectangular_structure"
+        assert report["structural_errors"][0]["is_blocking"] is True
+        assert report["structural_errors"][0]["message"] == mocked_message
 
 def test_file_empty_after_header(tmp_path):
     file_content = "col1,col2\n" # En-tête mais pas de données
@@ -134,26 +145,23 @@ def test_unicode_decode_error_in_load(tmp_path):
     corrupt_file = tmp_path / "corrupt_load.csv"
     corrupt_file.write_bytes(b"col1,col2\nline1,data1\n\xff\xfe\nline3,data3") # Octets invalides après la 2ème ligne
 
-    # Mock detect_csv_separator pour qu'il retourne un séparateur valide
-    with patch("VeriQual_Core.audit_runner.detect_csv_separator") as mock_detect_separator:
-        mock_detect_separator.return_value = (",", None) # Force le séparateur à être la virgule
-        with patch("VeriQual_Core.audit_runner.load_dataframe_robustly") as mock_load_df:
-            # Simuler un échec de décodage Unicode
-            mocked_message = "Message de test pour erreur de décodage Unicode."
-            mock_load_df.return_value = (
-                None,
-                None,
-                mocked_message,
-                "unicode_decode_error_in_load"
-            )
-
-            runner = AuditRunner(str(corrupt_file))
-            report = runner.run_audit()
-            print(json.dumps(report, indent=2))
-
-            assert report["structural_errors"][0]["error_code"] == "unicode_decode_error_in_load"
-            assert report["structural_errors"][0]["is_blocking"] is True
-            assert report["structural_errors"][0]["message"] == mocked_message
+    with patch("VeriQual_Core.audit_runner.load_dataframe_robustly") as mock_load_df:
+        # Simuler un échec de décodage Unicode
+        mocked_message = "Message de test pour erreur de décodage Unicode."
+        mock_load_df.return_value = (
+            None,
+            None,
+            mocked_message,
+            "unicode_decode_error_in_load"
+        )
+
+        runner = AuditRunner(str(corrupt_file))
+        report = runner.run_audit()
+        print(json.dumps(report, indent=2))
+
+        assert report["structural_errors"][0]["error_code"] == "unicode_decode_error_in_load"
+        assert report["structural_errors"][0]["is_blocking"] is True
+        assert report["structural_errors"][0]["message"] == mocked_message
 
 def test_normalize_headers_with_modifications(tmp_path):
     file_content = " ID Client \xa0; Nom\n1;Alice" # En-têtes avec espaces et insécables
@@ -241,6 +249,32 @@ def test_detect_sensitive_data(tmp_path):
     address_col = next((col for col in detected_columns if col["column_name"] == "Address"), None)
     assert address_col is None or not address_col["pii_types"] # S'assurer qu'il n'a pas de PII détecté
 
+def test_date_inference_threshold(tmp_path):
+    # Dates au format JJ/MM/AAAA dans 60 % (Date) puis 40 % (Texte) des lignes
+    rows = []
+    for i in range(500):
+        day = f"{i % 28 + 1:02d}/{i % 12 + 1:02d}/2023"
+        rows.append(f"{day if i % 5 < 3 else 'inconnu'},{day if i % 5 < 2 else 'inconnu'}")
+    test_file = tmp_path / "dates.csv"
+    test_file.write_text("majorite,minorite\n" + "\n".join(rows) + "\n", encoding="utf-8")
+
+    for streaming in (False, True):
+        report = AuditRunner(str(test_file), {"streaming": streaming, "chunk_size": 64}).run_audit()
+        detected = {col["column_name"]: col["data_type_detected"] for col in report["column_analysis"]}
+        assert detected == {"majorite": "Date", "minorite": "Texte"}
+
+def test_detect_sensitive_data_overlapping_matches(tmp_path):
+    # Le téléphone est inclus dans l'email : les deux types doivent être détectés
+    rows = ["alpha"] * 300 + ["0612345678@exemple.fr"] + ["beta"] * 300
+    test_file = tmp_path / "pii_overlap.csv"
+    test_file.write_text("Contact\n" + "\n".join(rows) + "\n", encoding="utf-8")
+
+    for streaming in (False, True):
+        report = AuditRunner(str(test_file), {"streaming": streaming, "chunk_size": 100}).run_audit()
+        assert report["sensitive_data_report"]["detected_columns"] == [
+            {"column_name": "Contact", "pii_types": ["EMAIL", "PHONE"]}
+        ]
+
 # --- NOUVEAU TEST POUR F-06 ---
 def test_run_audit_with_duplicates(tmp_path):
     file_content = (
@@ -281,6 +315,32 @@ def test_run_audit_without_duplicates(tmp_path):
     assert report["duplicate_rows_report"]["duplicate_row_ratio"] == 0.0
     assert report["file_info"]["total_rows"] == 3 # Total rows should be 3 (header + 3 data rows)
 
+@pytest.mark.parametrize("streaming", [False, True])
+@pytest.mark.parametrize("fingerprint_bits", [64, 128])
+def test_duplicates_with_disk_spill(tmp_path, streaming, fingerprint_bits):
+    # Budget mémoire minuscule : les empreintes sont déversées sur disque dès les premiers blocs
+    rows = [f"{i % 70},{'AB'[i % 2]}" for i in range(200)]
+    test_file = tmp_path / "spill_duplicates.csv"
+    test_file.write_text("id,name\n" + "\n".join(rows) + "\n", encoding="utf-8")
+    spill_dir = tmp_path / "spill"
+    spill_dir.mkdir()
+
+    config = {
+        "streaming": streaming,
+        "chunk_size": 25,
+        "duplicate_fingerprint_bits": fingerprint_bits,
+        "duplicate_memory_budget_mb": 0.0001,
+        "duplicate_spill_dir": str(spill_dir),
+    }
+    report = AuditRunner(str(test_file), config).run_audit()
+
+    expected = int(pd.read_csv(test_file).duplicated().sum())
+    assert expected == 130
+    assert report["duplicate_rows_report"]["duplicate_row_count"] == expected
+    assert report["duplicate_rows_report"]["duplicate_row_ratio"] == pytest.approx(0.65)
+    # Les fichiers de partition sont supprimés en fin d'analyse
+    assert list(spill_dir.iterdir()) == []
+
 def test_quality_score_custom_profile():
     # Fichier avec une valeur manquante
     df = pd.DataFrame({
@@ -417,3 +477,664 @@ def test_quality_score_pii_detected(tmp_path):
     assert report["quality_score"]["component_scores"]["conformite"] == 0
     assert report["quality_score"]["global_score"] < 100
     assert report["structural_errors"] == []
+
+# --- MODE STREAMING ---
+def test_streaming_audit_matches_in_memory_audit(tmp_path):
+    lines = ["id;montant;nom;date;email;mix"]
+    for i in range(200):
+        lines.append(";".join([
+            str(i % 150),                                   # doublons d'identifiants
+            "" if i % 7 == 0 else f"{(i * 37) % 101}.5",    # valeurs manquantes
+            ["Alice", "Bob", "Chloé"][i % 3],
+            f"2023-01-{i % 28 + 1:02d}",
+            "contact@example.com" if i == 190 else "aucun",  # PII dans le dernier bloc
+            str(i) if i < 120 else "texte",                 # dtype différent selon les blocs
+        ]))
+    lines.extend(lines[1:4]) # lignes dupliquées réparties sur plusieurs blocs
+    test_file = tmp_path / "streaming.csv"
+    test_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    in_memory_report = AuditRunner(str(test_file)).run_audit()
+    streaming_report = AuditRunner(str(test_file), config_dict={"streaming": True, "chunk_size": 32}).run_audit()
+
+    assert streaming_report["structural_errors"] == []
+    assert streaming_report["duplicate_rows_report"]["duplicate_row_count"] == 3
+    assert json.dumps(streaming_report, sort_keys=True) == json.dumps(in_memory_report, sort_keys=True)
+
+def test_streaming_audit_empty_after_header(tmp_path):
+    test_file = tmp_path / "streaming_empty.csv"
+    test_file.write_text("col1,col2\n", encoding="utf-8")
+
+    report = AuditRunner(str(test_file), config_dict={"streaming": True}).run_audit()
+
+    assert report["structural_errors"][0]["error_code"] == "file_empty_after_header"
+    assert report["structural_errors"][0]["is_blocking"] is True
+
+def test_approximate_distinct_counts(tmp_path):
+    lines = ["id,categorie"] + [f"{i},cat{i % 10}" for i in range(5000)]
+    test_file = tmp_path / "high_cardinality.csv"
+    test_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    config = {"approximate_distinct": True, "hll_precision": 12}
+    report = AuditRunner(str(test_file), config_dict=config).run_audit()
+    streaming_report = AuditRunner(str(test_file), config_dict={**config, "streaming": True, "chunk_size": 700}).run_audit()
+
+    id_metrics = report["column_analysis"][0]["metrics"]
+    estimation = id_metrics["distinct_count_estimation"]
+    assert estimation["method"] == "hyperloglog"
+    assert estimation["confidence_interval_95"][0] <= 5000 <= estimation["confidence_interval_95"][1]
+    assert id_metrics["total_unique_values"] == pytest.approx(5000, rel=0.05)
+    assert report["column_analysis"][1]["metrics"]["total_unique_values"] == 10
+    # Les sketches fusionnés bloc par bloc donnent exactement la même estimation
+    assert streaming_report["column_analysis"] == report["column_analysis"]
+
+def test_quantile_sketch_metrics(tmp_path):
+    lines = ["valeur"] + [str(i) for i in range(1, 20001)]
+    test_file = tmp_path / "quantiles.csv"
+    test_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    config = {"quantile_sketch": True, "kll_k": 200}
+    report = AuditRunner(str(test_file), config_dict=config).run_audit()
+    streaming_report = AuditRunner(str(test_file), config_dict={**config, "streaming": True, "chunk_size": 3000}).run_audit()
+
+    for audit in (report, streaming_report):
+        metrics = audit["column_analysis"][0]["metrics"]
+        rank_error = metrics["quantile_estimation"]["rank_error_bound"]
+        assert metrics["quantile_estimation"]["method"] == "kll"
+        for name, q in (("median", 0.5), ("q1", 0.25), ("q3", 0.75), ("p1", 0.01), ("p99", 0.99)):
+            # Valeurs 1..20000 : le rang d'une valeur v est v / 20000
+            assert abs(metrics[name] / 20000 - q) <= rank_error
+
+def test_kll_sketch_minimum_compactor_width():
+    # Petit k : les compacteurs les plus profonds gardent la largeur minimale de l'analyse DataSketches
+    worst_error = 0.0
+    for seed in range(10):
+        sketch = KLLSketch(8, seed=seed)
+        values = np.random.default_rng(seed).permutation(50_000).astype("float64")
+        for block in np.array_split(values, 10):
+            sketch.update(block)
+        assert min(sketch._capacity(level) for level in range(len(sketch.levels))) == KLL_MIN_CAPACITY
+        for q in (0.1, 0.25, 0.5, 0.75, 0.9):
+            worst_error = max(worst_error, abs(sketch.quantile(q) / 50_000 - q))
+    assert worst_error <= sketch.rank_error_bound
+
+def test_heavy_hitters_top_frequencies(tmp_path):
+    values = ["A"] * 500 + ["B"] * 300 + ["C"] * 100 + [f"rare{i}" for i in range(400)]
+    test_file = tmp_path / "heavy_hitters.csv"
+    test_file.write_text("code\n" + "\n".join(values) + "\n", encoding="utf-8")
+
+    exact = AuditRunner(str(test_file)).run_audit()["column_analysis"][0]["metrics"]
+    config = {"heavy_hitters": True, "heavy_hitters_capacity": 20}
+    approx = AuditRunner(str(test_file), config_dict=config).run_audit()["column_analysis"][0]["metrics"]
+    streaming = AuditRunner(str(test_file), config_dict={**config, "streaming": True, "chunk_size": 150}).run_audit()["column_analysis"][0]["metrics"]
+
+    for metrics in (approx, streaming):
+        max_error = metrics["top_frequencies_estimation"]["max_frequency_error"]
+        assert metrics["top_frequencies_estimation"]["method"] == "misra_gries"
+        assert metrics["most_frequent_value"] == exact["most_frequent_value"] == "A"
+        assert list(metrics["top_frequencies"])[:3] == ["A", "B", "C"]
+        for value in ("A", "B", "C"):
+            assert 0 <= exact["top_frequencies"][value] - metrics["top_frequencies"][value] <= max_error + 1e-4
+
+@pytest.mark.parametrize("method", ["reservoir", "systematic"])
+def test_sampling_audit_estimates(tmp_path, method):
+    # 4000 lignes mélangées : ~25 % de valeurs manquantes dans "note", 10 % de lignes dupliquées
+    rng = random.Random(0)
+    rows = [f"{i},{'' if rng.random() < 0.25 else rng.randint(0, 9)}" for i in range(3600)]
+    rows += [rng.choice(rows) for _ in range(400)]
+    rng.shuffle(rows)
+    test_file = tmp_path / "sampling.csv"
+    test_file.write_text("id,note\n" + "\n".join(rows) + "\n", encoding="utf-8")
+    df = pd.read_csv(test_file)
+
+    config = {"sampling": True, "sampling_method": method, "sample_size": 500, "chunk_size": 300, "sample_seed": 1}
+    report = AuditRunner(str(test_file), config).run_audit()
+    sampling = report["sampling"]
+
+    assert report["structural_errors"] == []
+    assert report["file_info"]["total_rows"] == 4000
+    assert sampling["method"] == method
+    assert sampling["sample_size"] == 500
+    assert sampling["population_rows"] == 4000
+    low, high = sampling["missing_values_ratio"]["note"]["confidence_interval_95"]
+    assert low <= sampling["missing_values_ratio"]["note"]["estimate"] <= high
+    assert low <= df["note"].isna().mean() <= high
+    low, high = sampling["duplicate_row_ratio"]["confidence_interval_95"]
+    assert low <= df.duplicated().mean() == 0.1 <= high
+    score_low, score_high = sampling["quality_score"]["global_score"]
+    assert score_low <= report["quality_score"]["global_score"] <= score_high
+    # Même graine, même taille de blocs ou non : même échantillon
+    again = AuditRunner(str(test_file), {**config, "chunk_size": 1000}).run_audit()
+    assert again["sampling"] == sampling
+
+
+def test_sampling_audit_exhaustive_sample(tmp_path):
+    test_file = tmp_path / "small_sampling.csv"
+    test_file.write_text("id,name\n1,A\n1,A\n2,\n3,C\n", encoding="utf-8")
+
+    exact = AuditRunner(str(test_file)).run_audit()
+    sampled = AuditRunner(str(test_file), {"sampling": True, "sample_size": 100}).run_audit()
+
+    sampling = sampled.pop("sampling")
+    assert sampling["sample_size"] == sampling["population_rows"] == 4
+    assert sampling["missing_values_ratio"]["name"]["confidence_interval_95"] == [0.25, 0.25]
+    assert sampling["quality_score"]["global_score"] == [exact["quality_score"]["global_score"]] * 2
+    assert json.dumps(sampled, sort_keys=True, default=str) == json.dumps(exact, sort_keys=True, default=str)
+
+
+def test_run_batch_audit_parallel_matches_sequential(tmp_path):
+    input_dir = tmp_path / "inputs"
+    input_dir.mkdir()
+    for i in range(6):
+        (input_dir / f"data_{i}.csv").write_text(f"id,email\n{i},user{i}@exemple.fr\n{i},user{i}@exemple.fr\n", encoding="utf-8")
+    (input_dir / "empty.csv").write_text("", encoding="utf-8")
+
+    runner = AuditRunner(str(input_dir / "data_0.csv"))
+    sequential = runner.run_batch_audit(str(input_dir), str(tmp_path / "sequential"))
+    parallel = AuditRunner(str(input_dir / "data_0.csv"), {"batch_workers": 3}).run_batch_audit(
+        str(input_dir), str(tmp_path / "parallel")
+    )
+
+    assert parallel == sequential
+    assert list(parallel) == sorted(parallel)
+    assert set(parallel.values()) == {"success"}
+    report_names = sorted(os.listdir(tmp_path / "parallel"))
+    assert report_names == sorted(os.listdir(tmp_path / "sequential")) == [f"data_{i}.json" for i in range(6)] + ["empty.json"]
+    for name in report_names:
+        assert (tmp_path / "parallel" / name).read_bytes() == (tmp_path / "sequential" / name).read_bytes()
+
+
+def _audit_in_routed_child(log_queue, filepath, log_file):
+    route_logging_to_queue("veriqual.audit", log_queue)
+    AuditRunner(filepath, {"log_to_file": True, "log_file": log_file}).run_audit()
+
+
+def test_log_file_written_by_main_process(tmp_path, monkeypatch):
+    input_dir = tmp_path / "inputs"
+    input_dir.mkdir()
+    for i in range(3):
+        (input_dir / f"data_{i}.csv").write_text(f"id,nom\n{i},nom{i}\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    # Par défaut, aucun fichier de log n'est créé
+    AuditRunner(str(input_dir / "data_0.csv")).run_audit()
+    assert not (tmp_path / "app.log").exists()
+
+    # Un processus routé vers le processus principal n'ouvre jamais le fichier de log lui-même
+    child_log = tmp_path / "child.log"
+    child = multiprocessing.Process(
+        target=_audit_in_routed_child,
+        args=(process_log_queue("veriqual.audit"), str(input_dir / "data_0.csv"), str(child_log))
+    )
+    child.start()
+    child.join()
+    assert child.exitcode == 0
+    assert not child_log.exists()
+
+    log_file = tmp_path / "logs" / "audit.log"
+    config = {"batch_workers": 2, "log_to_file": True, "log_file": str(log_file)}
+    statuses = AuditRunner(str(input_dir / "data_0.csv"), config).run_batch_audit(str(input_dir), str(tmp_path / "reports"))
+    assert set(statuses.values()) == {"success"}
+
+    # Les logs des processus du pool sont écrits par l'écouteur du processus principal
+    expected = [f"Vérification de l'existence du fichier : {input_dir / f'data_{i}.csv'}" for i in range(3)]
+    deadline = time.monotonic() + 10
+    while not all(line in log_file.read_text(encoding="utf-8") for line in expected) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    content = log_file.read_text(encoding="utf-8")
+    assert all(line in content for line in expected)
+
+    # Retour à la console seule : le fichier n'est plus alimenté
+    AuditRunner(str(input_dir / "data_1.csv")).run_audit()
+    size = log_file.stat().st_size
+    AuditRunner(str(input_dir / "data_2.csv")).run_audit()
+    assert log_file.stat().st_size == size
+    assert not (tmp_path / "app.log").exists()
+
+
+def test_run_batch_audit_recursive_schedule(tmp_path):
+    input_dir = tmp_path / "inputs"
+    for relative_path, rows in [("small.csv", 1), ("2024-01/large.csv", 50), ("2024-02/medium.csv", 10), ("2024-02/skip.csv", 1)]:
+        path = input_dir / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("id,email\n" + "".join(f"{i},user{i}@exemple.fr\n" for i in range(rows)), encoding="utf-8")
+    config = {"batch_recursive": True, "batch_exclude": ["skip*"], "batch_summary_file": "summary.ndjson"}
+
+    by_name = AuditRunner(str(input_dir / "small.csv"), config).run_batch_audit(str(input_dir), str(tmp_path / "name"))
+    largest = AuditRunner(str(input_dir / "small.csv"), {**config, "batch_schedule": "largest_first"}).run_batch_audit(
+        str(input_dir), str(tmp_path / "largest")
+    )
+
+    assert by_name == largest == {"2024-01/large.csv": "success", "2024-02/medium.csv": "success", "small.csv": "success"}
+    for relative_path in ["2024-01/large.json", "2024-02/medium.json", "small.json"]:
+        assert (tmp_path / "largest" / relative_path).read_bytes() == (tmp_path / "name" / relative_path).read_bytes()
+    order = [json.loads(line)["file_name"] for line in (tmp_path / "largest" / "summary.ndjson").read_text(encoding="utf-8").splitlines()]
+    assert order == ["large.csv", "medium.csv", "small.csv"]
+    # Sans parcours récursif, seul le premier niveau est audité (comportement par défaut)
+    assert AuditRunner(str(input_dir / "small.csv")).run_batch_audit(str(input_dir), str(tmp_path / "flat")) == {"small.csv": "success"}
+
+
+def test_async_audits_match_sync(tmp_path):
+    input_dir = tmp_path / "inputs"
+    input_dir.mkdir()
+    for i in range(5):
+        (input_dir / f"data_{i}.csv").write_text(f"id,email\n{i},user{i}@exemple.fr\n{i + 1},autre@exemple.fr\n", encoding="utf-8")
+    runner = AuditRunner(str(input_dir / "data_0.csv"), {"async_max_concurrency": 2})
+    sequential = runner.run_batch_audit(str(input_dir), str(tmp_path / "sequential"))
+
+    async def audit():
+        semaphore = asyncio.Semaphore(1)
+        report = await AuditRunner(str(input_dir / "data_0.csv")).run_audit_async(semaphore=semaphore)
+        assert not semaphore.locked()
+        statuses = await runner.run_batch_audit_async(str(input_dir), str(tmp_path / "async"))
+        return report, statuses
+
+    report, statuses = asyncio.run(audit())
+
+    assert report == AuditRunner(str(input_dir / "data_0.csv")).run_audit()
+    assert statuses == sequential
+    for name in os.listdir(tmp_path / "sequential"):
+        assert (tmp_path / "async" / name).read_bytes() == (tmp_path / "sequential" / name).read_bytes()
+
+
+def test_run_audit_async_cancellation(tmp_path):
+    test_file = tmp_path / "long.csv"
+    test_file.write_text("id,email\n" + "".join(f"{i},user{i}@exemple.fr\n" for i in range(5000)), encoding="utf-8")
+    runner = AuditRunner(str(test_file), {"streaming": True, "chunk_size": 10})
+
+    async def cancel_audit():
+        semaphore = asyncio.Semaphore(1)
+        task = asyncio.create_task(runner.run_audit_async(semaphore=semaphore))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # Audit arrêté dans l'exécuteur avant la propagation de l'annulation
+        assert not semaphore.locked()
+
+    asyncio.run(cancel_audit())
+    assert runner.audit_report["quality_score"]["global_score"] == 0
+    # Annulation demandée hors asyncio : arrêt au début de l'étape suivante
+    stopped = AuditRunner(str(test_file))
+    stopped.cancel()
+    with pytest.raises(AuditCancelledError):
+        stopped.run_audit()
+
+
+@pytest.mark.parametrize("memory", ["rss", "tracemalloc"])
+def test_run_audit_performance_section(tmp_path, memory):
+    test_file = tmp_path / "perf.csv"
+    test_file.write_text("id,email\n" + "".join(f"{i},user{i}@exemple.fr\n" for i in range(200)), encoding="utf-8")
+
+    assert "performance" not in AuditRunner(str(test_file)).run_audit()
+    runner = AuditRunner(str(test_file), {"instrumentation": True, "instrumentation_memory": memory})
+    report = runner.run_audit()
+
+    performance = report["performance"]
+    assert performance == runner.performance.summary()
+    assert performance["memory_method"] == memory
+    stages = {record["stage"]: record for record in performance["stages"]}
+    assert list(stages) == [
+        "F-01 encodage", "F-01 séparateur", "F-01 validation préalable", "F-01 chargement", "F-02 en-têtes",
+        "F-03 profilage", "F-04 typage", "F-05 PII", "F-06 doublons", "F-07/F-08 score",
+    ]
+    assert stages["F-01 validation préalable"]["rows"] == 200
+    assert stages["F-01 chargement"]["rows"] == 200
+    assert stages["F-01 chargement"]["bytes_read"] == os.path.getsize(test_file)
+    assert performance["total"]["bytes_read"] == 2 * os.path.getsize(test_file)
+    for record in performance["stages"]:
+        assert record["wall_time_s"] >= 0 and record["cpu_time_s"] >= 0
+        if memory == "tracemalloc":
+            assert record["peak_memory_bytes"] >= 0
+
+
+def test_runners_share_queued_logger(tmp_path):
+    import logging.handlers
+    first = AuditRunner(str(tmp_path / "a.csv"))
+    second = AuditRunner(str(tmp_path / "b.csv"))
+
+    assert first.logger is second.logger
+    # Un seul handler propre au moteur, quel que soit le nombre d'audits du processus
+    assert sum(isinstance(handler, logging.handlers.QueueHandler) for handler in second.logger.handlers) == 1
+    assert not any(isinstance(handler, logging.FileHandler) for handler in second.logger.handlers)
+
+
+def test_run_batch_audit_report_cache(tmp_path, monkeypatch):
+    input_dir = tmp_path / "inputs"
+    input_dir.mkdir()
+    for i in range(3):
+        (input_dir / f"data_{i}.csv").write_text(f"id,email\n{i},user{i}@exemple.fr\n{i + 1},autre@exemple.fr\n", encoding="utf-8")
+    (input_dir / "copie.csv").write_bytes((input_dir / "data_0.csv").read_bytes())
+    (input_dir / "empty.csv").write_text("", encoding="utf-8")
+    cache_config = {"cache_dir": str(tmp_path / "cache")}
+
+    uncached = AuditRunner(str(input_dir / "data_0.csv")).run_batch_audit(str(input_dir), str(tmp_path / "uncached"))
+    audited = []
+    original_run_audit = AuditRunner.run_audit
+    def counting_run_audit(self):
+        audited.append(os.path.basename(self.filepath))
+        return original_run_audit(self)
+    monkeypatch.setattr(AuditRunner, "run_audit", counting_run_audit)
+
+    # Premier passage : les fichiers de contenu identique ne sont audités qu'une fois
+    first = AuditRunner(str(input_dir / "data_0.csv"), cache_config).run_batch_audit(str(input_dir), str(tmp_path / "first"))
+    assert first == uncached
+    assert sorted(audited) == ["copie.csv", "data_1.csv", "data_2.csv", "empty.csv"]
+    for name in os.listdir(tmp_path / "uncached"):
+        assert (tmp_path / "first" / name).read_bytes() == (tmp_path / "uncached" / name).read_bytes()
+    assert json.loads((tmp_path / "first" / "copie.json").read_text(encoding="utf-8"))["file_info"]["file_name"] == "copie.csv"
+
+    # Second passage : seuls les fichiers modifiés (et le fichier vide) sont audités
+    audited.clear()
+    (input_dir / "data_2.csv").write_text("id,email\n9,modifie@exemple.fr\n", encoding="utf-8")
+    second = AuditRunner(str(input_dir / "data_0.csv"), cache_config).run_batch_audit(str(input_dir), str(tmp_path / "second"))
+    assert set(second.values()) == {"success"}
+    assert sorted(audited) == ["data_2.csv", "empty.csv"]
+    assert (tmp_path / "second" / "data_1.json").read_bytes() == (tmp_path / "uncached" / "data_1.json").read_bytes()
+
+    # Un autre profil de score ne réutilise pas les rapports en cache
+    audited.clear()
+    profile = {"fiabilite_structurelle": 20, "completude": 20, "validite": 20, "unicite": 20, "conformite": 20}
+    AuditRunner(str(input_dir / "data_0.csv"), {**cache_config, "scoring_profile": profile}).run_batch_audit(str(input_dir), str(tmp_path / "third"))
+    assert sorted(audited) == ["copie.csv", "data_1.csv", "data_2.csv", "empty.csv"]
+
+
+@pytest.mark.parametrize("batch_workers", [1, 2])
+def test_run_batch_audit_compact_reports_and_summary(tmp_path, batch_workers):
+    input_dir = tmp_path / "inputs"
+    input_dir.mkdir()
+    for i in range(3):
+        (input_dir / f"data_{i}.csv").write_text(f"id,email\n{i},user{i}@exemple.fr\n{i + 1},autre@exemple.fr\n", encoding="utf-8")
+    (input_dir / "copie.csv").write_bytes((input_dir / "data_0.csv").read_bytes())
+    (input_dir / "empty.csv").write_text("", encoding="utf-8")
+    config = {
+        "report_serializer": "auto",
+        "report_pretty": False,
+        "batch_summary_file": "summary.ndjson",
+        "cache_dir": str(tmp_path / "cache"),
+        "batch_workers": batch_workers,
+    }
+
+    pretty = AuditRunner(str(input_dir / "data_0.csv")).run_batch_audit(str(input_dir), str(tmp_path / "pretty"))
+    runner = AuditRunner(str(input_dir / "data_0.csv"), config)
+    compact = runner.run_batch_audit(str(input_dir), str(tmp_path / "compact"))
+    assert compact == pretty
+    for name in os.listdir(tmp_path / "pretty"):
+        compact_text = (tmp_path / "compact" / name).read_text(encoding="utf-8")
+        assert "\n" not in compact_text
+        pretty_report = json.loads((tmp_path / "pretty" / name).read_text(encoding="utf-8"))
+        assert json.dumps(json.loads(compact_text), sort_keys=True) == json.dumps(pretty_report, sort_keys=True)
+
+    # Journal en ajout : un second lot (servi par le cache) ajoute ses lignes à celles du premier
+    runner.run_batch_audit(str(input_dir), str(tmp_path / "compact"))
+    lines = [json.loads(line) for line in (tmp_path / "compact" / "summary.ndjson").read_text(encoding="utf-8").splitlines()]
+    assert len(lines) == 10
+    first, second = lines[:5], lines[5:]
+    assert len({line["batch_id"] for line in first}) == len({line["batch_id"] for line in second}) == 1
+    assert first[0]["batch_id"] != second[0]["batch_id"]
+    by_name = {line["file_name"]: line for line in first}
+    assert sorted(by_name) == ["copie.csv", "data_0.csv", "data_1.csv", "data_2.csv", "empty.csv"]
+    assert by_name["data_0.csv"]["source"] == "duplicate" and by_name["copie.csv"]["source"] == "audit"
+    assert by_name["data_1.csv"]["status"] == "success"
+    assert by_name["data_1.csv"]["total_rows"] == 2
+    assert by_name["data_1.csv"]["report_path"] == str(tmp_path / "compact" / "data_1.json")
+    assert by_name["empty.csv"]["structural_errors"] == ["file_empty_bytes"]
+    assert {line["source"] for line in second if line["file_name"] != "empty.csv"} == {"cache"}
+
+
+@pytest.mark.parametrize("extension", [".gz", ".bz2", ".xz", ".zst"])
+def test_compressed_input_matches_plain_audit(tmp_path, extension):
+    content = ("id;nom;ville\n" + "".join(f"{i};Élodie {i % 7};Lyon\n" for i in range(200)) + "3;Élodie 3;Lyon\n").encode("latin-1")
+    if extension == ".zst":
+        zstandard = pytest.importorskip("zstandard")
+        compressed = zstandard.ZstdCompressor().compress(content)
+    else:
+        compressed = {".gz": gzip, ".bz2": bz2, ".xz": lzma}[extension].compress(content)
+    plain_file = tmp_path / "data.csv"
+    plain_file.write_bytes(content)
+    compressed_file = tmp_path / f"data.csv{extension}"
+    compressed_file.write_bytes(compressed)
+
+    def comparable(report):
+        file_info = report["file_info"]
+        return {**report, "file_info": {**file_info, "file_name": None, "file_size_kb": None, "compression": None}}
+
+    for config in [{}, {"streaming": True, "chunk_size": 50}, {"load_engine": "arrow"}, {"incremental": True}]:
+        plain = AuditRunner(str(plain_file), config).run_audit()
+        report = AuditRunner(str(compressed_file), config).run_audit()
+        assert report["file_info"]["compression"] == {".gz": "gzip", ".bz2": "bz2", ".xz": "xz", ".zst": "zstd"}[extension]
+        assert report["structural_errors"] == []
+        assert comparable(report) == comparable(plain)
+    assert not os.path.exists(str(compressed_file) + ".veriqual-state")
+
+    statuses = AuditRunner(str(plain_file)).run_batch_audit(str(tmp_path), str(tmp_path / "reports"))
+    assert statuses == {"data.csv": "success", f"data.csv{extension}": "success"}
+    assert sorted(os.listdir(tmp_path / "reports")) == [f"data.csv{extension}.json", "data.json"]
+
+
+def test_dialect_passed_to_parser(tmp_path):
+    test_file = tmp_path / "escaped.csv"
+    test_file.write_text(
+        "id|commentaire|ville\n" + "".join(f'{i}|"il a dit \\"ok|{i}\\""|Lyon\n' for i in range(20)), encoding="utf-8"
+    )
+
+    for config in [{}, {"streaming": True, "chunk_size": 7}, {"load_engine": "arrow"}]:
+        report = AuditRunner(str(test_file), config).run_audit()
+        assert report["structural_errors"] == []
+        assert report["file_info"]["detected_separator"] == "|"
+        assert report["file_info"]["detected_dialect"]["escapechar"] == "\\"
+        assert report["file_info"]["total_columns"] == 3
+        assert report["file_info"]["total_rows"] == 20
+        commentaire = next(column for column in report["column_analysis"] if column["column_name"] == "commentaire")
+        assert commentaire["metrics"]["total_unique_values"] == 20
+        assert all(value.startswith('il a dit "ok|') for value in commentaire["metrics"]["top_frequencies"])
+
+
+def test_prefix_validation_fails_fast(tmp_path):
+    # Première ligne conforme à l'en-tête, puis un champ de trop : pandas écarte ces lignes
+    ragged_file = tmp_path / "ragged.csv"
+    ragged_file.write_text("id,nom\n0,nom 0\n" + "".join(f"{i},nom {i},extra\n" for i in range(1, 5000)), encoding="utf-8")
+    unchecked = AuditRunner(str(ragged_file), {"prefix_validation": False}).run_audit()
+    assert unchecked["structural_errors"] == [] and unchecked["file_info"]["total_rows"] == 1
+    with patch("VeriQual_Core.audit_runner.load_dataframe_robustly") as load, \
+         patch("VeriQual_Core.audit_runner.iter_dataframe_chunks") as chunks:
+        for config in [{}, {"streaming": True}, {"prefix_validation_rows": 10}]:
+            report = AuditRunner(str(ragged_file), config).run_audit()
+            assert [error["error_code"] for error in report["structural_errors"]] == ["non_rectangular_structure"]
+            assert report["structural_errors"][0]["is_blocking"] is True
+            assert "lignes 3, 4, 5" in report["structural_errors"][0]["message"]
+        load.assert_not_called()
+        chunks.assert_not_called()
+    assert report["prefix_validation"]["rows_checked"] == 10
+    assert report["prefix_validation"]["field_count_mode"] == 3
+    assert report["prefix_validation"]["expected_fields"] == 2
+    assert report["prefix_validation"]["rejected_rows"] == 9
+
+    # Lignes courtes (complétées par pandas), champ de trop sur toutes les lignes (lu comme index),
+    # délimiteur final sur toutes les lignes : non bloquants, audit identique sans validation
+    short_rows = tmp_path / "short_rows.csv"
+    short_rows.write_text("a,b,c\n1,2\n3,4\n5,6,7\n", encoding="utf-8")
+    extra_field = tmp_path / "extra_field.csv"
+    extra_field.write_text("id,nom\n" + "".join(f"{i},nom {i},extra\n" for i in range(50)), encoding="utf-8")
+    trailing = tmp_path / "trailing.csv"
+    trailing.write_text("a,b\n1,2,\n3,4,\n", encoding="utf-8")
+    for path, rows in [(short_rows, 3), (extra_field, 50), (trailing, 2)]:
+        report = AuditRunner(str(path)).run_audit()
+        assert report["structural_errors"] == []
+        assert report["file_info"]["total_rows"] == rows
+        assert report["prefix_validation"]["rejected_rows"] == 0
+        assert report["quality_score"] == AuditRunner(str(path), {"prefix_validation": False}).run_audit()["quality_score"]
+    assert AuditRunner(str(short_rows)).run_audit()["prefix_validation"]["ragged_line_numbers"] == [2, 3]
+
+    # Le lecteur Arrow écarte aussi les lignes courtes
+    if importlib.util.find_spec("pyarrow") is not None:
+        report = AuditRunner(str(short_rows), {"load_engine": "arrow"}).run_audit()
+        assert [error["error_code"] for error in report["structural_errors"]] == ["non_rectangular_structure"]
+
+    # En-tête vide : bloquant ; noms en double ou vides : décrits, tolérés par le chargement
+    no_header = tmp_path / "no_header.csv"
+    no_header.write_text(",\n1,2\n", encoding="utf-8")
+    assert AuditRunner(str(no_header)).run_audit()["structural_errors"][0]["error_code"] == "invalid_header"
+    tolerated = tmp_path / "tolerated.csv"
+    tolerated.write_text("id,id,,nom\n1,2,3,a\n4,5,6,b,x\n7,8,9,c\n", encoding="utf-8")
+    report = AuditRunner(str(tolerated)).run_audit()
+    assert report["structural_errors"] == []
+    assert report["prefix_validation"]["duplicate_column_names"] == ["id"]
+    assert report["prefix_validation"]["empty_column_names"] == [2]
+    assert report["prefix_validation"]["ragged_rows"] == 1
+    assert report["prefix_validation"]["ragged_line_numbers"] == [3]
+    assert report["prefix_validation"]["rejected_line_numbers"] == [3]
+    assert report["file_info"]["total_rows"] == 2
+    assert "prefix_validation" not in AuditRunner(str(tolerated), {"prefix_validation": False}).run_audit()
+
+
+def test_report_cache_eviction(tmp_path):
+    cache = ReportCache(str(tmp_path / "cache"), max_size_bytes=300)
+    report = {"file_info": {"file_name": "x" * 100}}
+    for i in range(5):
+        cache.put(f"empreinte{i}", "cle", report)
+        os.utime(os.path.join(cache.reports_dir, f"empreinte{i}_cle.json"), ns=(i * 10**9, i * 10**9))
+    cache.get("empreinte0", "cle")
+
+    assert cache.evict() == 3
+    assert sorted(os.listdir(cache.reports_dir)) == ["empreinte0_cle.json", "empreinte4_cle.json"]
+
+
+def test_incremental_audit_matches_full_audit(tmp_path):
+    rng = random.Random(3)
+    def rows(n):
+        return "".join(f"{rng.randint(0, 50)},{rng.choice(['a', 'b', ''])},u{rng.randint(0, 9)}@exemple.fr\n" for _ in range(n))
+    test_file = tmp_path / "flux.csv"
+    test_file.write_text("id,categorie,email\n" + rows(2000), encoding="utf-8")
+    incremental_config = {"incremental": True, "incremental_state_dir": str(tmp_path / "etat"), "chunk_size": 300}
+    full_config = {"streaming": True, "chunk_size": 300}
+
+    assert AuditRunner(str(test_file), incremental_config).run_audit() == AuditRunner(str(test_file), full_config).run_audit()
+    assert len(os.listdir(tmp_path / "etat")) == 1
+
+    # Ajouts successifs : seules les nouvelles lignes sont lues
+    for _ in range(2):
+        with open(test_file, "a", encoding="utf-8") as f:
+            f.write(rows(500))
+        with patch("VeriQual_Core.audit_runner.scan_file_structure") as scan:
+            incremental = AuditRunner(str(test_file), incremental_config).run_audit()
+        scan.assert_not_called()
+        assert incremental == AuditRunner(str(test_file), full_config).run_audit()
+
+    # Début du fichier modifié : audit complet
+    test_file.write_text(test_file.read_text(encoding="utf-8").replace("id,", "ID,", 1), encoding="utf-8")
+    incremental = AuditRunner(str(test_file), incremental_config).run_audit()
+    assert incremental == AuditRunner(str(test_file), full_config).run_audit()
+    assert incremental["column_analysis"][0]["column_name"] == "ID"
+
+
+class _PlantedPayload:
+    def __init__(self, marker):
+        self.marker = marker
+
+    def __reduce__(self):
+        return (open, (self.marker, "w"))
+
+
+def test_incremental_state_is_data_only(tmp_path):
+    rng = random.Random(5)
+    def rows(n):
+        return "".join(f"{rng.randint(0, 99999):05d},{rng.choice(['a', 'b', ''])},{rng.random():.6f}\n" for _ in range(n))
+    test_file = tmp_path / "flux.csv"
+    test_file.write_text("code,categorie,mesure\n" + rows(12000), encoding="utf-8")
+    incremental_config = {
+        "incremental": True, "chunk_size": 1000, "approximate_distinct": True, "quantile_sketch": True,
+        "heavy_hitters": True, "duplicate_fingerprint_bits": 128,
+    }
+    full_config = {key: value for key, value in incremental_config.items() if key != "incremental"}
+    full_config["streaming"] = True
+    state_path = str(test_file) + ".veriqual-state"
+
+    # Un pickle déposé à la place de l'état n'est jamais désérialisé
+    marker = tmp_path / "execute"
+    with open(state_path, "wb") as f:
+        pickle.dump(_PlantedPayload(str(marker)), f)
+    assert AuditRunner(str(test_file), incremental_config).run_audit() == AuditRunner(str(test_file), full_config).run_audit()
+    assert not marker.exists()
+    with open(state_path, "rb") as f:
+        assert f.read(2) == b"PK"
+
+    # Reprise avec tous les sketches : accumulateurs reconstruits à l'identique
+    with open(test_file, "a", encoding="utf-8") as f:
+        f.write(rows(3000))
+    with patch("VeriQual_Core.audit_runner.scan_file_structure") as scan:
+        incremental = AuditRunner(str(test_file), incremental_config).run_audit()
+    scan.assert_not_called()
+    assert incremental == AuditRunner(str(test_file), full_config).run_audit()
+
+    # Réécriture de même taille au milieu du préfixe (ni au début ni à la fin) : audit complet
+    content = test_file.read_bytes()
+    middle = content.index(b"\n", len(content) // 2) + 1
+    test_file.write_bytes(content[:middle] + b"99999" + content[middle + 5:])
+    with patch("VeriQual_Core.audit_runner.scan_file_structure", wraps=scan_file_structure) as scan:
+        incremental = AuditRunner(str(test_file), incremental_config).run_audit()
+    scan.assert_called_once()
+    assert incremental == AuditRunner(str(test_file), full_config).run_audit()
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_column_parallel_stages_preserve_order(tmp_path, executor):
+    header = ",".join(f"col_{i}" for i in range(12))
+    rows = [",".join(str(r * i) if i % 3 else f"user{r}@exemple.fr" for i in range(12)) for r in range(50)]
+    test_file = tmp_path / "wide.csv"
+    test_file.write_text(header + "\n" + "\n".join(rows) + "\n", encoding="utf-8")
+
+    sequential = AuditRunner(str(test_file)).run_audit()
+    parallel = AuditRunner(str(test_file), {"column_workers": 4, "column_executor": executor}).run_audit()
+
+    assert [col["column_name"] for col in parallel["column_analysis"]] == [f"col_{i}" for i in range(12)]
+    assert parallel["column_analysis"] == sequential["column_analysis"]
+    assert parallel["sensitive_data_report"] == sequential["sensitive_data_report"]
+    assert len(parallel["sensitive_data_report"]["detected_columns"]) == 4
+
+
+def test_arrow_load_engine_matches_pandas_metrics(tmp_path):
+    pytest.importorskip("pyarrow")
+    rows = [f"{i % 40},{(i * 7) % 13 + 0.5 if i % 9 else ''},nom{i % 5},u{i % 11}@exemple.fr" for i in range(100)]
+    test_file = tmp_path / "arrow.csv"
+    test_file.write_text("id,prix,nom,email\n" + "\n".join(rows) + "\n", encoding="utf-8")
+
+    pandas_report = AuditRunner(str(test_file)).run_audit()
+    arrow_report = AuditRunner(str(test_file), {"load_engine": "arrow", "pii_engine": "pyarrow"}).run_audit()
+
+    for pandas_col, arrow_col in zip(pandas_report["column_analysis"], arrow_report["column_analysis"]):
+        assert arrow_col["pandas_dtype"].endswith("[pyarrow]")
+        assert arrow_col["metrics"] == pandas_col["metrics"]
+        assert arrow_col["data_type_detected"] == pandas_col["data_type_detected"]
+    assert arrow_report["sensitive_data_report"] == pandas_report["sensitive_data_report"]
+    assert arrow_report["duplicate_rows_report"] == pandas_report["duplicate_rows_report"]
+    assert arrow_report["quality_score"] == pandas_report["quality_score"]
+
+def test_memory_optimized_load_matches_default_metrics(tmp_path):
+    rows = [
+        f"{i},{i % 7 if i % 10 else ''},{(i % 13) + 0.5},{('FR', 'BE', 'CH')[i % 3]},u{i % 11}@exemple.fr"
+        for i in range(300)
+    ]
+    test_file = tmp_path / "compact.csv"
+    test_file.write_text("id,quantite,prix,pays,email\n" + "\n".join(rows) + "\n", encoding="utf-8")
+
+    default_report = AuditRunner(str(test_file)).run_audit()
+    optimized_report = AuditRunner(str(test_file), {"memory_optimized_load": True}).run_audit()
+
+    dtypes = {col["column_name"]: col["pandas_dtype"] for col in optimized_report["column_analysis"]}
+    assert dtypes["id"] == "int16"
+    assert dtypes["quantite"] == "Int8" # float64 en lecture par défaut (valeurs manquantes)
+    assert dtypes["prix"] == "float32"
+    assert dtypes["pays"] == "category"
+    for default_col, optimized_col in zip(default_report["column_analysis"], optimized_report["column_analysis"]):
+        assert optimized_col["metrics"] == default_col["metrics"]
+        if optimized_col["column_name"] != "quantite":
+            assert optimized_col["data_type_detected"] == default_col["data_type_detected"]
+    assert optimized_report["sensitive_data_report"] == default_report["sensitive_data_report"]
+    assert optimized_report["duplicate_rows_report"] == default_report["duplicate_rows_report"]
+
+    footprint = optimized_report["memory_footprint"]
+    assert footprint["compact_dtypes"]["pays"] == "category"
+    assert footprint["dataframe_bytes"] < footprint["estimated_default_bytes"]
+    assert 0 < footprint["reduction_ratio"] < 1
+    assert "memory_footprint" not in default_report
@@ -0,0 +1,58 @@
+import pytest
+
+from benchmarks.synthetic import column_types_for, generate_csv, generate_dataframe
+from benchmarks.suite import compare_to_baseline
+
+
+def test_generate_csv_is_deterministic(tmp_path):
+    first = generate_csv(str(tmp_path / "a.csv"), rows=500, separator=";", encoding="latin-1", seed=4)
+    second = generate_csv(str(tmp_path / "b.csv"), rows=500, separator=";", encoding="latin-1", seed=4)
+
+    assert first == second
+    assert (tmp_path / "a.csv").read_bytes() == (tmp_path / "b.csv").read_bytes()
+    assert (tmp_path / "a.csv").read_bytes().count(b"\n") == 501
+
+
+def test_generate_dataframe_rates():
+    df = generate_dataframe(rows=20_000, columns=6, type_mix={"int": 1, "text": 1, "pii": 1},
+                            null_rate=0.1, duplicate_rate=0.05, pii_density=0.5, seed=1)
+
+    assert column_types_for(6, {"int": 1, "text": 1, "pii": 1}) == ["int", "text", "pii", "int", "text", "pii"]
+    assert list(df.columns) == ["int_0", "text_1", "pii_2", "int_3", "text_4", "pii_5"]
+    assert df.iloc[:, 1:].isna().mean().mean() == pytest.approx(0.1, abs=0.01)
+    assert df.duplicated().mean() == pytest.approx(0.05, abs=0.01)
+    pii = df["pii_2"].dropna()
+    assert (pii.str.contains("@") | pii.str.startswith("06")).mean() == pytest.approx(0.5, abs=0.02)
+
+
+def test_compare_to_baseline():
+    generation = {"rows": 10, "columns": 2, "seed": 0}
+    baseline = {"generation": generation, "results": {"lent": {"seconds": 1.0}, "rapide": {"seconds": 1.0}, "bruit": {"seconds": 0.001}}}
+    run = {"generation": generation, "results": {"lent": {"seconds": 1.5}, "rapide": {"seconds": 0.5}, "bruit": {"seconds": 0.003}}}
+
+    assert compare_to_baseline(run, baseline) == {
+        "lent": {"ratio": 1.5, "status": "regression"},
+        "rapide": {"ratio": 0.5, "status": "improvement"},
+    }
+    with pytest.raises(ValueError):
+        compare_to_baseline({**run, "generation": {**generation, "rows": 20}}, baseline)
+
+
+def test_compare_to_baseline_reports_missing_and_stale_entries():
+    generation = {"rows": 10, "columns": 2, "seed": 0}
+    baseline = {
+        "environment": {"engine_version": "1.0.0"},
+        "generation": generation,
+        "results": {"run_audit[defaut]": {"seconds": 1.0}, "files.scan": {"seconds": 1.0}},
+    }
+    run = {
+        "environment": {"engine_version": "1.1.0"},
+        "generation": generation,
+        "results": {"run_audit[defaut]": {"seconds": 2.0}, "files.scan": {"seconds": 2.0}, "nouveau": {"seconds": 0.001}},
+    }
+
+    assert compare_to_baseline(run, baseline) == {
+        "run_audit[defaut]": {"ratio": 2.0, "status": "stale"},
+        "files.scan": {"ratio": 2.0, "status": "regression"},
+        "nouveau": {"ratio": None, "status": "missing"},
+    }
@@ -1,6 +1,10 @@
 import tempfile
 import os
-from tools.common.files import detect_csv_separator
+import gzip
+from tools.common.files import (
+    detect_csv_separator, detect_file_encoding, scan_file_structure, iter_csv_files, get_csv_files_in_directory,
+    detect_compression, open_decompressed, check_file_extension, detect_csv_dialect,
+    check_file_empty_content)
 
 def test_detect_csv_separator_semicolon():
     csv_content = "col1;col2;col3\n1;2;3\n4;5;6"
@@ -16,3 +20,106 @@ def test_detect_csv_separator_semicolon():
         assert err is None
     finally:
         os.remove(temp_path)
+
+def test_scan_file_structure_single_pass(tmp_path):
+    test_file = tmp_path / "scan.csv"
+    test_file.write_bytes("nom;ville\nAlice;Évry\nBob;Lyon".encode("latin-1"))
+
+    scan = scan_file_structure(str(test_file), chunk_size=8)
+
+    assert scan["encoding_error"] is None
+    assert scan["encoding"] is not None
+    assert scan["has_content"] is True
+    assert scan["line_count"] == 3
+    assert scan["sample"] == "nom;ville\nAlice;Évry\nBob;Lyon"
+
+def test_scan_file_structure_empty_content(tmp_path):
+    test_file = tmp_path / "blank.csv"
+    test_file.write_text("\n \r\t\n\n    ")
+
+    scan = scan_file_structure(str(test_file))
+
+    assert scan["encoding_error"] is None
+    assert scan["has_content"] is False
+
+    ok, msg = check_file_empty_content(str(test_file), "utf-8")
+    assert ok is False and "vide de contenu" in msg
+
+def test_detect_file_encoding_tiers(tmp_path):
+    ascii_file = tmp_path / "ascii.csv"
+    ascii_file.write_bytes(b"id,name\n1,Alice\n")
+    utf8_file = tmp_path / "utf8.csv"
+    utf8_file.write_bytes("id,ville\n1,Évry\n".encode("utf-8"))
+    bom_file = tmp_path / "bom.csv"
+    bom_file.write_bytes("id,ville\n1,Évry\n".encode("utf-8-sig"))
+    binary_file = tmp_path / "binary.csv"
+    binary_file.write_bytes(b"\x93\xfa\x96\x7b\x00\xff\xfe\xfa\xfb")
+
+    assert detect_file_encoding(str(ascii_file)) == ("ascii", 1.0, None)
+    assert detect_file_encoding(str(utf8_file)) == ("utf-8", 1.0, None)
+    assert detect_file_encoding(str(bom_file)) == ("utf-8-sig", 1.0, None)
+    encoding, confidence, error = detect_file_encoding(str(binary_file))
+    assert encoding is None and error is not None
+
+def test_detect_file_encoding_late_non_utf8_byte(tmp_path):
+    # L'octet latin-1 n'apparaît qu'après plusieurs blocs purement ASCII
+    test_file = tmp_path / "late_latin1.csv"
+    test_file.write_bytes(b"a,b\n" * 100 + "x,\xe9\n".encode("latin-1"))
+
+    scan = scan_file_structure(str(test_file), chunk_size=16)
+
+    assert scan["encoding_error"] is None
+    assert scan["encoding"].lower() not in ("utf-8", "ascii")
+    assert scan["line_count"] == 101
+
+
+def test_iter_csv_files_recursive_globs(tmp_path):
+    for relative_path in ["top.csv", "2024-01/a.CSV", "2024-01/notes.txt", "2024-01/tmp_b.csv", "2024-02/c.csv", "archive/old.csv"]:
+        path = tmp_path / relative_path
+        path.parent.mkdir(exist_ok=True)
+        path.write_text("id\n1\n", encoding="utf-8")
+
+    def found(**options):
+        return sorted(os.path.relpath(filepath, tmp_path).replace(os.sep, "/") for filepath, _ in iter_csv_files(str(tmp_path), **options))
+
+    assert found() == ["2024-01/a.CSV", "2024-01/tmp_b.csv", "2024-02/c.csv", "archive/old.csv", "top.csv"]
+    assert found(exclude=["archive", "tmp_*"]) == ["2024-01/a.CSV", "2024-02/c.csv", "top.csv"]
+    assert found(include=["2024-*/*.csv"]) == ["2024-01/a.CSV", "2024-01/tmp_b.csv", "2024-02/c.csv"]
+    assert found(recursive=False) == ["top.csv"]
+    assert get_csv_files_in_directory(str(tmp_path)) == [str(tmp_path / "top.csv")]
+    assert dict(iter_csv_files(str(tmp_path), recursive=False)) == {str(tmp_path / "top.csv"): len("id\n1\n")}
+
+
+def test_compressed_file_detected_by_magic_bytes(tmp_path):
+    # Octet non UTF-8 au-delà du premier bloc : la détection relit le flux décompressé (retour en arrière)
+    content = ("id,ville\n" + "".join(f"{i},Lyon\n" for i in range(2000)) + "2000,Orl\xe9ans\n").encode("latin-1")
+    renamed = tmp_path / "export.dat"
+    renamed.write_bytes(gzip.compress(content))
+
+    assert detect_compression(str(renamed)) == "gzip"
+    with open_decompressed(str(renamed)) as f:
+        assert f.read() == content
+    scan = scan_file_structure(str(renamed), chunk_size=1024)
+    assert scan["encoding"] is not None and scan["encoding"].lower() != "utf-8"
+    assert scan["line_count"] == 2002 and scan["has_content"]
+    assert check_file_extension("export.csv.gz") == (True, None)
+
+
+def test_detect_csv_dialect_quote_aware():
+    # Virgules et sauts de ligne cités : le point-virgule reste le seul délimiteur cohérent
+    quoted = 'id;adresse;montant\r\n1;"12, rue de la Paix";3,5\r\n2;"Bât. B\r\n4, allée des Pins";4,2\r\n3;"Lyon";5,0\r\n'
+    dialect, error = detect_csv_dialect("", "utf-8", sample=quoted, sample_complete=True)
+    assert error is None
+    assert dialect["delimiter"] == ";" and dialect["consistency"] == 1.0
+    assert (dialect["quotechar"], dialect["escapechar"], dialect["doublequote"]) == ('"', None, True)
+    assert dialect["lineterminator"] == "\r\n" and dialect["has_header"] is True
+
+    escaped = 'nom|citation\n"Alice"|"Elle dit \\"oui\\"|non"\n"Bob"|"rien"\n'
+    dialect, error = detect_csv_dialect("", "utf-8", sample=escaped)
+    assert (dialect["delimiter"], dialect["escapechar"], dialect["doublequote"]) == ("|", "\\", False)
+
+    dialect, error = detect_csv_dialect("", "utf-8", sample="1,2.5,3\n4,5.5,6\n7,8.5,9\n", max_lines=2)
+    assert dialect["delimiter"] == "," and dialect["has_header"] is False and dialect["lines_examined"] == 2
+
+    dialect, error = detect_csv_dialect("", "utf-8", sample="\n \n")
+    assert error is not None
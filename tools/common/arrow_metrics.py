@@ -0,0 +1,80 @@
+# VeriQual/tools/common/arrow_metrics.py
+
+import pandas as pd
+from typing import Any, Dict, Optional, Tuple
+
+try: # Dépendance optionnelle : moteur Arrow (chargement et métriques natives)
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = pc = None
+
+
+def arrow_column(col_data: pd.Series) -> Optional["pa.ChunkedArray"]:
+    """
+    Tableau Arrow sous-jacent d'une colonne chargée par le moteur Arrow (dtype pd.ArrowDtype),
+    sans copie ; None pour une colonne pandas/NumPy classique.
+    """
+    if pa is None or not isinstance(col_data.dtype, pd.ArrowDtype):
+        return None
+    return col_data.array.__arrow_array__()
+
+
+def _as_float(scalar: Any) -> float:
+    value = scalar.as_py() if hasattr(scalar, "as_py") else scalar
+    return float(value) if value is not None else float('nan')
+
+
+def arrow_distinct_count(array: "pa.ChunkedArray") -> int:
+    """Nombre de valeurs distinctes, la valeur nulle comptant pour une (comme nunique(dropna=False))."""
+    return int(pc.count_distinct(array, mode="all").as_py())
+
+
+def arrow_numeric_stats(array: "pa.ChunkedArray") -> Dict[str, float]:
+    """
+    min, max, mean, std (ddof=1) et quartiles (interpolation linéaire, comme pandas) d'une
+    colonne numérique ; NaN pour une colonne sans valeur.
+    """
+    min_max = pc.min_max(array)
+    quantiles = pc.quantile(array, q=[0.5, 0.25, 0.75], interpolation="linear").to_pylist() if array.null_count < len(array) else []
+    median, q1, q3 = [float(q) for q in quantiles] if quantiles else [float('nan')] * 3
+    return {
+        "min": _as_float(min_max["min"]),
+        "max": _as_float(min_max["max"]),
+        "mean": _as_float(pc.mean(array)),
+        "std": _as_float(pc.stddev(array, ddof=1)),
+        "median": median,
+        "q1": q1,
+        "q3": q3,
+    }
+
+
+def arrow_value_counts(array: "pa.ChunkedArray") -> pd.Series:
+    """
+    Nombre d'occurrences des valeurs non nulles, par ordre décroissant (ex aequo dans l'ordre
+    de première apparition, comme Series.value_counts). Seules les valeurs distinctes sont
+    converties en objets Python.
+    """
+    counts = pc.value_counts(array.drop_null())
+    if len(counts) == 0:
+        return pd.Series(dtype='int64')
+    # Tri stable : l'ordre de première apparition départage les ex aequo
+    order = pc.array_sort_indices(counts.field("counts"), order="descending")
+    counts = counts.take(order)
+    return pd.Series(counts.field("counts").to_numpy(), index=counts.field("values").to_pylist(), dtype='int64')
+
+
+def arrow_datetime_bounds(array: "pa.ChunkedArray") -> Tuple[Optional[str], Optional[str]]:
+    """Dates minimale et maximale (format de pd.Timestamp), ou (None, None) sans valeur."""
+    min_max = pc.min_max(array)
+    if min_max["min"].as_py() is None:
+        return None, None
+    return str(pd.Timestamp(min_max["min"].as_py())), str(pd.Timestamp(min_max["max"].as_py()))
+
+
+def arrow_distinct_strings(array: "pa.ChunkedArray") -> "pa.Array":
+    """Valeurs distinctes non nulles d'une colonne, converties en texte (recherche de motifs)."""
+    distinct = pc.unique(array.drop_null())
+    if not pa.types.is_string(distinct.type) and not pa.types.is_large_string(distinct.type):
+        distinct = pc.cast(distinct, pa.string())
+    return distinct
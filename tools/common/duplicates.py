@@ -0,0 +1,298 @@
+# VeriQual/tools/common/duplicates.py
+
+import os
+import shutil
+import tempfile
+import weakref
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional, Tuple
+from tools.common.hashing import hash_dataframe_rows
+
+# Nombre de bits de tête de l'empreinte utilisés pour répartir les empreintes déversées
+SPILL_PARTITION_BITS = 6
+# Profondeur maximale de re-partitionnement d'une partition encore trop volumineuse
+SPILL_MAX_DEPTH = 4
+# En deçà de cet effectif, une partition est toujours dédupliquée en mémoire (1 Mo en 128 bits)
+SPILL_MIN_PARTITION_RECORDS = 1 << 16
+
+# Empreintes d'un ensemble de lignes : mot principal et, en mode 128 bits, second mot aligné
+Fingerprints = Tuple[np.ndarray, Optional[np.ndarray]]
+
+
+def _sort_fingerprints(high: np.ndarray, low: Optional[np.ndarray]) -> Fingerprints:
+    """Trie des empreintes (mot principal, puis second mot)."""
+    if low is None:
+        return np.sort(high), None
+    order = np.lexsort((low, high))
+    return high[order], low[order]
+
+
+def _unique_fingerprints(high: np.ndarray, low: Optional[np.ndarray]) -> Fingerprints:
+    """Empreintes distinctes, triées."""
+    if low is None:
+        return np.unique(high), None
+    high, low = _sort_fingerprints(high, low)
+    keep = np.ones(len(high), dtype=bool)
+    keep[1:] = (high[1:] != high[:-1]) | (low[1:] != low[:-1])
+    return high[keep], low[keep]
+
+
+class _FingerprintSpill:
+    """
+    Empreintes déversées sur disque, réparties en 2**SPILL_PARTITION_BITS fichiers selon leurs
+    bits de tête : deux lignes identiques tombent toujours dans la même partition, qui peut
+    donc être dédupliquée indépendamment des autres.
+    """
+
+    def __init__(self, two_words: bool, spill_dir: Optional[str] = None):
+        self.two_words = two_words
+        self.directory = tempfile.mkdtemp(prefix="veriqual_duplicates_", dir=spill_dir)
+        self.counts = np.zeros(1 << SPILL_PARTITION_BITS, dtype=np.int64)
+        # Suppression du répertoire même si l'accumulateur est abandonné avant result()
+        self._finalizer = weakref.finalize(self, shutil.rmtree, self.directory, True)
+
+    def _path(self, partition: int, depth: int = 0) -> str:
+        return os.path.join(self.directory, f"d{depth}_p{partition}.bin")
+
+    def _write(self, high: np.ndarray, low: Optional[np.ndarray], bits: int, depth: int) -> np.ndarray:
+        """Ajoute des empreintes aux fichiers de partition ; retourne l'effectif écrit par partition."""
+        shift = np.uint64(64 - (depth + 1) * SPILL_PARTITION_BITS)
+        partitions = ((high >> shift) & np.uint64((1 << bits) - 1)).astype(np.int64)
+        order = np.argsort(partitions, kind='stable')
+        counts = np.bincount(partitions, minlength=1 << bits)
+        bounds = np.concatenate([[0], np.cumsum(counts)])
+        for partition in np.flatnonzero(counts):
+            selected = order[bounds[partition]:bounds[partition + 1]]
+            records = high[selected] if low is None else np.column_stack((high[selected], low[selected]))
+            with open(self._path(partition, depth), 'ab') as f:
+                records.tofile(f)
+        return counts
+
+    def write(self, high: np.ndarray, low: Optional[np.ndarray]) -> None:
+        """Déverse des empreintes (déjà distinctes au sein de l'appel)."""
+        if len(high):
+            self.counts += self._write(high, low, SPILL_PARTITION_BITS, 0)
+
+    def append_from(self, other: "_FingerprintSpill") -> None:
+        """Ajoute les partitions d'un autre déversement (fusion d'accumulateurs)."""
+        for partition in np.flatnonzero(other.counts):
+            with open(other._path(partition), 'rb') as source, open(self._path(partition), 'ab') as target:
+                shutil.copyfileobj(source, target)
+        self.counts += other.counts
+
+    def _read(self, path: str) -> Fingerprints:
+        records = np.fromfile(path, dtype=np.uint64)
+        os.remove(path)
+        if not self.two_words:
+            return records, None
+        records = records.reshape(-1, 2)
+        return records[:, 0].copy(), records[:, 1].copy()
+
+    def _partition_duplicates(self, path: str, count: int, depth: int, memory_budget_bytes: int) -> int:
+        record_bytes = 16 if self.two_words else 8
+        high, low = self._read(path)
+        # Partition trop volumineuse pour le budget : nouvelle répartition sur les bits suivants
+        if (count > SPILL_MIN_PARTITION_RECORDS and count * record_bytes > memory_budget_bytes
+                and depth + 1 < SPILL_MAX_DEPTH):
+            sub_counts = self._write(high, low, SPILL_PARTITION_BITS, depth + 1)
+            del high, low
+            duplicates = 0
+            for partition in np.flatnonzero(sub_counts):
+                # Sous-fichiers consommés avant de passer à la partition suivante : noms réutilisables
+                sub_path = self._path(partition, depth + 1)
+                duplicates += self._partition_duplicates(sub_path, int(sub_counts[partition]), depth + 1, memory_budget_bytes)
+            return duplicates
+        return count - len(_unique_fingerprints(high, low)[0])
+
+    def count_duplicates(self, memory_budget_bytes: int) -> int:
+        """Nombre d'empreintes en double, partition par partition (les fichiers sont consommés)."""
+        duplicates = 0
+        for partition in np.flatnonzero(self.counts):
+            duplicates += self._partition_duplicates(self._path(partition), int(self.counts[partition]), 0, memory_budget_bytes)
+        self.counts[:] = 0
+        return duplicates
+
+    def cleanup(self) -> None:
+        self._finalizer()
+
+
+class DuplicateRowAccumulator:
+    """
+    Accumulateur fusionnable de détection des lignes dupliquées (F-06) pour le mode streaming.
+
+    Les empreintes déjà rencontrées sont conservées en séries triées (« runs »), fusionnées
+    deux à deux lorsque leurs tailles deviennent comparables : la recherche d'une empreinte
+    coûte O(log n) par run et le nombre de runs reste logarithmique.
+
+    Avec un budget mémoire, les empreintes sont déversées sur disque dès que les runs le
+    dépassent : chaque bloc n'est alors dédupliqué qu'en interne, puis ses empreintes distinctes
+    sont réparties par hachage dans des fichiers de partition, dédupliqués un à un en fin
+    d'analyse. Le décompte reste exact (aux collisions d'empreintes près : probabilité de
+    l'ordre de n² / 2**65 en 64 bits, négligeable en 128 bits).
+    """
+
+    def __init__(self, fingerprint_bits: int = 64, memory_budget_bytes: Optional[int] = None,
+                 spill_dir: Optional[str] = None):
+        if fingerprint_bits not in (64, 128):
+            raise ValueError(f"Taille d'empreinte invalide : {fingerprint_bits} (attendu 64 ou 128).")
+        self.fingerprint_bits = fingerprint_bits
+        self.memory_budget_bytes = memory_budget_bytes
+        self.spill_dir = spill_dir
+        self.total_rows = 0
+        self.duplicate_count = 0
+        self._runs: List[Fingerprints] = []
+        self._run_bytes = 0
+        self._spill: Optional[_FingerprintSpill] = None
+
+    @property
+    def spilled(self) -> bool:
+        """Indique si des empreintes ont été déversées sur disque."""
+        return self._spill is not None
+
+    def fingerprint(self, df: pd.DataFrame) -> Fingerprints:
+        """Empreintes des lignes d'un bloc (second mot indépendant en mode 128 bits)."""
+        low = hash_dataframe_rows(df, seed=1) if self.fingerprint_bits == 128 else None
+        return hash_dataframe_rows(df), low
+
+    def _contains(self, high: np.ndarray, low: Optional[np.ndarray]) -> np.ndarray:
+        """Indique, pour chaque empreinte, si elle a déjà été rencontrée."""
+        seen = np.zeros(len(high), dtype=bool)
+        for run_high, run_low in self._runs:
+            left = np.searchsorted(run_high, high, side='left')
+            if low is None:
+                positions = np.minimum(left, len(run_high) - 1)
+                seen |= run_high[positions] == high
+                continue
+            right = np.searchsorted(run_high, high, side='right')
+            # Cas courant : au plus une empreinte du run partage le mot principal
+            single = right - left == 1
+            seen[single] |= run_low[left[single]] == low[single]
+            for index in np.flatnonzero(right - left > 1):
+                seen[index] |= bool(np.any(run_low[left[index]:right[index]] == low[index]))
+        return seen
+
+    def _add_run(self, high: np.ndarray, low: Optional[np.ndarray]) -> None:
+        self._runs.append((high, low))
+        self._run_bytes += high.nbytes + (low.nbytes if low is not None else 0)
+        # Fusion à la manière d'un compteur binaire : runs de tailles décroissantes
+        while len(self._runs) > 1 and len(self._runs[-2][0]) <= 2 * len(self._runs[-1][0]):
+            last_high, last_low = self._runs.pop()
+            previous_high, previous_low = self._runs[-1]
+            # Runs disjoints : la concaténation triée suffit
+            merged_low = None if low is None else np.concatenate([previous_low, last_low])
+            self._runs[-1] = _sort_fingerprints(np.concatenate([previous_high, last_high]), merged_low)
+        if self.memory_budget_bytes is not None and self._run_bytes > self.memory_budget_bytes:
+            self._spill_runs()
+
+    def _spill_runs(self) -> None:
+        """Déverse toutes les empreintes conservées en mémoire et passe en mode disque."""
+        if self._spill is None:
+            self._spill = _FingerprintSpill(self.fingerprint_bits == 128, self.spill_dir)
+        for high, low in self._runs:
+            self._spill.write(high, low)
+        self._runs = []
+        self._run_bytes = 0
+
+    def update_fingerprints(self, high: np.ndarray, low: Optional[np.ndarray] = None) -> None:
+        """Intègre les empreintes d'un bloc de lignes."""
+        self.total_rows += len(high)
+        if len(high) == 0:
+            return
+        unique_high, unique_low = _unique_fingerprints(high, low)
+        if self._spill is not None:
+            # Mode disque : doublons internes au bloc comptés tout de suite, les autres en fin d'analyse
+            self.duplicate_count += len(high) - len(unique_high)
+            self._spill.write(unique_high, unique_low)
+            return
+        new = ~self._contains(unique_high, unique_low) if self._runs else np.ones(len(unique_high), dtype=bool)
+        # Toute ligne qui n'introduit pas une nouvelle empreinte est un doublon
+        self.duplicate_count += len(high) - int(new.sum())
+        if new.any():
+            self._add_run(unique_high[new], None if unique_low is None else unique_low[new])
+
+    def update(self, df: pd.DataFrame) -> None:
+        """Intègre un bloc de lignes."""
+        self.update_fingerprints(*self.fingerprint(df))
+
+    def merge(self, other: "DuplicateRowAccumulator") -> "DuplicateRowAccumulator":
+        """Fusionne l'accumulateur d'une autre portion du fichier dans celui-ci."""
+        if other.fingerprint_bits != self.fingerprint_bits:
+            raise ValueError("Impossible de fusionner des accumulateurs de tailles d'empreinte différentes.")
+        self.total_rows += other.total_rows
+        self.duplicate_count += other.duplicate_count
+        if other._spill is not None and self._spill is None:
+            self._spill_runs()
+        if self._spill is not None:
+            # Les doublons entre portions seront comptés lors de la déduplication des partitions
+            for high, low in other._runs:
+                self._spill.write(high, low)
+            if other._spill is not None:
+                self._spill.append_from(other._spill)
+            return self
+        # Les runs d'un accumulateur sont disjoints : leur concaténation ne contient aucun doublon
+        for high, low in other._runs:
+            if self._spill is not None:
+                # Budget dépassé en cours de fusion : la suite est déversée sur disque
+                self._spill.write(high, low)
+                continue
+            seen = self._contains(high, low) if self._runs else np.zeros(len(high), dtype=bool)
+            self.duplicate_count += int(seen.sum())
+            if not seen.all():
+                self._add_run(*_sort_fingerprints(high[~seen], None if low is None else low[~seen]))
+        return self
+
+    def to_state(self) -> Dict[str, Any]:
+        """
+        État de l'accumulateur en données simples (compteurs et tableaux d'empreintes des runs).
+
+        Raises:
+            ValueError: Si des empreintes ont été déversées sur disque (fichiers temporaires propres à l'analyse).
+        """
+        if self._spill is not None:
+            raise ValueError("Empreintes déversées sur disque : état non transférable.")
+        return {
+            "fingerprint_bits": self.fingerprint_bits,
+            "total_rows": self.total_rows,
+            "duplicate_count": self.duplicate_count,
+            "runs": [[high, low] for high, low in self._runs],
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any], memory_budget_bytes: Optional[int] = None,
+                   spill_dir: Optional[str] = None) -> "DuplicateRowAccumulator":
+        """
+        Reconstruit un accumulateur à partir de to_state, avec le budget mémoire et le répertoire
+        de déversement de l'analyse en cours.
+
+        Raises:
+            KeyError, TypeError, ValueError: Si l'état est incomplet ou incohérent.
+        """
+        accumulator = cls(int(state["fingerprint_bits"]), memory_budget_bytes, spill_dir)
+        accumulator.total_rows = int(state["total_rows"])
+        accumulator.duplicate_count = int(state["duplicate_count"])
+        two_words = accumulator.fingerprint_bits == 128
+        for high, low in state["runs"]:
+            high = np.asarray(high, dtype=np.uint64)
+            low = np.asarray(low, dtype=np.uint64) if low is not None else None
+            if high.ndim != 1 or (low is not None) != two_words or (low is not None and low.shape != high.shape):
+                raise ValueError("Empreintes de doublons incohérentes avec leur taille.")
+            accumulator._runs.append((high, low))
+            accumulator._run_bytes += high.nbytes + (low.nbytes if low is not None else 0)
+        return accumulator
+
+    def result(self) -> Tuple[int, float]:
+        """
+        Les partitions déversées sont consommées au premier appel : l'accumulateur ne doit
+        plus recevoir de blocs ensuite.
+
+        Returns:
+            Tuple[int, float]: Nombre de doublons et ratio des doublons.
+        """
+        if self._spill is not None:
+            self.duplicate_count += self._spill.count_duplicates(self.memory_budget_bytes)
+            self._spill.cleanup()
+            self._spill = None
+        if self.total_rows == 0:
+            return 0, 0.0
+        return self.duplicate_count, round(float(self.duplicate_count) / self.total_rows, 4)
@@ -1,9 +1,73 @@
 import os
+import io
+import bz2
+import gzip
+import lzma
+import codecs
 import chardet
+import re
 import csv
+import fnmatch
+import numpy as np
 import pandas as pd
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Dict, Any, Iterator, Iterable, Callable
+from collections import Counter
 from io import StringIO # Ajout pour lire des échantillons avec pandas
+from functools import lru_cache
+
+try: # Dépendance optionnelle : lecteur CSV multithread du moteur Arrow
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = pa_csv = None
+
+try: # Dépendance optionnelle : décompression des fichiers .zst
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Moteurs de chargement de load_dataframe_robustly
+LOAD_ENGINES = ("pandas", "arrow")
+# Valeurs lues comme manquantes par pandas (na_values par défaut), reprises par le moteur Arrow
+PANDAS_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+]
+# Chargement optimisé en mémoire : nombre de lignes lues pour choisir les dtypes compacts
+MEMORY_SAMPLE_ROWS = 10_000
+# Une colonne texte devient catégorielle si, dans l'échantillon, son nombre de valeurs distinctes
+# ne dépasse pas cette proportion de ses valeurs non nulles
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+# Dtypes entiers candidats à la réduction, du plus compact au plus large (nullable, NumPy)
+_INTEGER_DTYPES = (("Int8", np.int8), ("Int16", np.int16), ("Int32", np.int32), ("Int64", np.int64))
+# Formats de compression reconnus (noms de l'option compression de pandas) : signature en tête
+# de fichier et extension usuelle
+COMPRESSION_MAGIC_BYTES = (
+    (b'\x1f\x8b', 'gzip'),
+    (b'BZh', 'bz2'),
+    (b'\xfd7zXZ\x00', 'xz'),
+    (b'\x28\xb5\x2f\xfd', 'zstd'),
+)
+COMPRESSION_EXTENSIONS = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'xz', '.zst': 'zstd'}
+# Motifs des fichiers CSV d'un répertoire, compressés ou non
+CSV_FILE_PATTERNS = ("*.csv",) + tuple(f"*.csv{extension}" for extension in COMPRESSION_EXTENSIONS)
+# Détection du dialecte : délimiteurs candidats (par ordre de préférence à égalité, le point-virgule
+# d'abord, cas courant en France), délimiteur de dernier recours, nombre de lignes examinées et
+# taille de l'échantillon décodé (en caractères) à conserver pour les couvrir
+DIALECT_DELIMITERS = (';', ',', '\t', '|')
+DIALECT_FALLBACK_DELIMITER = ' '
+DIALECT_SAMPLE_LINES = 200
+DIALECT_SAMPLE_CHARS = 64 * 1024
+# Lignes lues pour décider de la présence d'un en-tête
+_HEADER_SAMPLE_ROWS = 20
+# Validation préalable : nombre de lignes de données contrôlées avant le chargement complet, et
+# proportion de lignes que le chargement écarterait au-delà de laquelle l'audit s'arrête
+PREFIX_VALIDATION_ROWS = 1000
+PREFIX_MAX_RAGGED_RATIO = 0.5
+# Numéros des premières lignes irrégulières cités dans le rapport
+_RAGGED_LINES_REPORTED = 10
+_NUMERIC_VALUE = re.compile(r"[+-]?(?:\d+(?:[.,]\d*)?|[.,]\d+)(?:[eE][+-]?\d+)?")
+_LINE_BREAK = re.compile(r"\r\n|\r|\n")
 
 def check_file_exists(filepath: str) -> Tuple[bool, Optional[str]]:
     """Vérifie si un fichier existe."""
@@ -18,8 +82,8 @@ def check_file_readable(filepath: str) -> Tuple[bool, Optional[str]]:
     return True, None
 
 def check_file_extension(filepath: str, expected_extension: str = '.csv') -> Tuple[bool, Optional[str]]:
-    """Vérifie si l'extension du fichier correspond à celle attendue."""
-    _, ext = os.path.splitext(filepath)
+    """Vérifie si l'extension du fichier (hors extension de compression, ex. ".csv.gz") correspond à celle attendue."""
+    _, ext = os.path.splitext(split_compression_extension(filepath)[0])
     if ext.lower() != expected_extension.lower():
         return False, f"L'extension du fichier '{ext}' ne correspond pas à l'extension attendue '{expected_extension}'."
     return True, None
@@ -30,16 +94,132 @@ def check_file_not_empty(filepath: str) -> Tuple[bool, Optional[str]]:
         return False, f"Le fichier '{filepath}' est vide (0 octet)."
     return True, None
 
+def split_compression_extension(filepath: str) -> Tuple[str, Optional[str]]:
+    """Sépare l'extension de compression d'un chemin : "a.csv.gz" -> ("a.csv", "gzip") ; ("a.csv", None) sinon."""
+    root, ext = os.path.splitext(filepath)
+    compression = COMPRESSION_EXTENSIONS.get(ext.lower())
+    return (root, compression) if compression else (filepath, None)
+
+def detect_compression(filepath: str) -> Optional[str]:
+    """
+    Format de compression d'un fichier, reconnu à sa signature (et non à son extension) :
+    "gzip", "bz2", "xz" ou "zstd", None pour un fichier non compressé.
+    """
+    with open(filepath, 'rb') as f:
+        head = f.read(max(len(magic) for magic, _ in COMPRESSION_MAGIC_BYTES))
+    for magic, compression in COMPRESSION_MAGIC_BYTES:
+        if head.startswith(magic):
+            return compression
+    return None
+
+class _ZstdReader(io.RawIOBase):
+    """
+    Décompression zstd en flux (paquet zstandard). Le flux ne se relit pas à rebours : un
+    retour en arrière reprend la décompression au début du fichier, comme le module gzip.
+    """
+
+    def __init__(self, filepath: str):
+        self._filepath = filepath
+        self._open()
+
+    def _open(self) -> None:
+        self._file = open(self._filepath, 'rb')
+        self._reader = zstandard.ZstdDecompressor().stream_reader(self._file, read_across_frames=True)
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        size = self._reader.readinto(buffer)
+        self._position += size
+        return size
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("Positionnement depuis la fin impossible dans un flux zstd.")
+        if offset < self._position:
+            self._reader.close()
+            self._file.close()
+            self._open()
+        while self._position < offset:
+            skipped = self._reader.read(min(1024 * 1024, offset - self._position))
+            if not skipped:
+                break
+            self._position += len(skipped)
+        return self._position
+
+    def close(self) -> None:
+        if not self.closed:
+            self._reader.close()
+            self._file.close()
+        super().close()
+
+def open_decompressed(filepath: str, compression: Optional[str] = None) -> io.BufferedIOBase:
+    """
+    Ouvre un fichier en lecture binaire, décompressé à la volée s'il est compressé : rien n'est
+    écrit sur le disque et la mémoire consommée ne dépend pas de la taille du fichier.
+
+    Args:
+        filepath (str): Chemin d'accès au fichier.
+        compression (Optional[str]): Format déjà connu (voir detect_compression) ; détecté sinon.
+
+    Raises:
+        ImportError: Pour un fichier zstd si le paquet zstandard n'est pas installé.
+    """
+    if compression is None:
+        compression = detect_compression(filepath)
+    if compression == 'gzip':
+        return gzip.open(filepath, 'rb')
+    if compression == 'bz2':
+        return bz2.open(filepath, 'rb')
+    if compression == 'xz':
+        return lzma.open(filepath, 'rb')
+    if compression == 'zstd':
+        if zstandard is None:
+            raise ImportError("La lecture des fichiers zstd nécessite le paquet zstandard, qui n'est pas installé.")
+        return io.BufferedReader(_ZstdReader(filepath))
+    return open(filepath, 'rb')
+
+def _open_decompressed_text(filepath: str, encoding: str) -> io.TextIOBase:
+    return io.TextIOWrapper(open_decompressed(filepath), encoding=encoding, errors='ignore')
+
+# Encodages signalés par un BOM. UTF-32 est testé avant UTF-16 car le BOM UTF-32 LE
+# commence par celui d'UTF-16 LE.
+BOM_ENCODINGS = [
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+# Encodages de repli courants, dans l'ordre de priorité historique
+COMMON_FALLBACK_ENCODINGS = ['utf-8', 'latin-1', 'windows-1252']
+
+# Octets ASCII considérés comme des blancs par str.strip()
+_ASCII_WHITESPACE = b' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f'
+
+
 def detect_file_encoding(filepath: str, sample_size: int = 10240) -> Tuple[Optional[str], Optional[float], Optional[str]]:
     """
-    Détecte l'encodage d'un fichier en lisant un échantillon.
-    Cette version est plus robuste et intègre un mécanisme de repli.
-    Elle tente d'abord de lire l'intégralité du fichier avec l'encodage détecté par chardet.
-    Si cela échoue, elle passe à une liste d'encodages courants.
+    Détecte l'encodage d'un fichier par paliers, sans jamais décoder le fichier entier en mémoire.
+
+    Les paliers (BOM, validation ASCII/UTF-8 sur les octets bruts, décodage incrémental
+    des candidats avec sortie anticipée, chardet en dernier recours) sont décrits dans
+    scan_file_structure, qui réalise la détection en une seule lecture.
 
     Args:
         filepath (str): Chemin d'accès au fichier.
-        sample_size (int): Taille de l'échantillon à lire en octets.
+        sample_size (int): Taille de l'échantillon soumis à chardet, en octets.
 
     Returns:
         Tuple[Optional[str], Optional[float], Optional[str]]:
@@ -47,158 +227,614 @@ def detect_file_encoding(filepath: str, sample_size: int = 10240) -> Tuple[Optio
             - confiance de la détection (float entre 0 et 1)
             - message d'erreur si l'encodage est indétectable
     """
-    # Liste des encodages de repli courants
-    common_encodings = ['utf-8', 'latin-1', 'windows-1252']
+    scan = scan_file_structure(filepath, sample_size=sample_size)
+    return scan["encoding"], scan["encoding_confidence"], scan["encoding_error"]
+
+def check_file_empty_content(filepath: str, encoding: Optional[str] = None) -> Tuple[bool, Optional[str]]:
+    """
+    Vérifie si le contenu d'un fichier CSV est sémantiquement vide (seulement des espaces, lignes vides).
+
+    La vérification est réalisée par scan_file_structure, au cours de sa lecture unique du fichier.
 
+    Args:
+        filepath (str): Chemin d'accès au fichier.
+        encoding (Optional[str]): Conservé pour compatibilité ; l'encodage est déterminé par le scan.
+
+    Returns:
+        Tuple[bool, Optional[str]]: (True, None) si le fichier a un contenu significatif,
+            sinon (False, message d'erreur).
+    """
+    scan = scan_file_structure(filepath)
+    if scan["encoding_error"]:
+        return False, f"Erreur lors de la vérification du contenu vide : {scan['encoding_error']}"
+    if not scan["has_content"]:
+        return False, "Le fichier est vide de contenu significatif (seulement des espaces ou lignes vides)."
+    return True, None
+
+
+@lru_cache(maxsize=None)
+def _is_total_codec(encoding: str) -> bool:
+    """Indique si un encodage mono-octet décode n'importe quelle suite d'octets (ex: latin-1)."""
     try:
-        # Tenter la détection initiale avec chardet sur un échantillon
-        with open(filepath, 'rb') as f:
-            raw_data = f.read(sample_size)
-        
-        result = chardet.detect(raw_data)
-        detected_encoding_chardet = result['encoding']
-        confidence = result['confidence']
-        
-        # Premièrement, tenter de lire le fichier en entier avec l'encodage suggéré par chardet
-        if detected_encoding_chardet:
-            try:
-                with open(filepath, 'r', encoding=detected_encoding_chardet) as f:
-                    f.read()
-                # Si la lecture réussit, on retourne cet encodage
-                return detected_encoding_chardet, confidence, None
-            except UnicodeDecodeError:
-                # Si la lecture échoue malgré la suggestion de chardet, on continue le repli
-                pass
-
-        # Si l'encodage de chardet a échoué, on utilise le mécanisme de repli
-        for enc in common_encodings:
-            if enc == detected_encoding_chardet:
-                continue # Éviter de retester un encodage qui vient d'échouer
-            try:
-                # Tenter de lire le fichier en entier avec un encodage de la liste
-                with open(filepath, 'r', encoding=enc) as f:
-                    f.read()
-                return enc, 1.0, None # Retourner cet encodage avec une confiance élevée
-            except UnicodeDecodeError:
-                continue # Continuer au prochain encodage si celui-ci échoue
-        
-        # Si aucun encodage de repli n'a fonctionné
-        return None, None, "Encodage indétectable après toutes les tentatives."
-            
-    except Exception as e:
-        return None, None, f"Erreur lors de la détection de l'encodage : {e}"
+        return len(bytes(range(256)).decode(encoding)) == 256
+    except (UnicodeDecodeError, LookupError):
+        return False
+
+@lru_cache(maxsize=None)
+def _is_ascii_compatible(encoding: str) -> bool:
+    """Indique si les octets ASCII ont la même signification dans cet encodage."""
+    try:
+        return b'\n a;'.decode(encoding) == '\n a;'
+    except (UnicodeDecodeError, LookupError):
+        return False
+
+def _detect_bom(head: bytes) -> Optional[str]:
+    """Retourne l'encodage signalé par le BOM en tête de fichier, s'il existe."""
+    for bom, encoding in BOM_ENCODINGS:
+        if head.startswith(bom):
+            return encoding
+    return None
 
-def check_file_empty_content(filepath: str, encoding: str) -> Tuple[bool, Optional[str]]:
+def _build_encoding_candidates(encodings: List[Tuple[Optional[str], Optional[float]]], excluded: Optional[set] = None) -> List[Dict[str, Any]]:
     """
-    Vérifie si le contenu d'un fichier CSV est sémantiquement vide (seulement des espaces, lignes vides).
+    Construit la liste ordonnée des candidats (un décodeur incrémental strict par encodage).
+    Les doublons (ex: 'latin-1' / 'ISO-8859-1') et les encodages exclus sont ignorés.
+    """
+    candidates = []
+    seen_codecs = set(excluded or ())
+    for enc, confidence in encodings:
+        if not enc:
+            continue
+        try:
+            codec_name = codecs.lookup(enc).name
+        except LookupError:
+            continue
+        if codec_name in seen_codecs:
+            continue
+        seen_codecs.add(codec_name)
+        candidates.append({
+            "encoding": enc,
+            "codec_name": codec_name,
+            "confidence": confidence,
+            "decoder": codecs.getincrementaldecoder(enc)(errors='strict'),
+            "alive": True,
+            "has_content": False,
+        })
+    return candidates
+
+def _feed_encoding_candidates(candidates: List[Dict[str, Any]], chunk: bytes, final: bool = False) -> None:
+    """
+    Décode un bloc avec chaque candidat encore en lice et élimine ceux qui échouent.
+    Dès que le candidat prioritaire ne peut plus échouer (encodage « total »),
+    les candidats suivants ne sont plus décodés : le verdict est acquis.
+    """
+    for candidate in candidates:
+        if not candidate["alive"]:
+            continue
+        try:
+            text = candidate["decoder"].decode(chunk, final=final)
+        except UnicodeDecodeError:
+            candidate["alive"] = False
+            continue
+        if not candidate["has_content"] and text.strip():
+            candidate["has_content"] = True
+        if _is_total_codec(candidate["codec_name"]):
+            break
+
+def _chosen_candidate(candidates: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Retourne le candidat prioritaire encore en lice."""
+    return next((c for c in candidates if c["alive"]), None)
+
+def scan_file_structure(
+    filepath: str,
+    sample_size: int = 10240,
+    text_sample_size: int = 4096,
+    chunk_size: int = 1024 * 1024
+) -> Dict[str, Any]:
     """
+    Réalise les contrôles structurels F-01 en une seule lecture séquentielle du fichier.
+
+    Un fichier compressé (gzip, bz2, xz, zstd) est décompressé à la volée : les contrôles
+    portent sur son contenu, le nombre de lignes et les positions sur les octets décompressés.
+
+    Le fichier est lu par blocs de `chunk_size` octets (mémoire constante quelle que soit sa taille),
+    ce qui permet d'obtenir en une passe :
+        - le verdict d'encodage,
+        - la vérification de contenu vide (seulement des espaces ou lignes vides),
+        - le nombre de lignes,
+        - l'échantillon texte utilisé pour la détection du séparateur.
+
+    L'encodage est déterminé par paliers, du moins coûteux au plus coûteux :
+        1. BOM en tête de fichier (UTF-8-SIG, UTF-16, UTF-32).
+        2. Validation des octets bruts : les blocs purement ASCII ne sont pas décodés ;
+           dès le premier octet non ASCII, un décodeur UTF-8 incrémental valide la suite.
+           Des octets NUL sans BOM signalent un contenu binaire.
+        3. Si UTF-8 échoue, chardet est consulté sur une fenêtre débutant au premier octet
+           non ASCII, puis sa suggestion et les encodages de repli sont validés par décodage
+           incrémental à partir de ce point. Les candidats invalides sont éliminés au fil
+           de l'eau et la validation s'arrête dès que le candidat prioritaire ne peut plus échouer.
+
+    Args:
+        filepath (str): Chemin d'accès au fichier.
+        sample_size (int): Taille de la fenêtre (en octets) soumise à chardet.
+        text_sample_size (int): Nombre de caractères décodés conservés pour le sniffing.
+        chunk_size (int): Taille des blocs lus (en octets, après décompression).
+
+    Returns:
+        Dict[str, Any]: Résultat du scan :
+            - encoding (Optional[str]) : encodage retenu
+            - encoding_confidence (Optional[float]) : confiance de la détection
+            - encoding_error (Optional[str]) : message d'erreur si l'encodage est indétectable
+            - has_content (bool) : False si le fichier ne contient que des espaces/lignes vides
+            - line_count (int) : nombre de lignes du fichier
+            - sample (str) : début du fichier décodé avec l'encodage retenu
+            - sample_complete (bool) : True si l'échantillon contient le fichier entier
+    """
+    result = {
+        "encoding": None,
+        "encoding_confidence": None,
+        "encoding_error": None,
+        "has_content": False,
+        "line_count": 0,
+        "sample": "",
+        "sample_complete": False,
+    }
+
     try:
-        with open(filepath, 'r', encoding=encoding, errors='ignore') as f:
-            content = f.read().strip()
-            if not content:
-                return False, "Le fichier est vide de contenu significatif (seulement des espaces ou lignes vides)."
-            # Vérifier si après suppression des lignes vides et espaces, il ne reste rien
-            lines = [line.strip() for line in content.splitlines() if line.strip()]
-            if not lines:
-                return False, "Le fichier ne contient que des lignes vides ou des espaces."
-        return True, None
+        with open_decompressed(filepath) as f:
+            head = f.read(max(chunk_size, sample_size))
+            raw_sample = head[:text_sample_size * 4] # 4 octets max par caractère
+
+            # Palier 1 : BOM
+            bom_encoding = _detect_bom(head)
+            if bom_encoding:
+                stage = "bom"
+                candidates = _build_encoding_candidates([(bom_encoding, 1.0)])
+            # Palier 2 bis : octets NUL sans BOM, seul un UTF-16/32 proposé par chardet est accepté
+            elif b'\x00' in head[:sample_size]:
+                stage = "chardet"
+                chardet_result = chardet.detect(head[:sample_size])
+                guess = chardet_result['encoding'] or ''
+                if not guess.lower().startswith(('utf-16', 'utf-32')):
+                    result["encoding_error"] = "Encodage indétectable : le fichier contient des octets NUL (contenu binaire)."
+                    return result
+                candidates = _build_encoding_candidates([(guess, chardet_result['confidence'])])
+            # Palier 2 : validation ASCII / UTF-8 sur les octets bruts
+            else:
+                stage = "utf-8"
+                candidates = _build_encoding_candidates([('utf-8', 1.0)])
+
+            non_ascii_offset = None
+            ascii_content = False
+            last_byte = b''
+            offset = 0
+            chunk = head
+            while chunk:
+                chunk_end = offset + len(chunk)
+                result["line_count"] += chunk.count(b'\n')
+                last_byte = chunk[-1:]
+                is_ascii = chunk.isascii()
+
+                # Contenu significatif détecté directement sur les octets ASCII
+                if not ascii_content and is_ascii and chunk.translate(None, _ASCII_WHITESPACE):
+                    ascii_content = True
+
+                if stage == "utf-8" and non_ascii_offset is None and is_ascii:
+                    pass # Bloc purement ASCII : valide pour tout encodage compatible, rien à décoder
+                else:
+                    if stage == "utf-8" and non_ascii_offset is None:
+                        non_ascii_offset = offset
+
+                    chosen = _chosen_candidate(candidates)
+                    content_known = ascii_content or (chosen is not None and chosen["has_content"])
+                    if not (chosen and _is_total_codec(chosen["codec_name"]) and content_known):
+                        _feed_encoding_candidates(candidates, chunk)
+
+                    # Palier 3 : UTF-8 (ou l'encodage du BOM) invalide, recours à chardet
+                    if _chosen_candidate(candidates) is None and stage != "chardet":
+                        restart_offset = non_ascii_offset if stage == "utf-8" else 0
+                        failed_codecs = {c["codec_name"] for c in candidates}
+                        f.seek(restart_offset)
+                        chardet_result = chardet.detect(f.read(sample_size))
+                        candidates = _build_encoding_candidates(
+                            [(chardet_result['encoding'], chardet_result['confidence'])]
+                            + [(enc, 1.0) for enc in COMMON_FALLBACK_ENCODINGS],
+                            excluded=failed_codecs
+                        )
+                        # Rattrapage : revalider la portion déjà lue depuis le premier octet non ASCII
+                        f.seek(restart_offset)
+                        position = restart_offset
+                        while position < chunk_end:
+                            replay = f.read(min(chunk_size, chunk_end - position))
+                            if not replay:
+                                break
+                            _feed_encoding_candidates(candidates, replay)
+                            position += len(replay)
+                        f.seek(chunk_end)
+                        stage = "chardet"
+
+                    if _chosen_candidate(candidates) is None:
+                        result["encoding_error"] = "Encodage indétectable après toutes les tentatives."
+                        return result
+
+                offset = chunk_end
+                chunk = f.read(chunk_size)
+
+        if stage == "utf-8" and non_ascii_offset is None:
+            # Fichier entièrement ASCII
+            result["encoding"] = "ascii"
+            result["encoding_confidence"] = 1.0
+        else:
+            _feed_encoding_candidates(candidates, b'', final=True)
+            chosen = _chosen_candidate(candidates)
+            if chosen is None:
+                result["encoding_error"] = "Encodage indétectable après toutes les tentatives."
+                return result
+            result["encoding"] = chosen["encoding"]
+            result["encoding_confidence"] = chosen["confidence"]
+            ascii_content = ascii_content and _is_ascii_compatible(chosen["codec_name"])
+            result["has_content"] = chosen["has_content"]
+
+        result["has_content"] = result["has_content"] or ascii_content
+
+        # Une dernière ligne sans retour chariot final compte comme une ligne
+        if last_byte and last_byte != b'\n':
+            result["line_count"] += 1
+
+        sample_decoder = codecs.getincrementaldecoder(result["encoding"])(errors='ignore')
+        decoded = sample_decoder.decode(raw_sample, final=len(raw_sample) == offset)
+        result["sample"] = decoded[:text_sample_size]
+        result["sample_complete"] = len(raw_sample) == offset and len(decoded) <= text_sample_size
+        return result
+
     except Exception as e:
-        return False, f"Erreur lors de la vérification du contenu vide : {e}"
+        result["encoding_error"] = f"Erreur lors de la détection de l'encodage : {e}"
+        return result
 
+def _detect_quotechar(sample: str) -> str:
+    """Caractère de citation : celui qui ouvre le plus de champs (après un début de ligne ou un délimiteur)."""
+    boundary = re.escape(''.join(DIALECT_DELIMITERS))
+    counts = {
+        quotechar: len(re.findall(rf"(?:^|[{boundary}]) *{re.escape(quotechar)}", sample, re.MULTILINE))
+        for quotechar in ('"', "'")
+    }
+    return "'" if counts["'"] > counts['"'] else '"'
+
+def _detect_header(rows: List[List[str]]) -> bool:
+    """
+    Présence d'un en-tête : une colonne numérique dont la première valeur ne l'est pas vote pour,
+    une première valeur numérique (ou répétée plus bas dans la colonne) vote contre. Sans
+    indice contraire, l'en-tête est présumé présent.
+    """
+    if len(rows) < 2:
+        return True
+    header, data = rows[0], rows[1:]
+    votes = 0
+    for position, name in enumerate(header):
+        values = [row[position].strip() for row in data if position < len(row) and row[position].strip()]
+        if not values:
+            continue
+        if all(_NUMERIC_VALUE.fullmatch(value) for value in values):
+            votes += -1 if _NUMERIC_VALUE.fullmatch(name.strip()) else 1
+        elif name.strip() in values:
+            votes -= 1
+    return votes >= 0
 
-def detect_csv_separator(filepath: str, encoding: str) -> Tuple[Optional[str], Optional[str]]:
+def detect_csv_dialect(
+    filepath: str,
+    encoding: str,
+    sample: Optional[str] = None,
+    max_lines: int = DIALECT_SAMPLE_LINES,
+    sample_complete: bool = False
+) -> Tuple[Dict[str, Any], Optional[str]]:
     """
-    Détecte le séparateur de colonnes d'un fichier CSV.
-    Si le sniffer détecte un espace et que le fichier semble n'avoir qu'une colonne,
-    tente de trouver un meilleur séparateur parmi les plus courants.
+    Détecte le dialecte d'un fichier CSV en une passe sur ses `max_lines` premières lignes.
+
+    Les champs entre guillemets (doublés ou échappés par une barre oblique inverse) sont d'abord
+    retirés de l'échantillon : un délimiteur ou un saut de ligne cité ne compte pas. Pour chaque
+    délimiteur candidat, le nombre de champs de chaque ligne est ensuite compté ; le délimiteur
+    retenu est celui dont le nombre de champs le plus fréquent (supérieur à 1) est partagé par
+    la plus grande proportion de lignes, puis celui qui donne le plus de champs.
 
     Args:
         filepath (str): Chemin d'accès au fichier.
         encoding (str): Encodage détecté du fichier.
+        sample (Optional[str]): Échantillon déjà décodé (ex: issu de scan_file_structure).
+                                S'il est fourni, le fichier n'est pas relu.
+        max_lines (int): Nombre maximal de lignes examinées.
+        sample_complete (bool): L'échantillon fourni contient le fichier entier (sa dernière
+                                ligne n'est alors pas tronquée).
 
     Returns:
-        Tuple[Optional[str], Optional[str]]: Le séparateur détecté et un message d'erreur si applicable.
+        Tuple[Dict[str, Any], Optional[str]]:
+            - Le dialecte : delimiter, quotechar, escapechar (None si les guillemets sont doublés),
+              doublequote, lineterminator, has_header, consistency (proportion des lignes ayant
+              le nombre de champs retenu) et lines_examined.
+            - Message d'erreur si le délimiteur n'a pas pu être déterminé.
     """
+    dialect = {
+        "delimiter": ',',
+        "quotechar": '"',
+        "escapechar": None,
+        "doublequote": True,
+        "lineterminator": '\n',
+        "has_header": True,
+        "consistency": None,
+        "lines_examined": 0,
+    }
     try:
-        # Lire un échantillon du fichier pour le sniffer et les tentatives de parsing
-        with open(filepath, 'r', encoding=encoding, errors='ignore') as file:
-            sample = file.read(4096) # Lire les 4 premiers Ko
-
-        # 1. Tentative initiale avec csv.Sniffer
-        sniffer = csv.Sniffer()
-        
-        # Délimiteurs à essayer pour le sniffer. Attention, sniff ne gère pas toujours bien les espaces.
-        # On fournit une liste de délimiteurs courants.
-        try:
-            dialect = sniffer.sniff(sample, delimiters=';, |\t')
-            initial_separator = dialect.delimiter
-        except csv.Error:
-            # Si le sniffer échoue, on part sur une virgule par défaut et on tentera les autres
-            initial_separator = ',' 
-            
-        
-        best_separator = initial_separator
-        max_columns = 0
-
-        # Tenter de charger un petit DataFrame avec le séparateur initial pour compter les colonnes
-        try:
-            temp_df_initial = pd.read_csv(StringIO(sample), sep=initial_separator, header=None, nrows=1, encoding=encoding, on_bad_lines='skip')
-            max_columns = temp_df_initial.shape[1]
-        except Exception:
-            # Si le chargement initial échoue, max_columns reste 0
-            pass
-
-        # Si le séparateur initial est un espace et qu'il n'y a qu'une seule colonne,
-        # ou si le sniffer n'a pas trouvé de séparateur clair (max_columns <= 1)
-        # on tente d'autres séparateurs.
-        # On inclut l'initial_separator dans la liste pour s'assurer qu'il est toujours considéré.
-        common_separators = [';', ',', '\t', '|'] 
-        
-        # Assurer que le séparateur initial est dans la liste des tentatives, mais sans le dupliquer
-        if initial_separator not in common_separators:
-            common_separators.insert(0, initial_separator) # Mettre en premier si non présent
-
-        for sep in common_separators:
-            try:
-                # Tenter de charger avec le nouveau séparateur
-                temp_df = pd.read_csv(StringIO(sample), sep=sep, header=None, nrows=1, encoding=encoding, on_bad_lines='skip')
-                current_cols = temp_df.shape[1]
-
-                if current_cols > max_columns:
-                    max_columns = current_cols
-                    best_separator = sep
-                elif current_cols == max_columns and sep == ';':
-                    # Prioriser le point-virgule si même nombre de colonnes (cas courant en France)
-                    best_separator = sep
-            except Exception:
-                # Ignorer les erreurs de parsing pour ce séparateur, passer au suivant
-                pass
-        
-        # Logique de correction :
-        # Si le meilleur résultat est une seule colonne, ce n'est pas une erreur
-        # mais une structure de fichier valide (une colonne sans séparateur).
-        if max_columns == 1:
-            return best_separator, None
-        
-        # Si le meilleur résultat a plus d'une colonne, mais pas de séparateur trouvé (car max_columns reste 1)
-        if max_columns <= 1:
-            return best_separator, "Le séparateur optimal n'a pas pu être clairement déterminé."
-
-        return best_separator, None
+        if sample is None:
+            with _open_decompressed_text(filepath, encoding) as file:
+                sample = file.read(DIALECT_SAMPLE_CHARS)
+                sample_complete = not file.read(1)
+        # Seules les `max_lines` premières lignes (physiques) sont examinées
+        end = -1
+        for _ in range(max_lines):
+            end = sample.find('\n', end + 1)
+            if end < 0:
+                break
+        if end >= 0:
+            sample = sample[:end + 1]
+
+        quotechar = _detect_quotechar(sample)
+        quote = re.escape(quotechar)
+        boundary = re.escape(''.join(DIALECT_DELIMITERS))
+        # Guillemet échappé suivi d'autre chose qu'une fin de champ : échappement par barre oblique inverse
+        escapechar = '\\' if re.search(rf"\\{quote}[^{boundary}\r\n]", sample) else None
+        if escapechar:
+            quoted_field = re.compile(rf"{quote}(?:[^{quote}\\]|\\.)*{quote}", re.DOTALL)
+        else:
+            quoted_field = re.compile(rf"{quote}[^{quote}]*(?:{quote}{quote}[^{quote}]*)*{quote}")
+        dialect.update({
+            "quotechar": quotechar,
+            "escapechar": escapechar,
+            "doublequote": escapechar is None,
+            "lineterminator": '\r\n' if '\r\n' in sample else '\r' if '\r' in sample else '\n',
+        })
+
+        lines = _LINE_BREAK.split(quoted_field.sub('', sample))
+        if len(lines) > 1 and not sample_complete and not sample.endswith(('\n', '\r')):
+            lines.pop() # Dernière ligne tronquée par la fin de l'échantillon
+        lines = [line for line in lines if line.strip()][:max_lines]
+        dialect["lines_examined"] = len(lines)
+        if not lines:
+            return dialect, "Le séparateur optimal n'a pas pu être clairement déterminé."
+
+        best = None
+        for candidates in (DIALECT_DELIMITERS, (DIALECT_FALLBACK_DELIMITER,)):
+            for delimiter in candidates:
+                counts = Counter(line.count(delimiter) for line in lines)
+                modal_count, frequency = max(counts.items(), key=lambda item: (item[1], item[0]))
+                if modal_count == 0:
+                    continue
+                score = (frequency / len(lines), modal_count)
+                if best is None or score > best[0]:
+                    best = (score, delimiter)
+            if best is not None:
+                break
+        if best is None:
+            # Aucun délimiteur : structure valide à une seule colonne
+            dialect["consistency"] = 1.0
+        else:
+            dialect["delimiter"] = best[1]
+            dialect["consistency"] = round(best[0][0], 4)
+
+        reader = csv.reader(
+            io.StringIO(sample), delimiter=dialect["delimiter"], quotechar=quotechar,
+            escapechar=escapechar, doublequote=escapechar is None
+        )
+        rows = []
+        for row in reader:
+            if row:
+                rows.append(row)
+            if len(rows) > _HEADER_SAMPLE_ROWS:
+                break
+        dialect["has_header"] = _detect_header(rows)
+        return dialect, None
 
     except Exception as e:
-        return None, f"Erreur inattendue lors de la détection du séparateur : {e}"
+        return dialect, f"Erreur inattendue lors de la détection du séparateur : {e}"
+
+def detect_csv_separator(filepath: str, encoding: str, sample: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Détecte le séparateur de colonnes d'un fichier CSV (voir detect_csv_dialect). Un fichier
+    sans délimiteur est une structure valide à une seule colonne.
+
+    Args:
+        filepath (str): Chemin d'accès au fichier.
+        encoding (str): Encodage détecté du fichier.
+        sample (Optional[str]): Échantillon déjà décodé (ex: issu de scan_file_structure).
+                                S'il est fourni, le fichier n'est pas relu.
+
+    Returns:
+        Tuple[Optional[str], Optional[str]]: Le séparateur détecté et un message d'erreur si applicable.
+    """
+    dialect, error = detect_csv_dialect(filepath, encoding, sample)
+    return dialect["delimiter"], error
+
+def validate_csv_prefix(
+    filepath: str,
+    encoding: str,
+    dialect: Dict[str, Any],
+    max_rows: int = PREFIX_VALIDATION_ROWS,
+    max_ragged_ratio: float = PREFIX_MAX_RAGGED_RATIO,
+    engine: str = "pandas"
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Contrôle l'en-tête et les `max_rows` premières lignes de données avant le chargement complet,
+    pour signaler en quelques millisecondes une structure manifestement inexploitable.
+
+    Bloquant : en-tête sans aucun nom de colonne, ou proportion de lignes que le chargement
+    écarterait (lignes mal formées ignorées par `engine`) supérieure à `max_ragged_ratio`
+    (délimiteur incohérent, en-tête tronqué...). Le parseur pandas écarte les lignes ayant plus
+    de champs que prévu : autant que l'en-tête, ou que la première ligne de données si elle en a
+    davantage (premières colonnes lues comme index). Les lignes plus courtes sont complétées par
+    des valeurs manquantes ; le lecteur Arrow, lui, écarte toute ligne au nombre de champs
+    différent de l'en-tête. Les noms de colonnes vides ou en double et les lignes irrégulières
+    que le chargement conserve sont seulement décrits.
+
+    Args:
+        filepath (str): Chemin d'accès au fichier.
+        encoding (str): Encodage du fichier.
+        dialect (Dict[str, Any]): Dialecte détecté par detect_csv_dialect.
+        max_rows (int): Nombre maximal de lignes de données contrôlées.
+        max_ragged_ratio (float): Proportion maximale de lignes écartées par le chargement.
+        engine (str): Moteur du chargement complet ("pandas" ou "arrow", voir load_dataframe_robustly).
+
+    Returns:
+        Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+            - Le résultat du contrôle : rows_checked, header_columns, expected_fields (nombre de
+              champs retenu par le chargement), empty_column_names (positions), duplicate_column_names,
+              ragged_rows et ragged_line_numbers (lignes au nombre de champs différent de l'en-tête,
+              premières lignes physiques citées), rejected_rows et rejected_line_numbers (lignes que
+              le chargement écarterait), field_count_mode et field_count_consistency.
+            - Les erreurs structurelles bloquantes (error_code, message, is_blocking).
+    """
+    result = {
+        "rows_checked": 0,
+        "header_columns": 0,
+        "expected_fields": None,
+        "empty_column_names": [],
+        "duplicate_column_names": [],
+        "ragged_rows": 0,
+        "ragged_line_numbers": [],
+        "rejected_rows": 0,
+        "rejected_line_numbers": [],
+        "field_count_mode": None,
+        "field_count_consistency": None,
+    }
+    errors = []
+    field_counts = Counter()
+    try:
+        with io.TextIOWrapper(open_decompressed(filepath), encoding=encoding, errors='ignore', newline='') as file:
+            reader = csv.reader(
+                file, delimiter=dialect["delimiter"], quotechar=dialect["quotechar"],
+                escapechar=dialect["escapechar"], doublequote=dialect["doublequote"]
+            )
+            header = next((row for row in reader if row), None)
+            if header is None:
+                return result, errors
+            expected_fields = len(header)
+            for row in reader:
+                if not row:
+                    continue # Lignes vides ignorées, comme au chargement
+                if not field_counts and engine == "pandas":
+                    # Champs en surnombre de la première ligne : lus comme index par pandas
+                    expected_fields = max(expected_fields, len(row))
+                field_counts[len(row)] += 1
+                if len(row) != len(header):
+                    result["ragged_rows"] += 1
+                    if len(result["ragged_line_numbers"]) < _RAGGED_LINES_REPORTED:
+                        result["ragged_line_numbers"].append(reader.line_num)
+                if len(row) > expected_fields or (engine == "arrow" and len(row) != expected_fields):
+                    result["rejected_rows"] += 1
+                    if len(result["rejected_line_numbers"]) < _RAGGED_LINES_REPORTED:
+                        result["rejected_line_numbers"].append(reader.line_num)
+                result["rows_checked"] += 1
+                if result["rows_checked"] >= max_rows:
+                    break
+    except (csv.Error, OSError, ValueError):
+        # Début illisible par le module csv (ex. champ trop long) : le chargement complet tranchera
+        return result, errors
 
+    names = [name.strip() for name in header]
+    result["header_columns"] = len(header)
+    result["expected_fields"] = expected_fields
+    result["empty_column_names"] = [position for position, name in enumerate(names) if not name]
+    result["duplicate_column_names"] = sorted(name for name, count in Counter(names).items() if name and count > 1)
+    if field_counts:
+        mode, frequency = max(field_counts.items(), key=lambda item: (item[1], item[0]))
+        result["field_count_mode"] = mode
+        result["field_count_consistency"] = round(frequency / result["rows_checked"], 4)
+
+    if len(result["empty_column_names"]) == len(header):
+        errors.append({
+            "error_code": "invalid_header",
+            "message": "L'en-tête ne contient aucun nom de colonne.",
+            "is_blocking": True
+        })
+    if result["rows_checked"] and result["rejected_rows"] / result["rows_checked"] > max_ragged_ratio:
+        errors.append({
+            "error_code": "non_rectangular_structure",
+            "message": (
+                f"Structure non rectangulaire dès le début du fichier : {result['rejected_rows']} des "
+                f"{result['rows_checked']} premières lignes de données seraient écartées par le chargement "
+                f"(nombre de champs attendu : {expected_fields} ; nombre le plus fréquent : "
+                f"{result['field_count_mode']}), lignes {', '.join(map(str, result['rejected_line_numbers']))}."
+            ),
+            "is_blocking": True
+        })
+    return result, errors
+
+def _pandas_dialect_options(dialect: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Options de pd.read_csv (parseur C) correspondant à un dialecte détecté par detect_csv_dialect."""
+    if not dialect:
+        return {}
+    options = {"quotechar": dialect["quotechar"], "escapechar": dialect["escapechar"], "doublequote": dialect["doublequote"]}
+    # Le parseur C reconnaît "\n" et "\r\n" ; seul un fichier à fins de ligne "\r" doit le préciser
+    if dialect["lineterminator"] == '\r':
+        options["lineterminator"] = '\r'
+    return options
+
+def _arrow_column_names(names: List[str]) -> List[str]:
+    """Noms de colonnes à la manière de pandas : "Unnamed: i" pour un nom vide, suffixes ".1", ".2" pour les doublons."""
+    result, seen = [], set()
+    for position, name in enumerate(names):
+        name = name if name != '' else f"Unnamed: {position}"
+        candidate, suffix = name, 0
+        while candidate in seen:
+            suffix += 1
+            candidate = f"{name}.{suffix}"
+        seen.add(candidate)
+        result.append(candidate)
+    return result
+
+def _read_csv_arrow(filepath: str, encoding: str, separator: str, dialect: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+    """
+    Lit un CSV avec le lecteur multithread de pyarrow. Les colonnes restent des tableaux Arrow
+    (dtype pd.ArrowDtype, sans conversion en objets Python) et gardent leurs types natifs :
+    entiers avec valeurs manquantes, booléens, dates ISO. Comme avec on_bad_lines='warn',
+    les lignes mal formées sont ignorées (y compris celles qui ont trop peu de champs).
+    """
+    quoting = {}
+    if dialect:
+        quoting = {
+            "quote_char": dialect["quotechar"],
+            "escape_char": dialect["escapechar"] or False,
+            "double_quote": dialect["doublequote"],
+        }
+    with open_decompressed(filepath) as source:
+        table = pa_csv.read_csv(
+            source,
+            read_options=pa_csv.ReadOptions(encoding=encoding, use_threads=True),
+            parse_options=pa_csv.ParseOptions(delimiter=separator, invalid_row_handler=lambda row: 'skip', **quoting),
+            convert_options=pa_csv.ConvertOptions(null_values=PANDAS_NA_VALUES, strings_can_be_null=True),
+        )
+    table = table.rename_columns(_arrow_column_names(table.column_names))
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
 
-def load_dataframe_robustly(filepath: str, encoding: str, separator: str) -> Tuple[Optional[pd.DataFrame], Optional[str], Optional[str], Optional[str]]:
+def load_dataframe_robustly(
+    filepath: str,
+    encoding: str,
+    separator: str,
+    engine: str = "pandas",
+    dtype: Optional[Dict[str, Any]] = None,
+    dialect: Optional[Dict[str, Any]] = None
+) -> Tuple[Optional[pd.DataFrame], Optional[str], Optional[str], Optional[str]]:
     """
     Charge un DataFrame à partir d'un fichier CSV en utilisant l'encodage et le séparateur fournis.
-    Gère les erreurs de parsing et de décodage.
+    Gère les erreurs de parsing et de décodage. Un fichier compressé (détecté à sa signature)
+    est décompressé à la volée pendant la lecture.
 
     Args:
         filepath (str): Chemin d'accès au fichier.
         encoding (str): Encodage du fichier.
         separator (str): Séparateur de colonnes à utiliser.
+        engine (str): "pandas" (parseur C de pandas) ou "arrow" (lecteur multithread de pyarrow,
+                      colonnes adossées à Arrow ; nécessite pyarrow).
+        dtype (Optional[Dict[str, Any]]): dtypes imposés par colonne (moteur pandas uniquement).
+        dialect (Optional[Dict[str, Any]]): Dialecte détecté par detect_csv_dialect (citation,
+                                            échappement, fins de ligne) transmis au parseur.
 
     Returns:
         Tuple[Optional[pd.DataFrame], Optional[str], Optional[str], Optional[str]]:
@@ -207,26 +843,372 @@ def load_dataframe_robustly(filepath: str, encoding: str, separator: str) -> Tup
             - Message d'erreur (ou None).
             - Code d'erreur (ou None).
     """
+    if engine not in LOAD_ENGINES:
+        raise ValueError(f"Moteur de chargement inconnu : {engine} (attendu : {', '.join(LOAD_ENGINES)}).")
+    if engine == "arrow" and pa_csv is None:
+        return None, separator, "Le moteur de chargement Arrow nécessite le paquet pyarrow, qui n'est pas installé.", "arrow_engine_unavailable"
+
     try:
+        if engine == "arrow":
+            df = _read_csv_arrow(filepath, encoding, separator, dialect)
+            # Le lecteur Arrow conserve les colonnes d'un fichier sans données après l'en-tête
+            if df.empty and df.shape[1] > 0:
+                return None, separator, "Le fichier ne contient pas de données après l'en-tête.", "file_empty_after_header"
+            return df, separator, None, None
+
         # Essayer de charger le fichier avec le séparateur et l'encodage détectés
-        df = pd.read_csv(filepath, sep=separator, encoding=encoding, on_bad_lines='warn')
+        options = {"compression": detect_compression(filepath), **_pandas_dialect_options(dialect)}
+        df = pd.read_csv(filepath, sep=separator, encoding=encoding, on_bad_lines='warn', dtype=dtype, **options)
 
         # Vérifier si le fichier est vide après l'en-tête
-        if df.empty and pd.read_csv(filepath, sep=separator, encoding=encoding, nrows=0).shape[1] > 0:
+        if df.empty and pd.read_csv(filepath, sep=separator, encoding=encoding, nrows=0, **options).shape[1] > 0:
             return None, separator, "Le fichier ne contient pas de données après l'en-tête.", "file_empty_after_header"
 
         return df, separator, None, None
 
-    except pd.errors.ParserError as e:
-        return None, separator, f"Erreur de parsing CSV (structure non rectangulaire ou autre) : {e}", "non_rectangular_structure"
-    except UnicodeDecodeError as e:
-        return None, separator, f"Erreur de décodage Unicode lors du chargement : {e}", "unicode_decode_error_in_load"
     except Exception as e:
-        return None, separator, f"Erreur inattendue lors du chargement du DataFrame : {e}", "dataframe_load_error"
+        error_msg, error_code = describe_dataframe_load_error(e)
+        return None, separator, error_msg, error_code
+
+def _compact_string_dtype() -> Optional[Any]:
+    """dtype texte adossé à Arrow (sans objet Python par valeur), ou None sans pyarrow."""
+    if pa is None:
+        return None
+    try:
+        return pd.StringDtype("pyarrow", na_value=np.nan)
+    except TypeError: # pandas < 2.3 : chaînes Arrow à valeur manquante pd.NA
+        return pd.StringDtype("pyarrow")
+
+def infer_compact_dtypes(
+    filepath: str,
+    encoding: str,
+    separator: str,
+    sample_rows: int = MEMORY_SAMPLE_ROWS,
+    dialect: Optional[Dict[str, Any]] = None
+) -> Tuple[Dict[str, Any], Optional[float]]:
+    """
+    Choisit, à partir des `sample_rows` premières lignes, des dtypes compacts à imposer à la
+    lecture complète : catégorie pour les colonnes texte de faible cardinalité, chaînes Arrow
+    pour les autres colonnes texte, entier nullable pour les colonnes d'entiers (y compris
+    celles que des valeurs manquantes feraient lire en float64). Les autres colonnes gardent
+    l'inférence de pandas.
+
+    Args:
+        filepath (str): Chemin d'accès au fichier.
+        encoding (str): Encodage du fichier.
+        separator (str): Séparateur de colonnes.
+        sample_rows (int): Nombre de lignes de l'échantillon.
+        dialect (Optional[Dict[str, Any]]): Dialecte détecté par detect_csv_dialect.
+
+    Returns:
+        Tuple[Dict[str, Any], Optional[float]]:
+            - dtypes imposés par colonne (vide si l'échantillon est illisible).
+            - Empreinte mémoire moyenne d'une ligne de l'échantillon avec les dtypes par défaut
+              (None si l'échantillon est vide ou illisible).
+    """
+    try:
+        options = {"compression": detect_compression(filepath), **_pandas_dialect_options(dialect)}
+        sample = pd.read_csv(filepath, sep=separator, encoding=encoding, on_bad_lines='skip', nrows=sample_rows, **options)
+        # Mêmes lignes lues en texte : distingue "12" (entier) de "12.0" (flottant)
+        raw = pd.read_csv(filepath, sep=separator, encoding=encoding, on_bad_lines='skip', nrows=sample_rows, dtype=str, **options)
+    except Exception:
+        # L'erreur sera rapportée par la lecture complète
+        return {}, None
+    if sample.empty:
+        return {}, None
+
+    string_dtype = _compact_string_dtype()
+    dtypes = {}
+    for col_name in sample.columns:
+        col_data = sample[col_name]
+        values = col_data.dropna()
+        if values.empty or pd.api.types.is_bool_dtype(col_data):
+            continue
+        if pd.api.types.is_integer_dtype(col_data):
+            dtypes[col_name] = "Int64"
+        elif pd.api.types.is_float_dtype(col_data):
+            if raw[col_name].dropna().str.fullmatch(r"[+-]?\d+").all():
+                dtypes[col_name] = "Int64"
+        elif pd.api.types.is_string_dtype(col_data):
+            if values.nunique() <= CATEGORY_MAX_UNIQUE_RATIO * len(values):
+                dtypes[col_name] = "category"
+            elif string_dtype is not None:
+                dtypes[col_name] = string_dtype
+    default_bytes_per_row = sample.memory_usage(deep=True, index=False).sum() / len(sample)
+    return dtypes, float(default_bytes_per_row)
+
+def _smallest_integer_dtype(min_value: int, max_value: int, nullable: bool) -> Any:
+    for nullable_dtype, numpy_dtype in _INTEGER_DTYPES:
+        limits = np.iinfo(numpy_dtype)
+        if limits.min <= min_value and max_value <= limits.max:
+            return nullable_dtype if nullable else np.dtype(numpy_dtype)
+    return None
+
+def downcast_numeric_columns(df: pd.DataFrame, integer_columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Réduit sans perte les colonnes numériques d'un DataFrame : entiers vers le plus petit type
+    contenant leurs valeurs (nullable ou NumPy selon le dtype d'origine), float64 vers float32
+    lorsque chaque valeur y est représentable exactement.
+
+    Args:
+        df (pd.DataFrame): Le DataFrame chargé (modifié en place).
+        integer_columns (Optional[List[str]]): Colonnes d'entiers lues en float64 à cause de valeurs
+                                               manquantes, converties en entiers nullables si toutes
+                                               leurs valeurs sont entières.
+
+    Returns:
+        pd.DataFrame: Le même DataFrame.
+    """
+    integer_columns = set(integer_columns or ())
+    for position, col_name in enumerate(df.columns):
+        col_data = df.iloc[:, position]
+        if isinstance(col_data.dtype, pd.ArrowDtype) or pd.api.types.is_bool_dtype(col_data):
+            continue
+        if col_name in integer_columns and col_data.dtype == np.float64:
+            values = col_data.dropna()
+            if not values.empty and values.eq(np.floor(values)).all():
+                col_data = col_data.astype("Int64")
+        if pd.api.types.is_integer_dtype(col_data):
+            if col_data.isna().all():
+                continue
+            nullable = isinstance(col_data.dtype, pd.api.extensions.ExtensionDtype)
+            target = _smallest_integer_dtype(int(col_data.min()), int(col_data.max()), nullable)
+        elif col_data.dtype == np.float64:
+            values = col_data.to_numpy()
+            narrowed = values.astype(np.float32)
+            with np.errstate(over='ignore', invalid='ignore'):
+                lossless = np.array_equal(narrowed.astype(np.float64), values, equal_nan=True)
+            target = np.dtype(np.float32) if lossless else None
+        else:
+            continue
+        if target is not None and target != col_data.dtype:
+            df.isetitem(position, col_data.astype(target))
+    return df
+
+def load_dataframe_memory_optimized(
+    filepath: str,
+    encoding: str,
+    separator: str,
+    sample_rows: int = MEMORY_SAMPLE_ROWS,
+    dialect: Optional[Dict[str, Any]] = None
+) -> Tuple[Optional[pd.DataFrame], Optional[str], Optional[str], Optional[str], Dict[str, Any]]:
+    """
+    Charge un CSV avec des dtypes compacts (voir infer_compact_dtypes et downcast_numeric_columns)
+    pour réduire l'empreinte mémoire du DataFrame et le pic de mémoire du chargement : les
+    valeurs texte ne sont pas créées une à une en objets Python. Seuls des dtypes texte sont
+    imposés à la lecture ; les réductions numériques sont vérifiées sur la colonne complète,
+    de sorte qu'une valeur au-delà de l'échantillon ne peut être ni rejetée ni tronquée.
+
+    Args:
+        filepath (str): Chemin d'accès au fichier.
+        encoding (str): Encodage du fichier.
+        separator (str): Séparateur de colonnes à utiliser.
+        sample_rows (int): Nombre de lignes lues pour choisir les dtypes.
+        dialect (Optional[Dict[str, Any]]): Dialecte détecté par detect_csv_dialect.
+
+    Returns:
+        Tuple[Optional[pd.DataFrame], Optional[str], Optional[str], Optional[str], Dict[str, Any]]:
+            Comme load_dataframe_robustly, suivi de l'empreinte mémoire obtenue :
+            dataframe_bytes, estimated_default_bytes (extrapolée de l'échantillon),
+            reduction_ratio et compact_dtypes (dtype de chaque colonne réduite).
+    """
+    dtypes, default_bytes_per_row = infer_compact_dtypes(filepath, encoding, separator, sample_rows, dialect)
+    # Les entiers sont lus par le parseur natif (int64, ou float64 avec valeurs manquantes), plus
+    # rapide que la conversion des textes en Int64, puis réduits par downcast_numeric_columns
+    integer_columns = [col_name for col_name, col_dtype in dtypes.items() if col_dtype == "Int64"]
+    read_dtypes = {col_name: col_dtype for col_name, col_dtype in dtypes.items() if col_dtype != "Int64"}
+    df, final_separator, error_msg, error_code = load_dataframe_robustly(filepath, encoding, separator, dtype=read_dtypes or None, dialect=dialect)
+    footprint = {
+        "dataframe_bytes": None,
+        "estimated_default_bytes": None,
+        "reduction_ratio": None,
+        "compact_dtypes": {},
+    }
+    if df is None:
+        return df, final_separator, error_msg, error_code, footprint
+
+    default_dtypes = list(df.dtypes)
+    df = downcast_numeric_columns(df, integer_columns)
+    footprint["compact_dtypes"] = {
+        str(col_name): str(col_dtype)
+        for col_name, col_dtype, default_dtype in zip(df.columns, df.dtypes, default_dtypes)
+        if col_name in read_dtypes or col_dtype != default_dtype
+    }
+    dataframe_bytes = int(df.memory_usage(deep=True, index=False).sum())
+    footprint["dataframe_bytes"] = dataframe_bytes
+    if default_bytes_per_row is not None:
+        estimated_default_bytes = int(round(default_bytes_per_row * len(df)))
+        footprint["estimated_default_bytes"] = estimated_default_bytes
+        if estimated_default_bytes > 0:
+            footprint["reduction_ratio"] = round(1 - dataframe_bytes / estimated_default_bytes, 4)
+    return df, final_separator, None, None, footprint
+
+def describe_dataframe_load_error(error: Exception) -> Tuple[str, str]:
+    """
+    Traduit une exception levée pendant la lecture pandas (ou Arrow) en message et code d'erreur structurelle.
+
+    Args:
+        error (Exception): L'exception levée par pandas.
+
+    Returns:
+        Tuple[str, str]: Message d'erreur et code d'erreur.
+    """
+    if isinstance(error, pd.errors.ParserError):
+        return f"Erreur de parsing CSV (structure non rectangulaire ou autre) : {error}", "non_rectangular_structure"
+    if isinstance(error, UnicodeDecodeError) or (pa is not None and isinstance(error, pa.ArrowInvalid) and "UTF8" in str(error)):
+        return f"Erreur de décodage Unicode lors du chargement : {error}", "unicode_decode_error_in_load"
+    if pa is not None and isinstance(error, pa.ArrowInvalid):
+        return f"Erreur de parsing CSV (structure non rectangulaire ou autre) : {error}", "non_rectangular_structure"
+    return f"Erreur inattendue lors du chargement du DataFrame : {error}", "dataframe_load_error"
+
+class _ByteRangeReader(io.RawIOBase):
+    """Lecture binaire d'un fichier limitée à la plage d'octets [start, end)."""
+
+    def __init__(self, filepath: str, start: int, end: Optional[int]):
+        self._file = open(filepath, 'rb')
+        self._file.seek(start)
+        self._end = end
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer)
+        if self._end is not None:
+            view = view[:max(0, self._end - self._file.tell())]
+        return self._file.readinto(view) if len(view) else 0
+
+    def close(self) -> None:
+        self._file.close()
+        super().close()
+
+def iter_dataframe_chunks(
+    filepath: str,
+    encoding: str,
+    separator: str,
+    chunk_size: int,
+    dtype: Optional[Dict[str, Any]] = None,
+    start_offset: int = 0,
+    end_offset: Optional[int] = None,
+    names: Optional[List[str]] = None,
+    dialect: Optional[Dict[str, Any]] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Lit un fichier CSV par blocs de `chunk_size` lignes (mode streaming).
+
+    La mémoire consommée par la lecture est bornée par la taille d'un bloc et non par celle
+    du fichier. Les erreurs de parsing sont levées au fil de la lecture : l'appelant peut les
+    traduire avec describe_dataframe_load_error. Un fichier compressé est décompressé à la
+    volée ; il ne peut alors être lu que du début à la fin (pas de plage d'octets).
+
+    Args:
+        filepath (str): Chemin d'accès au fichier.
+        encoding (str): Encodage du fichier.
+        separator (str): Séparateur de colonnes à utiliser.
+        chunk_size (int): Nombre de lignes par bloc.
+        dtype (Optional[Dict[str, Any]]): dtypes imposés par colonne (noms originaux).
+        start_offset (int): Position (en octets, début de ligne) à partir de laquelle lire.
+        end_offset (Optional[int]): Position (en octets) où arrêter la lecture (None : fin du fichier).
+        names (Optional[List[str]]): Noms des colonnes, lorsque la portion lue ne commence pas
+                                     par l'en-tête (lecture de la fin d'un fichier).
+        dialect (Optional[Dict[str, Any]]): Dialecte détecté par detect_csv_dialect.
+
+    Yields:
+        pd.DataFrame: Les blocs successifs du fichier.
+    """
+    header = None if names is not None else 'infer'
+    compression = detect_compression(filepath)
+    if compression is not None and (start_offset != 0 or end_offset is not None):
+        raise ValueError("Lecture par plage d'octets impossible dans un fichier compressé.")
+    if start_offset == 0 and end_offset is None:
+        source = filepath
+    else:
+        source = io.TextIOWrapper(io.BufferedReader(_ByteRangeReader(filepath, start_offset, end_offset)), encoding=encoding, newline='')
+    try:
+        with pd.read_csv(source, sep=separator, encoding=encoding, on_bad_lines='warn', chunksize=chunk_size,
+                         dtype=dtype, header=header, names=names, compression=compression,
+                         **_pandas_dialect_options(dialect)) as reader:
+            for chunk in reader:
+                yield chunk
+    finally:
+        if source is not filepath:
+            source.close()
+
+def _matches_any(name: str, relative_path: str, patterns: List[str]) -> bool:
+    """
+    Correspondance (insensible à la casse) avec l'un des motifs glob : un motif sans "/" porte
+    sur le nom, un motif avec "/" sur le chemin relatif au répertoire scanné.
+    """
+    for pattern in patterns:
+        target = relative_path if '/' in pattern else name
+        if fnmatch.fnmatchcase(target, pattern):
+            return True
+    return False
+
+def iter_csv_files(
+    directory_path: str,
+    recursive: bool = True,
+    include: Iterable[str] = CSV_FILE_PATTERNS,
+    exclude: Iterable[str] = (),
+    on_error: Optional[Callable[[OSError], None]] = None
+) -> Iterator[Tuple[str, int]]:
+    """
+    Parcourt un répertoire (et ses sous-répertoires) avec os.scandir et produit, au fil du
+    parcours, les fichiers retenus par les motifs glob avec leur taille.
+
+    Le type des entrées provient du parcours lui-même (sans appel stat par entrée sur la plupart
+    des systèmes) ; seule la taille des fichiers retenus demande un stat. Les sous-répertoires
+    correspondant à un motif d'exclusion ne sont pas parcourus, et les liens symboliques vers
+    des répertoires ne sont pas suivis (pas de cycle). Les fichiers sont produits dans l'ordre
+    du système de fichiers.
+
+    Args:
+        directory_path (str): Le répertoire à parcourir.
+        recursive (bool): Parcourir aussi les sous-répertoires.
+        include (Iterable[str]): Motifs des fichiers retenus (ex. "*.csv", "2024-*/*.csv") ; par
+                                 défaut, les CSV compressés ou non (CSV_FILE_PATTERNS).
+        exclude (Iterable[str]): Motifs des fichiers et répertoires ignorés (ex. "tmp_*", "archive").
+        on_error (Optional[Callable[[OSError], None]]): Appelée pour chaque répertoire ou fichier
+                                                        illisible (ignoré par défaut), comme os.walk.
+
+    Yields:
+        Tuple[str, int]: Chemin du fichier et taille en octets.
+    """
+    include = [pattern.lower().replace(os.sep, '/') for pattern in include]
+    exclude = [pattern.lower().replace(os.sep, '/') for pattern in exclude]
+    pending = [(directory_path, "")]
+    while pending:
+        directory, relative_directory = pending.pop()
+        try:
+            iterator = os.scandir(directory)
+        except OSError as e:
+            if on_error is not None:
+                on_error(e)
+            continue
+        subdirectories = []
+        with iterator:
+            for entry in iterator:
+                name = entry.name.lower()
+                relative_path = relative_directory + name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive and not _matches_any(name, relative_path, exclude):
+                            subdirectories.append((entry.path, relative_path + '/'))
+                        continue
+                    if not entry.is_file() or not _matches_any(name, relative_path, include) or _matches_any(name, relative_path, exclude):
+                        continue
+                    size = entry.stat().st_size
+                except OSError as e:
+                    if on_error is not None:
+                        on_error(e)
+                    continue
+                yield entry.path, size
+        # Parcours en profondeur, sous-répertoires dans l'ordre du parcours
+        pending.extend(reversed(subdirectories))
 
 def get_csv_files_in_directory(directory_path: str) -> List[str]:
     """
-    Liste tous les fichiers CSV (.csv) dans un répertoire donné.
+    Liste tous les fichiers CSV (.csv, et .csv.gz, .csv.bz2, .csv.xz, .csv.zst) dans un répertoire donné.
 
     Args:
         directory_path (str): Le chemin du répertoire à scanner.
@@ -234,13 +1216,7 @@ def get_csv_files_in_directory(directory_path: str) -> List[str]:
     Returns:
         List[str]: Une liste de chemins d'accès complets aux fichiers CSV trouvés.
     """
-    csv_files = []
     if not os.path.isdir(directory_path):
         # Vous pouvez ajouter une gestion d'erreur ou un log ici si le chemin n'est pas un répertoire valide
-        return csv_files
-
-    for entry in os.listdir(directory_path):
-        full_path = os.path.join(directory_path, entry)
-        if os.path.isfile(full_path) and full_path.lower().endswith('.csv'):
-            csv_files.append(full_path)
-    return csv_files
+        return []
+    return [filepath for filepath, _ in iter_csv_files(directory_path, recursive=False)]
@@ -0,0 +1,79 @@
+# VeriQual/tools/common/hashing.py
+
+import numpy as np
+import pandas as pd
+
+# Paramètres par graine de hachage : la graine 0 donne l'empreinte principale, la graine 1
+# une seconde empreinte indépendante (empreintes de lignes sur 128 bits).
+# Clé de hachage des textes (la première est la clé par défaut de pandas)
+_HASH_KEYS = ("0123456789123456", "VeriQualRowHash1")
+# Empreinte attribuée aux cellules nulles, quel que soit le dtype du bloc
+_NULL_HASHES = (np.uint64(0x9E3779B97F4A7C15), np.uint64(0xC2B2AE3D27D4EB4F))
+# Masque appliqué aux bits des nombres avant hachage
+_NUMERIC_MASKS = (np.uint64(0), np.uint64(0x94D049BB133111EB))
+# Multiplicateur de combinaison des empreintes de colonnes
+_COMBINE_PRIMES = (np.uint64(1000003), np.uint64(2654435761))
+# Au-delà de 2**53, un entier n'est plus représentable exactement en float64
+_MAX_EXACT_FLOAT_INT = 2 ** 53
+
+
+def _hash_numbers(values: np.ndarray, seed: int) -> np.ndarray:
+    """Hache des nombres 64 bits (float64 ou int64) selon la graine."""
+    if seed == 0:
+        return pd.util.hash_array(values)
+    return pd.util.hash_array(values.view(np.uint64) ^ _NUMERIC_MASKS[seed])
+
+def hash_series_values(col_data: pd.Series, categorize: bool = True, seed: int = 0) -> np.ndarray:
+    """
+    Empreinte 64 bits de chaque cellule d'une colonne, indépendante du dtype du bloc :
+    les nulls ont une empreinte fixe et les nombres sont hachés via leur valeur float64,
+    de sorte qu'une même ligne lue en int64 dans un bloc et en float64 dans un autre
+    (valeur manquante) produit la même empreinte.
+
+    Args:
+        col_data (pd.Series): La colonne (ou portion de colonne) à hacher.
+        categorize (bool): Factoriser les textes avant hachage (plus rapide sur faible cardinalité,
+                           mais construit une table de hachage des valeurs distinctes).
+        seed (int): 0 pour l'empreinte principale, 1 pour une seconde empreinte indépendante.
+
+    Returns:
+        np.ndarray: Tableau uint64 d'une empreinte par cellule.
+    """
+    is_null = col_data.isna().to_numpy()
+    if pd.api.types.is_numeric_dtype(col_data) and not pd.api.types.is_bool_dtype(col_data):
+        values = col_data.to_numpy(dtype='float64', na_value=0.0) + 0.0 # -0.0 normalisé en 0.0
+        hashes = _hash_numbers(values, seed)
+        if pd.api.types.is_integer_dtype(col_data):
+            # Entiers non représentables exactement en float64 : hachage sur la valeur entière
+            int_values = col_data.to_numpy(dtype='int64', na_value=0)
+            large = np.abs(int_values.astype('float64')) >= _MAX_EXACT_FLOAT_INT
+            if large.any():
+                hashes[large] = _hash_numbers(int_values[large].astype(np.int64), seed)
+    elif isinstance(col_data.dtype, pd.CategoricalDtype):
+        # Catégories hachées une seule fois, sans créer un objet Python par cellule
+        category_hashes = hash_series_values(pd.Series(col_data.cat.categories), categorize, seed)
+        if len(category_hashes):
+            hashes = category_hashes[col_data.cat.codes.to_numpy()]
+        else:
+            hashes = np.zeros(len(col_data), dtype=np.uint64)
+    else:
+        hashes = pd.util.hash_array(col_data.to_numpy(dtype=object), hash_key=_HASH_KEYS[seed], categorize=categorize)
+    hashes[is_null] = _NULL_HASHES[seed]
+    return hashes
+
+def hash_dataframe_rows(df: pd.DataFrame, seed: int = 0) -> np.ndarray:
+    """
+    Calcule une empreinte 64 bits par ligne d'un DataFrame (index exclu).
+
+    Args:
+        df (pd.DataFrame): Le DataFrame (ou bloc) à hacher.
+        seed (int): 0 pour l'empreinte principale, 1 pour une seconde empreinte indépendante.
+
+    Returns:
+        np.ndarray: Tableau uint64 d'une empreinte par ligne.
+    """
+    combined = np.zeros(len(df), dtype=np.uint64)
+    for position in range(df.shape[1]):
+        # Débordement volontaire (arithmétique modulo 2**64)
+        combined = combined * _COMBINE_PRIMES[seed] ^ hash_series_values(df.iloc[:, position], seed=seed)
+    return combined
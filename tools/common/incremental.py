@@ -0,0 +1,172 @@
+# VeriQual/tools/common/incremental.py
+
+import io
+import os
+import json
+import hashlib
+import numpy as np
+from typing import Any, Dict, List, Optional
+
+# Version du format des fichiers d'état (à incrémenter si leur contenu change)
+STATE_FORMAT_VERSION = 2
+# Taille des blocs lus pour l'empreinte du préfixe déjà audité
+PREFIX_HASH_BLOCK_SIZE = 1024 * 1024
+# Marqueurs du document JSON de l'état : tableau numpy rangé à part, dictionnaire à clés non textuelles
+_ARRAY_TAG = "__ndarray__"
+_ITEMS_TAG = "__items__"
+
+
+def supports_incremental_encoding(encoding: str) -> bool:
+    """
+    Indique si un fichier de cet encodage peut être repris à une position en octets :
+    le saut de ligne doit y être l'octet 0x0A (exclut UTF-16 et UTF-32).
+    """
+    return not encoding.lower().replace('_', '-').startswith(('utf-16', 'utf-32'))
+
+
+def _new_prefix_hasher() -> Any:
+    return hashlib.blake2b(digest_size=32)
+
+
+def _hash_range(f: Any, start: int, end: int, hasher: Any) -> int:
+    """Ajoute à `hasher` les octets [start, end) du fichier ; retourne le nombre d'octets lus."""
+    f.seek(start)
+    position = start
+    while position < end:
+        block = f.read(min(PREFIX_HASH_BLOCK_SIZE, end - position))
+        if not block:
+            break
+        hasher.update(block)
+        position += len(block)
+    return position - start
+
+
+def prefix_signature(filepath: str, offset: int, hasher: Optional[Any] = None, hashed_bytes: int = 0) -> Dict[str, Any]:
+    """
+    Signature des `offset` premiers octets d'un fichier : empreinte BLAKE2b du préfixe entier,
+    et indicateur de fin de ligne au dernier octet.
+
+    Avec `hasher`, empreinte en cours des `hashed_bytes` premiers octets (retournée par
+    verify_prefix), seuls les octets suivants sont lus : l'empreinte d'un fichier prolongé
+    étend celle de son préfixe déjà vérifié.
+    """
+    if hasher is None:
+        hasher, hashed_bytes = _new_prefix_hasher(), 0
+    with open(filepath, 'rb') as f:
+        _hash_range(f, hashed_bytes, offset, hasher)
+        f.seek(max(0, offset - 1))
+        ends_with_newline = offset == 0 or f.read(1) in (b'\n', b'\r')
+    return {"offset": offset, "digest": hasher.hexdigest(), "ends_with_newline": ends_with_newline}
+
+
+def verify_prefix(filepath: str, signature: Dict[str, Any]) -> Optional[Any]:
+    """
+    Vérifie qu'un fichier commence toujours par le préfixe décrit par `signature` (relu en
+    entier : toute réécriture, même de même taille, est détectée), et que la suite est un
+    ajout de lignes : si le préfixe ne se terminait pas par une fin de ligne (écriture en
+    cours lors du précédent audit), l'ajout doit commencer par une fin de ligne.
+
+    Returns:
+        Optional[Any]: L'empreinte en cours du préfixe (à transmettre à prefix_signature), ou
+                       None si le fichier ne prolonge plus le préfixe.
+    """
+    offset = int(signature["offset"])
+    size = os.path.getsize(filepath)
+    if size < offset:
+        return None
+    hasher = _new_prefix_hasher()
+    with open(filepath, 'rb') as f:
+        if _hash_range(f, 0, offset, hasher) != offset or hasher.hexdigest() != signature["digest"]:
+            return None
+        if not signature["ends_with_newline"] and size > offset:
+            f.seek(offset)
+            if f.read(1) not in (b'\n', b'\r'):
+                return None
+    return hasher
+
+
+def state_path_for(filepath: str, state_dir: Optional[str] = None) -> str:
+    """
+    Chemin du fichier d'état d'un fichier audité : "<fichier>.veriqual-state" à côté du fichier,
+    ou, avec `state_dir`, un nom dérivé du chemin absolu dans ce répertoire.
+    """
+    if state_dir is None:
+        return filepath + ".veriqual-state"
+    path_digest = hashlib.blake2b(os.path.abspath(filepath).encode('utf-8'), digest_size=8).hexdigest()
+    return os.path.join(state_dir, f"{os.path.basename(filepath)}.{path_digest}.veriqual-state")
+
+
+def _encode_state(value: Any, arrays: List[np.ndarray]) -> Any:
+    """Convertit une valeur de l'état en JSON ; les tableaux numpy sont rangés dans `arrays`."""
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            raise TypeError("Tableau d'objets Python non enregistrable dans l'état incrémental.")
+        arrays.append(value)
+        return {_ARRAY_TAG: len(arrays) - 1}
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_encode_state(item, arrays) for item in value]
+    if isinstance(value, dict):
+        items = [(key, _encode_state(item, arrays)) for key, item in value.items()]
+        if all(isinstance(key, str) for key in value) and set(value) not in ({_ARRAY_TAG}, {_ITEMS_TAG}):
+            return dict(items)
+        return {_ITEMS_TAG: [[_encode_state(key, arrays), item] for key, item in items]}
+    raise TypeError(f"Valeur non enregistrable dans l'état incrémental : {type(value).__name__}")
+
+
+def _decode_state(value: Any, archive: Any) -> Any:
+    """Inverse de _encode_state : les tableaux sont lus dans l'archive npz."""
+    if isinstance(value, list):
+        return [_decode_state(item, archive) for item in value]
+    if isinstance(value, dict):
+        if set(value) == {_ARRAY_TAG}:
+            return archive[f"a{int(value[_ARRAY_TAG])}"]
+        if set(value) == {_ITEMS_TAG}:
+            return {_decode_state(key, archive): _decode_state(item, archive) for key, item in value[_ITEMS_TAG]}
+        return {key: _decode_state(item, archive) for key, item in value.items()}
+    return value
+
+
+def load_incremental_state(path: str) -> Optional[Dict[str, Any]]:
+    """
+    État sauvegardé par save_incremental_state, ou None s'il est absent, illisible ou d'un autre format.
+
+    Le fichier n'est lu que comme des données (document JSON et tableaux numpy numériques,
+    chargés sans pickle) : un fichier d'état déposé par un tiers ne peut pas exécuter de code.
+    """
+    try:
+        with open(path, 'rb') as f, np.load(f, allow_pickle=False) as archive:
+            document = json.loads(archive["state"].tobytes().decode('utf-8'))
+            state = _decode_state(document, archive)
+    except Exception:
+        return None
+    if not isinstance(state, dict) or state.get("format_version") != STATE_FORMAT_VERSION:
+        return None
+    return state
+
+
+def save_incremental_state(path: str, state: Dict[str, Any]) -> None:
+    """
+    Enregistre un état d'audit incrémental (écriture atomique) dans une archive npz : un
+    document JSON et les tableaux numpy qu'il référence (registres HyperLogLog, niveaux KLL,
+    empreintes de doublons, comptes de valeurs).
+
+    Raises:
+        OSError: Si le fichier ne peut pas être écrit.
+        TypeError: Si l'état contient une valeur autre que des données simples ou des tableaux numériques.
+    """
+    arrays: List[np.ndarray] = []
+    document = json.dumps(_encode_state({**state, "format_version": STATE_FORMAT_VERSION}, arrays))
+    members = {f"a{index}": array for index, array in enumerate(arrays)}
+    buffer = io.BytesIO()
+    np.savez(buffer, state=np.frombuffer(document.encode('utf-8'), dtype=np.uint8), **members)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    with open(temporary_path, 'wb') as f:
+        f.write(buffer.getbuffer())
+    os.replace(temporary_path, path)
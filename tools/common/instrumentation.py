@@ -0,0 +1,125 @@
+# VeriQual/tools/common/instrumentation.py
+
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+try: # Pic de mémoire résidente : module resource (Unix uniquement)
+    import resource
+except ImportError:
+    resource = None
+
+# Méthodes de mesure de la mémoire par étape
+MEMORY_METHODS = ("rss", "tracemalloc")
+
+
+def _peak_rss_bytes() -> Optional[int]:
+    """Pic de mémoire résidente du processus depuis son démarrage (None si non mesurable)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss est en octets sous macOS, en kilo-octets ailleurs
+    return int(peak) if sys.platform == "darwin" else int(peak) * 1024
+
+
+class _DisabledStage:
+    """Étape sans mesure : contexte réutilisable, sans appel d'horloge ni allocation."""
+
+    def __init__(self):
+        self.record: Dict[str, Any] = {}
+
+    def __enter__(self) -> Dict[str, Any]:
+        return self.record
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.record.clear()
+
+
+class _Stage:
+    def __init__(self, recorder: "PerformanceRecorder", name: str, rows: Optional[int], bytes_read: Optional[int]):
+        self.recorder = recorder
+        self.record = {"stage": name, "rows": rows, "bytes_read": bytes_read}
+
+    def __enter__(self) -> Dict[str, Any]:
+        if self.recorder.memory == "tracemalloc":
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self.recorder._started_tracing = True
+            tracemalloc.reset_peak()
+            self._memory_start = tracemalloc.get_traced_memory()[0]
+        else:
+            self._memory_start = _peak_rss_bytes()
+        self._cpu_start = time.process_time()
+        self._wall_start = time.perf_counter()
+        return self.record
+
+    def __exit__(self, *exc_info: Any) -> None:
+        wall_time = time.perf_counter() - self._wall_start
+        cpu_time = time.process_time() - self._cpu_start
+        record = self.record
+        record["wall_time_s"] = round(wall_time, 6)
+        record["cpu_time_s"] = round(cpu_time, 6)
+        rows = record.get("rows")
+        record["rows_per_s"] = round(rows / wall_time, 1) if rows and wall_time > 0 else None
+        if self.recorder.memory == "tracemalloc":
+            record["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1] - self._memory_start
+        else:
+            peak = _peak_rss_bytes()
+            record["peak_memory_bytes"] = peak - self._memory_start if peak is not None else None
+        self.recorder.stages.append(record)
+
+
+class PerformanceRecorder:
+    """
+    Mesures par étape d'un audit : temps écoulé, temps CPU du processus, débit (lignes/s),
+    octets lus et pic de mémoire.
+
+    Le pic de mémoire est, avec `memory="rss"`, l'augmentation du pic de mémoire résidente du
+    processus pendant l'étape (0 si le pic antérieur n'est pas dépassé ; None hors Unix), et,
+    avec `memory="tracemalloc"`, le pic des allocations suivies par tracemalloc pendant l'étape
+    (plus précis, mais il ralentit sensiblement l'audit).
+
+    Désactivé (`enabled=False`), stage() retourne un contexte partagé qui ne mesure rien :
+    le coût d'une étape se réduit à l'appel de méthode.
+    """
+
+    def __init__(self, enabled: bool = True, memory: str = "rss"):
+        if memory not in MEMORY_METHODS:
+            raise ValueError(f"Méthode de mesure mémoire inconnue : {memory} (attendu : {', '.join(MEMORY_METHODS)}).")
+        self.enabled = enabled
+        self.memory = memory
+        self.stages: List[Dict[str, Any]] = []
+        self._started_tracing = False
+        self._disabled_stage = _DisabledStage()
+
+    def stage(self, name: str, rows: Optional[int] = None, bytes_read: Optional[int] = None) -> Any:
+        """
+        Contexte mesurant une étape. Le dictionnaire retourné par `with` peut être complété
+        pendant l'étape (ex. record["rows"] une fois le fichier chargé).
+        """
+        if not self.enabled:
+            return self._disabled_stage
+        return _Stage(self, name, rows, bytes_read)
+
+    def stop(self) -> None:
+        """Arrête tracemalloc s'il a été démarré par ce recorder."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict[str, Any]: memory_method, stages (mesures par étape, dans l'ordre d'exécution)
+                            et total (temps écoulé et CPU cumulés, octets lus).
+        """
+        return {
+            "memory_method": self.memory,
+            "stages": [dict(record) for record in self.stages],
+            "total": {
+                "wall_time_s": round(sum(record["wall_time_s"] for record in self.stages), 6),
+                "cpu_time_s": round(sum(record["cpu_time_s"] for record in self.stages), 6),
+                "bytes_read": sum(record["bytes_read"] or 0 for record in self.stages),
+            },
+        }
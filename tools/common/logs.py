@@ -1,7 +1,47 @@
 # -*- coding: utf-8 -*-
+import atexit
 import logging
-import sys
+import logging.handlers
+import multiprocessing.util
 import os
+import queue
+import sys
+import threading
+from typing import Any, Dict
+
+# Écouteurs des loggers configurés avec queued=True : {nom du logger: (pid, écouteur)}
+_QUEUE_LISTENERS: Dict[str, tuple] = {}
+# Files multiprocessing des processus enfants, dépilées dans le parent : {nom du logger: (pid, file, écouteur)}
+_PROCESS_QUEUES: Dict[str, tuple] = {}
+# Loggers d'un processus enfant routés vers la file de son parent : {nom du logger: pid}
+_ROUTED_LOGGERS: Dict[str, int] = {}
+_QUEUE_LOCK = threading.Lock()
+
+
+def _stop_listener(name: str) -> None:
+    pid, listener = _QUEUE_LISTENERS.pop(name, (None, None))
+    # Un écouteur hérité d'un processus parent (fork) n'a pas de thread dans ce processus
+    if listener is not None and pid == os.getpid():
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+def _stop_queue_listeners() -> None:
+    """Vide les files et arrête les écouteurs à la fin du processus."""
+    with _QUEUE_LOCK:
+        # Files des processus enfants d'abord : leurs enregistrements passent par les écouteurs des loggers
+        for name in list(_PROCESS_QUEUES):
+            pid, _, listener = _PROCESS_QUEUES.pop(name)
+            if pid == os.getpid():
+                listener.stop()
+        for name in list(_QUEUE_LISTENERS):
+            _stop_listener(name)
+
+
+atexit.register(_stop_queue_listeners)
+# Les processus de multiprocessing (pool d'audit) ne passent pas par atexit, mais par ses finaliseurs
+multiprocessing.util.Finalize(None, _stop_queue_listeners, exitpriority=10)
 
 def configure_logging(
     name: str, 
@@ -11,11 +51,18 @@ def configure_logging(
     log_file: str = 'app.log',
     force: bool = False,
     format_string: str = None,
-    date_format: str = None
+    date_format: str = None,
+    queued: bool = False
 ) -> logging.Logger:
     """
     Configure et retourne un logger modulaire, robuste et flexible.
 
+    Avec `queued=True`, le logger ne porte qu'un QueueHandler : l'écriture sur la console et
+    dans le fichier est faite par un thread d'écoute (QueueListener), hors du chemin d'exécution
+    de l'appelant. La configuration est faite une fois par processus puis réutilisée ; un
+    processus enfant (pool d'audit) qui hérite du logger par fork crée son propre écouteur,
+    sauf s'il a été routé vers la file de son parent par route_logging_to_queue.
+
     Args:
         name (str): Le nom du logger (utiliser __name__).
         level (str): Le niveau de log minimum (DEBUG, INFO, WARNING, ERROR, CRITICAL).
@@ -25,6 +72,7 @@ def configure_logging(
         force (bool): Si True, supprime et reconfigure les handlers existants.
         format_string (str, optional): Chaîne de formatage personnalisée.
         date_format (str, optional): Format de date personnalisé pour le formatter.
+        queued (bool): Si True, écriture des logs par un thread d'écoute via une file.
 
     Returns:
         logging.Logger: L'instance du logger configuré.
@@ -42,39 +90,135 @@ def configure_logging(
     logger = logging.getLogger(name)
     logger.setLevel(log_level)
 
-    # 3. Gestion de la reconfiguration (Critique 2: "force=True")
-    if force and logger.hasHandlers():
-        logger.handlers.clear()
+    with _QUEUE_LOCK:
+        # Processus enfant dont le logger écrit par l'écouteur du parent (route_logging_to_queue)
+        if _ROUTED_LOGGERS.get(name) == os.getpid():
+            return logger
+
+        # Logger configuré par un processus parent : ses handlers écrivent dans une file sans écouteur ici
+        inherited = name in _QUEUE_LISTENERS and _QUEUE_LISTENERS[name][0] != os.getpid()
+
+        # 3. Gestion de la reconfiguration (Critique 2: "force=True")
+        if (force or inherited) and logger.handlers:
+            _stop_listener(name)
+            logger.handlers.clear()
+
+        # Si déjà configuré et pas de "force", on ne fait rien (handlers propres au logger :
+        # hasHandlers() compterait aussi ceux du logger racine)
+        if logger.handlers:
+            return logger
+
+        # 4. Empêcher la propagation au logger racine (Critique 1: "propagate")
+        # C'est la manière propre d'isoler le logger.
+        logger.propagate = False
+
+        # 5. Création du formatter personnalisé ou par défaut (Critique 4: "flexibilité")
+        default_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        default_date_format = '%Y-%m-%d %H:%M:%S'
+
+        formatter = logging.Formatter(
+            fmt=format_string or default_format,
+            datefmt=date_format or default_date_format
+        )
+
+        handlers = []
+        # 6. Handler pour la console
+        if log_to_console:
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setFormatter(formatter)
+            handlers.append(console_handler)
+
+        # 7. Handler pour le fichier
+        if log_to_file:
+            log_dir = os.path.dirname(log_file)
+            if log_dir:
+                os.makedirs(log_dir, exist_ok=True)
+            file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
+            file_handler.setFormatter(formatter)
+            handlers.append(file_handler)
+
+        if not queued:
+            for handler in handlers:
+                logger.addHandler(handler)
+            return logger
+
+        # 8. File d'attente : l'appelant ne fait que déposer l'enregistrement
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        _QUEUE_LISTENERS[name] = (os.getpid(), listener)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    return logger
+
+
+class _LoggerForwarder(logging.Handler):
+    """Handler de l'écouteur d'une file de processus enfants : confie l'enregistrement au logger du parent."""
+
+    def __init__(self, logger: logging.Logger):
+        super().__init__()
+        self._logger = logger
 
-    # Si déjà configuré et pas de "force", on ne fait rien
-    if logger.hasHandlers():
-        return logger
-
-    # 4. Empêcher la propagation au logger racine (Critique 1: "propagate")
-    # C'est la manière propre d'isoler le logger.
-    logger.propagate = False
-
-    # 5. Création du formatter personnalisé ou par défaut (Critique 4: "flexibilité")
-    default_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    default_date_format = '%Y-%m-%d %H:%M:%S'
-    
-    formatter = logging.Formatter(
-        fmt=format_string or default_format,
-        datefmt=date_format or default_date_format
-    )
-
-    # 6. Handler pour la console
-    if log_to_console:
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
-
-    # 7. Handler pour le fichier
-    log_dir = os.path.dirname(log_file)
-    if log_dir and not os.path.exists(log_dir):
-        os.makedirs(log_dir)
-    file_handler = logging.FileHandler(log_file, mode='a')
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    def emit(self, record: logging.LogRecord) -> None:
+        self._logger.handle(record)
 
+
+def process_log_queue(name: str) -> Any:
+    """
+    Retourne la file multiprocessing par laquelle les processus enfants (pools d'audit)
+    transmettent leurs enregistrements au logger `name` du processus courant.
+
+    Un seul écouteur par logger et par processus dépile cette file et confie chaque
+    enregistrement aux handlers du logger du parent : la console et le fichier de log ne sont
+    ouverts que par le parent, jamais par un processus enfant. La file est transmise aux
+    enfants à leur création (initializer d'un ProcessPoolExecutor, arguments d'un Process),
+    qui l'installent avec route_logging_to_queue.
+
+    Args:
+        name (str): Le nom du logger du parent.
+
+    Returns:
+        multiprocessing.Queue: La file partagée, créée au premier appel du processus.
+    """
+    with _QUEUE_LOCK:
+        entry = _PROCESS_QUEUES.get(name)
+        if entry is not None and entry[0] == os.getpid():
+            return entry[1]
+        log_queue = multiprocessing.Queue()
+        listener = logging.handlers.QueueListener(log_queue, _LoggerForwarder(logging.getLogger(name)))
+        listener.start()
+        _PROCESS_QUEUES[name] = (os.getpid(), log_queue, listener)
+        return log_queue
+
+
+def route_logging_to_queue(name: str, log_queue: Any, level: str = 'INFO') -> logging.Logger:
+    """
+    Initialiseur de processus enfant : le logger `name` dépose ses enregistrements dans la file
+    `log_queue` du parent (voir process_log_queue) au lieu d'écrire lui-même. Dans ce processus,
+    les appels suivants à configure_logging pour ce logger le laissent inchangé.
+
+    Args:
+        name (str): Le nom du logger.
+        log_queue (multiprocessing.Queue): La file retournée par process_log_queue dans le parent.
+        level (str): Le niveau de log minimum.
+
+    Returns:
+        logging.Logger: L'instance du logger routé.
+
+    Raises:
+        ValueError: Si le niveau de log fourni est invalide.
+    """
+    log_level = getattr(logging, level.upper(), None)
+    if not isinstance(log_level, int):
+        raise ValueError(f"Niveau de log invalide : {level}")
+
+    logger = logging.getLogger(name)
+    logger.setLevel(log_level)
+    with _QUEUE_LOCK:
+        # Handlers hérités du parent (fork) : leur file n'a pas d'écouteur dans ce processus
+        _stop_listener(name)
+        logger.handlers.clear()
+        logger.propagate = False
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _ROUTED_LOGGERS[name] = os.getpid()
     return logger
@@ -1,13 +1,274 @@
 # VeriQual/tools/common/profiling.py
 
 import pandas as pd
-from typing import List, Dict, Any, Optional, Tuple 
+from typing import List, Dict, Any, Optional, Tuple, Callable
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import re 
 from tools.common.logs import configure_logging
+from tools.common.arrow_metrics import (
+    arrow_column,
+    arrow_distinct_count,
+    arrow_numeric_stats,
+    arrow_value_counts,
+    arrow_datetime_bounds,
+    arrow_distinct_strings,
+)
+from tools.common.sketches import (
+    HyperLogLog, KLLSketch, HeavyHittersSketch, weighted_quantile, smallest_value, value_counts, series_to_state, series_from_state
+)
+from functools import lru_cache
 import numpy as np
 
+try: # Dépendance optionnelle : moteur RE2 (pyarrow.compute) pour la détection des PII
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = pc = None
 
-def profile_dataframe_columns(df: pd.DataFrame, header_map: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+# Liste des formats de date courants à essayer (F-04)
+COMMON_DATE_FORMATS = [
+    '%Y-%m-%d',        # 2023-01-15
+    '%d/%m/%Y',        # 15/01/2023
+    '%m/%d/%Y',        # 01/15/2023
+    '%Y/%m/%d',        # 2023/01/15
+    '%Y-%m-%d %H:%M:%S', # 2023-01-15 14:30:00
+    '%d/%m/%Y %H:%M:%S', # 15/01/2023 14:30:00
+    '%m/%d/%Y %H:%M:%S', # 01/15/2023 14:30:00
+]
+
+# Nombre de lignes non nulles échantillonnées pour présélectionner les formats de date (F-04).
+# Tirage proportionnel aux fréquences : un format reconnaissant plus de 50 % des lignes est
+# absent de l'échantillon avec une probabilité inférieure à 0.5**64.
+DATE_SAMPLE_SIZE = 64
+
+# Expressions régulières de détection des PII/DCP (F-05), dans l'ordre de restitution
+EMAIL_REGEX = r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+"
+PHONE_REGEX = r"\b(?:\+33|0)[1-9](?:[\s.-]?\d{2}){4}\b"
+# Ajout de la regex pour NIR (Numéro d'Inscription au Répertoire) - Exemple simplifié
+# Un NIR français a 13 chiffres + 2 clés, ou 15 chiffres.
+# Regex simplifiée: commence par 1 ou 2, puis 12 chiffres (pour couvrir les 13+2 et 15)
+# Pour une validation stricte, il faudrait une regex plus complexe et une validation de la clé.
+NIR_REGEX = r"^[12]\d{12}$"
+PII_PATTERNS = {
+    "EMAIL": EMAIL_REGEX,
+    "PHONE": PHONE_REGEX,
+    "NIR": NIR_REGEX,
+}
+
+# Exécuteurs du traitement parallèle des colonnes (voir map_columns)
+COLUMN_EXECUTORS = ("thread", "process")
+
+# Moteurs de recherche des PII : "python" (module re) ou "pyarrow" (RE2, si pyarrow est installé)
+PII_ENGINES = ("python", "pyarrow")
+
+# Quantiles restitués lorsque le sketch KLL est activé
+SKETCH_QUANTILES = {
+    "median": 0.5,
+    "q1": 0.25,
+    "q3": 0.75,
+    "p1": 0.01,
+    "p99": 0.99,
+}
+
+# Taille des tranches de lignes soumises au résumé de valeurs fréquentes (table de comptage bornée)
+HEAVY_HITTERS_BATCH_ROWS = 100_000
+
+
+def heavy_hitter_metrics(sketch: HeavyHittersSketch) -> Dict[str, Any]:
+    """
+    top_frequencies et most_frequent_value estimés par un résumé Misra-Gries, accompagnés
+    de la sous-estimation maximale des fréquences.
+
+    Args:
+        sketch (HeavyHittersSketch): Le résumé alimenté avec les valeurs de la colonne.
+
+    Returns:
+        Dict[str, Any]: top_frequencies, most_frequent_value et "top_frequencies_estimation".
+    """
+    top_counts = sketch.top(5)
+    most_frequent_value = sketch.most_frequent()
+    return {
+        "top_frequencies": {str(k): round(v / sketch.total, 4) for k, v in top_counts.items()},
+        "most_frequent_value": str(most_frequent_value) if most_frequent_value is not None else None,
+        "top_frequencies_estimation": sketch.summary(),
+    }
+
+
+def candidate_date_formats(col_data: pd.Series, sample_size: int = DATE_SAMPLE_SIZE) -> List[str]:
+    """
+    Présélectionne les formats de COMMON_DATE_FORMATS qui reconnaissent au moins une valeur
+    d'un échantillon (reproductible) de lignes non nulles de la colonne.
+
+    Args:
+        col_data (pd.Series): La colonne texte analysée.
+        sample_size (int): Nombre de lignes échantillonnées.
+
+    Returns:
+        List[str]: Les formats candidats, dans l'ordre de COMMON_DATE_FORMATS.
+    """
+    values = col_data.dropna()
+    if len(values) > sample_size:
+        values = values.sample(n=sample_size, random_state=0)
+    sample = pd.Series(values.unique(), dtype=object)
+    if sample.empty:
+        return []
+    candidates = []
+    for fmt in COMMON_DATE_FORMATS:
+        try:
+            if pd.to_datetime(sample, format=fmt, errors="coerce").notna().any():
+                candidates.append(fmt)
+        except Exception: # Capture les erreurs inattendues lors de la conversion avec format spécifique
+            continue
+    return candidates
+
+
+def count_date_matches(value_counts: pd.Series, fmt: str) -> int:
+    """
+    Nombre de lignes reconnues par un format de date, en n'analysant que les valeurs distinctes.
+
+    Args:
+        value_counts (pd.Series): Nombre d'occurrences de chaque valeur non nulle de la colonne.
+        fmt (str): Le format de date à vérifier.
+
+    Returns:
+        int: Somme des occurrences des valeurs reconnues par le format.
+    """
+    parsed = pd.to_datetime(pd.Series(value_counts.index, dtype=object), format=fmt, errors="coerce")
+    return int(value_counts.to_numpy()[parsed.notna().to_numpy()].sum())
+
+
+@lru_cache(maxsize=None)
+def _pii_alternation(pii_types: Tuple[str, ...]) -> "re.Pattern":
+    """Alternation compilée des expressions des types de PII donnés, un groupe nommé par type."""
+    return re.compile("|".join(f"(?P<{pii_type}>{PII_PATTERNS[pii_type]})" for pii_type in pii_types))
+
+
+def _scan_pii_python(values: List[str], pii_types: List[str]) -> set:
+    """Types de PII trouvés dans les valeurs (module re), avec arrêt dès que tous sont trouvés."""
+    found = set()
+    remaining = tuple(pii_types)
+    for value in values:
+        # Une valeur peut contenir plusieurs types : elle est re-scannée sans le type trouvé,
+        # une correspondance pouvant en masquer une autre qui la chevauche
+        match = _pii_alternation(remaining).search(value)
+        while match is not None:
+            found.add(match.lastgroup)
+            remaining = tuple(t for t in remaining if t != match.lastgroup)
+            if not remaining:
+                return found
+            match = _pii_alternation(remaining).search(value)
+    return found
+
+
+def _scan_pii_arrow(values: Any, pii_types: List[str]) -> set:
+    """Types de PII trouvés dans les valeurs (liste ou tableau Arrow ; RE2 vectorisé via pyarrow.compute)."""
+    array = values if isinstance(values, (pa.Array, pa.ChunkedArray)) else pa.array(values, type=pa.string())
+    # Préfiltre : une seule passe de l'alternation, puis vérification par type sur les valeurs retenues
+    array = array.filter(pc.match_substring_regex(array, "|".join(PII_PATTERNS[t] for t in pii_types)))
+    return {
+        pii_type for pii_type in pii_types
+        if len(array) > 0 and pc.any(pc.match_substring_regex(array, PII_PATTERNS[pii_type])).as_py()
+    }
+
+
+def scan_pii_values(col_data: pd.Series, exclude: Optional[set] = None, engine: str = "python") -> List[str]:
+    """
+    Recherche les types de PII (PII_PATTERNS) présents dans une colonne (F-05).
+
+    Chaque valeur distincte non nulle n'est analysée qu'une fois, par une alternation
+    compilée des expressions des types encore non trouvés : un type trouvé n'est plus
+    recherché, et l'analyse s'arrête dès que tous les types sont trouvés.
+
+    Args:
+        col_data (pd.Series): La colonne analysée.
+        exclude (Optional[set]): Types déjà trouvés (blocs précédents), à ne plus rechercher.
+        engine (str): "python" (module re) ou "pyarrow" (RE2 vectorisé ; "python" si pyarrow
+                      n'est pas installé). RE2 ne reconnaît que les chiffres ASCII pour \\d.
+
+    Returns:
+        List[str]: Les types trouvés, dans l'ordre de PII_PATTERNS.
+    """
+    if engine not in PII_ENGINES:
+        raise ValueError(f"Moteur de détection des PII inconnu : {engine} (attendu : {', '.join(PII_ENGINES)}).")
+    types_to_find = [pii_type for pii_type in PII_PATTERNS if not exclude or pii_type not in exclude]
+    if not types_to_find:
+        return []
+    array = arrow_column(col_data)
+    if engine == "pyarrow" and array is not None:
+        # Colonne du moteur Arrow : valeurs distinctes et recherche RE2 sans objets Python
+        distinct = arrow_distinct_strings(array)
+        found = _scan_pii_arrow(distinct, types_to_find) if len(distinct) else set()
+        return [pii_type for pii_type in types_to_find if pii_type in found]
+    # Valeurs distinctes seulement, converties en texte comme astype(str)
+    values = [value if isinstance(value, str) else str(value) for value in pd.unique(col_data.dropna())]
+    if not values:
+        return []
+    if engine == "pyarrow" and pa is not None:
+        found = _scan_pii_arrow(values, types_to_find)
+    else:
+        found = _scan_pii_python(values, types_to_find)
+    return [pii_type for pii_type in types_to_find if pii_type in found]
+
+
+def sketch_quantile_metrics(sketch: KLLSketch) -> Dict[str, Any]:
+    """
+    Métriques de quantiles estimées par un sketch KLL (SKETCH_QUANTILES), accompagnées
+    de la garantie d'erreur de rang du sketch.
+
+    Args:
+        sketch (KLLSketch): Le sketch alimenté avec les valeurs non nulles de la colonne.
+
+    Returns:
+        Dict[str, Any]: median, q1, q3, p1, p99 et "quantile_estimation".
+    """
+    metrics = {name: round(sketch.quantile(q), 4) for name, q in SKETCH_QUANTILES.items()}
+    metrics["quantile_estimation"] = sketch.summary()
+    return metrics
+
+
+def map_columns(func: Callable[..., Any], tasks: List[tuple], workers: int = 1, executor: str = "thread") -> List[Any]:
+    """
+    Applique `func` aux arguments de chaque colonne, en conservant l'ordre des colonnes.
+
+    Les colonnes étant indépendantes, elles peuvent être traitées en parallèle : "thread"
+    partage le DataFrame sans copie (gain limité aux opérations qui libèrent le GIL),
+    "process" copie chaque colonne vers un processus et parallélise aussi le code Python
+    (expressions régulières, conversions de dates).
+
+    Args:
+        func (Callable[..., Any]): Fonction de niveau module (sérialisable pour "process").
+        tasks (List[tuple]): Arguments de chaque appel, un tuple par colonne.
+        workers (int): Nombre maximal d'appels simultanés (1 : exécution séquentielle).
+        executor (str): "thread" ou "process".
+
+    Returns:
+        List[Any]: Les résultats, dans l'ordre des tâches.
+    """
+    if executor not in COLUMN_EXECUTORS:
+        raise ValueError(f"Exécuteur de colonnes inconnu : {executor} (attendu : {', '.join(COLUMN_EXECUTORS)}).")
+    if workers <= 1 or len(tasks) <= 1:
+        return [func(*task) for task in tasks]
+    workers = min(workers, len(tasks))
+    if executor == "thread":
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(func, *zip(*tasks)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Lots de colonnes par échange : limite le coût de communication des fichiers très larges
+        return list(pool.map(func, *zip(*tasks), chunksize=max(1, len(tasks) // (workers * 4))))
+
+
+def profile_dataframe_columns(
+    df: pd.DataFrame,
+    header_map: Optional[Dict[str, str]] = None,
+    approximate_distinct: bool = False,
+    hll_precision: int = 14,
+    quantile_sketch: bool = False,
+    kll_k: int = 200,
+    heavy_hitters: bool = False,
+    heavy_hitters_capacity: int = 64,
+    workers: int = 1,
+    executor: str = "thread"
+) -> List[Dict[str, Any]]:
     """
     Calcule un ensemble de métriques objectives et statistiques pour chaque colonne d'un DataFrame (F-03).
 
@@ -20,6 +281,20 @@ def profile_dataframe_columns(df: pd.DataFrame, header_map: Optional[Dict[str, s
         header_map (Optional[Dict[str, str]]): Un dictionnaire de mappage {original_name: normalized_name}
                                                 pour récupérer les noms de colonnes originaux.
                                                 Si None, le nom original est le nom actuel de la colonne.
+        approximate_distinct (bool): Si True, le nombre de valeurs distinctes est estimé par un sketch
+                                     HyperLogLog (mémoire fixe par colonne) au lieu d'un nunique exact.
+                                     Les métriques incluent alors "distinct_count_estimation" (borne d'erreur).
+        hll_precision (int): Précision du sketch HyperLogLog (2**precision registres d'un octet).
+        quantile_sketch (bool): Si True, median/q1/q3 (ainsi que p1/p99) des colonnes numériques sont
+                                estimés par un sketch KLL fusionnable. Les métriques incluent alors
+                                "quantile_estimation" (garantie d'erreur de rang).
+        kll_k (int): Paramètre de précision k du sketch KLL.
+        heavy_hitters (bool): Si True, top_frequencies et most_frequent_value des colonnes texte sont
+                              estimés par un résumé Misra-Gries à mémoire bornée, alimenté par tranches.
+                              Les métriques incluent alors "top_frequencies_estimation" (borne d'erreur).
+        heavy_hitters_capacity (int): Nombre maximal de compteurs du résumé.
+        workers (int): Nombre de colonnes profilées en parallèle (1 : séquentiel).
+        executor (str): "thread" ou "process" (voir map_columns).
 
     Returns:
         List[Dict[str, Any]]: Une liste de dictionnaires, chaque dictionnaire représentant le profil d'une colonne.
@@ -29,73 +304,130 @@ def profile_dataframe_columns(df: pd.DataFrame, header_map: Optional[Dict[str, s
                                 - pandas_dtype (type de données interne de Pandas)
                                 - metrics (dictionnaire des métriques calculées)
     """
-    profile = []
-    total_rows = len(df)
-
     # Créer un mappage inverse pour trouver le nom original à partir du nom normalisé
     reverse_header_map = {v: k for k, v in header_map.items()} if header_map else {}
 
-    for col_name in df.columns:
-        col_data = df[col_name]
+    tasks = [
+        (col_name, df[col_name], reverse_header_map.get(col_name, col_name), approximate_distinct,
+         hll_precision, quantile_sketch, kll_k, heavy_hitters, heavy_hitters_capacity)
+        for col_name in df.columns
+    ]
+    return map_columns(_profile_column, tasks, workers, executor)
 
-        # Métriques de base (applicables à tous les types de colonnes)
-        missing_ratio = col_data.isna().sum() / total_rows if total_rows > 0 else 0.0
-        unique_count = col_data.nunique(dropna=False)
-        unique_ratio = unique_count / total_rows if total_rows > 0 else 0.0
+def _profile_column(
+    col_name: str,
+    col_data: pd.Series,
+    original_name: str,
+    approximate_distinct: bool = False,
+    hll_precision: int = 14,
+    quantile_sketch: bool = False,
+    kll_k: int = 200,
+    heavy_hitters: bool = False,
+    heavy_hitters_capacity: int = 64
+) -> Dict[str, Any]:
+    """
+    Profil d'une colonne (voir profile_dataframe_columns) ; exécutable dans un processus du pool.
+    Les colonnes chargées par le moteur Arrow sont mesurées par les noyaux pyarrow.compute.
+    """
+    total_rows = len(col_data)
+    array = arrow_column(col_data) # None hors moteur Arrow
 
-        type_specific_metrics = {}
-        pandas_dtype = str(col_data.dtype)
+    # Métriques de base (applicables à tous les types de colonnes)
+    missing_count = array.null_count if array is not None else col_data.isna().sum()
+    missing_ratio = missing_count / total_rows if total_rows > 0 else 0.0
+    distinct_estimation = {}
+    if approximate_distinct:
+        sketch = HyperLogLog(hll_precision)
+        sketch.update(col_data)
+        distinct_estimation = {"distinct_count_estimation": sketch.summary(total_rows)}
+        unique_count = distinct_estimation["distinct_count_estimation"].pop("estimate")
+    else:
+        unique_count = arrow_distinct_count(array) if array is not None else col_data.nunique(dropna=False)
+    unique_ratio = unique_count / total_rows if total_rows > 0 else 0.0
 
-        # Métriques pour colonnes numériques
-        if pd.api.types.is_numeric_dtype(col_data):
-            numeric_stats = col_data.describe().to_dict()
-            type_specific_metrics = {
-                "min": round(numeric_stats.get('min', float('nan')), 4),
-                "max": round(numeric_stats.get('max', float('nan')), 4),
-                "mean": round(numeric_stats.get('mean', float('nan')), 4),
-                "std": round(numeric_stats.get('std', float('nan')), 4),
-                "median": round(col_data.median(), 4) if not col_data.empty and col_data.count() > 0 else float('nan'),
-                "q1": round(col_data.quantile(0.25), 4) if not col_data.empty and col_data.count() > 0 else float('nan'),
-                "q3": round(col_data.quantile(0.75), 4) if not col_data.empty and col_data.count() > 0 else float('nan'),
-            }
-        # Métriques pour colonnes catégorielles/texte (objets ou strings)
-        elif pd.api.types.is_object_dtype(col_data) or pd.api.types.is_string_dtype(col_data):
-            top_frequencies = col_data.value_counts(normalize=True).head(5).to_dict()
+    type_specific_metrics = {}
+    pandas_dtype = str(col_data.dtype)
+
+    # Métriques pour colonnes numériques
+    if pd.api.types.is_numeric_dtype(col_data) and array is not None:
+        type_specific_metrics = {name: round(value, 4) for name, value in arrow_numeric_stats(array).items()}
+        if quantile_sketch:
+            sketch = KLLSketch(kll_k)
+            sketch.update(array.drop_null().to_numpy().astype('float64'))
+            type_specific_metrics.update(sketch_quantile_metrics(sketch))
+    elif pd.api.types.is_numeric_dtype(col_data):
+        if pd.api.types.is_float_dtype(col_data) and col_data.dtype.itemsize < 8:
+            # float32 (chargement optimisé en mémoire) : statistiques cumulées en float64
+            col_data = col_data.astype('float64')
+        numeric_stats = col_data.describe().to_dict()
+        type_specific_metrics = {
+            "min": round(numeric_stats.get('min', float('nan')), 4),
+            "max": round(numeric_stats.get('max', float('nan')), 4),
+            "mean": round(numeric_stats.get('mean', float('nan')), 4),
+            "std": round(numeric_stats.get('std', float('nan')), 4),
+            "median": round(col_data.median(), 4) if not col_data.empty and col_data.count() > 0 else float('nan'),
+            "q1": round(col_data.quantile(0.25), 4) if not col_data.empty and col_data.count() > 0 else float('nan'),
+            "q3": round(col_data.quantile(0.75), 4) if not col_data.empty and col_data.count() > 0 else float('nan'),
+        }
+        if quantile_sketch:
+            sketch = KLLSketch(kll_k)
+            sketch.update(col_data.dropna().to_numpy(dtype='float64'))
+            type_specific_metrics.update(sketch_quantile_metrics(sketch))
+    # Métriques pour colonnes catégorielles/texte (objets ou strings)
+    elif pd.api.types.is_object_dtype(col_data) or pd.api.types.is_string_dtype(col_data):
+        if heavy_hitters:
+            sketch = HeavyHittersSketch(heavy_hitters_capacity)
+            for start in range(0, len(col_data), HEAVY_HITTERS_BATCH_ROWS):
+                sketch.update(col_data.iloc[start:start + HEAVY_HITTERS_BATCH_ROWS])
+            type_specific_metrics.update(heavy_hitter_metrics(sketch))
+        else:
+            # Une seule table de comptage pour les fréquences et le mode
+            counts = arrow_value_counts(array) if array is not None else value_counts(col_data)
+            top_frequencies = (counts.head(5) / counts.sum()).to_dict()
             type_specific_metrics["top_frequencies"] = {str(k): round(v, 4) for k, v in top_frequencies.items()}
-            type_specific_metrics["most_frequent_value"] = str(col_data.mode()[0]) if not col_data.mode().empty else None
-            
-        # Métriques pour colonnes de date/heure
-        elif pd.api.types.is_datetime64_any_dtype(col_data):
-            try:
-                col_data_dt = pd.to_datetime(col_data, errors='coerce')
-                if not col_data_dt.dropna().empty:
-                    type_specific_metrics = {
-                        "min_date": str(col_data_dt.min()),
-                        "max_date": str(col_data_dt.max()),
-                    }
-                else:
-                    type_specific_metrics = {
-                        "min_date": None,
-                        "max_date": None,
-                    }
-            except Exception:
-                pass 
-
-
-        profile.append({
-            "column_name": col_name,
-            "original_name": reverse_header_map.get(col_name, col_name), # Récupère le nom original
-            "pandas_dtype": pandas_dtype, # Ajout du dtype Pandas
-            "metrics": {
-                "missing_values_ratio": round(missing_ratio, 4),
-                "unique_values_ratio": round(unique_ratio, 4),
-                "total_unique_values": int(unique_count), 
-                **type_specific_metrics # Ajouter les métriques spécifiques au type
-            }
-        })
-    return profile
+            modes = counts[counts == counts.max()].index.tolist() if not counts.empty else []
+            type_specific_metrics["most_frequent_value"] = str(smallest_value(modes)) if modes else None
+        
+    # Métriques pour colonnes de date/heure
+    elif pd.api.types.is_datetime64_any_dtype(col_data) and array is not None:
+        min_date, max_date = arrow_datetime_bounds(array)
+        type_specific_metrics = {"min_date": min_date, "max_date": max_date}
+    elif pd.api.types.is_datetime64_any_dtype(col_data):
+        try:
+            col_data_dt = pd.to_datetime(col_data, errors='coerce')
+            if not col_data_dt.dropna().empty:
+                type_specific_metrics = {
+                    "min_date": str(col_data_dt.min()),
+                    "max_date": str(col_data_dt.max()),
+                }
+            else:
+                type_specific_metrics = {
+                    "min_date": None,
+                    "max_date": None,
+                }
+        except Exception:
+            pass 
+
+
+    return {
+        "column_name": col_name,
+        "original_name": original_name, # Nom avant normalisation
+        "pandas_dtype": pandas_dtype, # Ajout du dtype Pandas
+        "metrics": {
+            "missing_values_ratio": round(missing_ratio, 4),
+            "unique_values_ratio": round(unique_ratio, 4),
+            "total_unique_values": int(unique_count), 
+            **distinct_estimation, # Borne d'erreur si le nombre de valeurs distinctes est estimé
+            **type_specific_metrics # Ajouter les métriques spécifiques au type
+        }
+    }
 
-def infer_semantic_types(profiled_columns: List[Dict[str, Any]], df: pd.DataFrame) -> List[Dict[str, Any]]:
+def infer_semantic_types(
+    profiled_columns: List[Dict[str, Any]],
+    df: pd.DataFrame,
+    workers: int = 1,
+    executor: str = "thread"
+) -> List[Dict[str, Any]]:
     """
     Interprète les métriques de profilage et le contenu du DataFrame pour déduire le type
     de données métier le plus probable pour chaque colonne (F-04).
@@ -103,108 +435,518 @@ def infer_semantic_types(profiled_columns: List[Dict[str, Any]], df: pd.DataFram
     Args:
         profiled_columns (List[Dict[str, Any]]): Liste des profils de colonnes générés par profile_dataframe_columns.
         df (pd.DataFrame): Le DataFrame original (ou normalisé) pour un accès direct aux données.
+        workers (int): Nombre de colonnes typées en parallèle (1 : séquentiel).
+        executor (str): "thread" ou "process" (voir map_columns).
 
     Returns:
         List[Dict[str, Any]]: La liste des profils de colonnes complétée avec le champ "data_type_detected".
     """
-    # Liste des formats de date courants à essayer
-    COMMON_DATE_FORMATS = [
-        '%Y-%m-%d',        # 2023-01-15
-        '%d/%m/%Y',        # 15/01/2023
-        '%m/%d/%Y',        # 01/15/2023
-        '%Y/%m/%d',        # 2023/01/15
-        '%Y-%m-%d %H:%M:%S', # 2023-01-15 14:30:00
-        '%d/%m/%Y %H:%M:%S', # 15/01/2023 14:30:00
-        '%m/%d/%Y %H:%M:%S', # 01/15/2023 14:30:00
-    ]
-
-    for col_profile in profiled_columns:
-        col_name = col_profile["column_name"]
-        col_data = df[col_name] 
-
-        data_type = "Inconnu" # Valeur par défaut pour les types non gérés
-
-        if pd.api.types.is_integer_dtype(col_data):
-            data_type = "Entier"
-        elif pd.api.types.is_float_dtype(col_data):
-            data_type = "Flottant"
-        elif pd.api.types.is_datetime64_any_dtype(col_data):
-            data_type = "Date"
-        elif pd.api.types.is_object_dtype(col_data) or pd.api.types.is_string_dtype(col_data):
-            # Tenter de déduire le type Date avec des formats spécifiques pour éviter les warnings
-            is_date_candidate = False
-            for fmt in COMMON_DATE_FORMATS:
-                try:
-                    col_as_date = pd.to_datetime(col_data, format=fmt, errors="coerce")
-                    # Heuristique: si plus de 50% des valeurs sont des dates valides, inférer comme Date
-                    if col_as_date.count() / len(col_data) > 0.5 and not col_as_date.dropna().empty:
-                        data_type = "Date"
-                        is_date_candidate = True
-                        break # Un format a fonctionné, on sort de la boucle des formats
-                except Exception: # Capture les erreurs inattendues lors de la conversion avec format spécifique
-                    continue # Essayer le format suivant
-            
-            if not is_date_candidate:
-                # Si aucun format spécifique n'a fonctionné, ou si le ratio est trop bas,
-                # on tente une dernière fois sans format spécifique (où le warning pourrait apparaître si non géré)
-                # ou on considère directement que c'est du texte.
-                # Pour V1, on va dire que si les formats courants ne marchent pas, c'est Texte.
-                data_type = "Texte"
-        else:
-            # Pour les autres dtypes (ex: boolean, category), par défaut à Texte pour V1
-            data_type = "Texte" 
-        
+    tasks = [(df[col_profile["column_name"]],) for col_profile in profiled_columns]
+    data_types = map_columns(_infer_column_semantic_type, tasks, workers, executor)
+    for col_profile, data_type in zip(profiled_columns, data_types):
         # Ajouter le type sémantique détecté au profil de la colonne
         col_profile["data_type_detected"] = data_type
         
     return profiled_columns
 
-def detect_sensitive_data(df: pd.DataFrame, column_profiles: List[Dict[str, Any]]) -> Tuple[bool, List[Dict[str, Any]]]:
+def _infer_column_semantic_type(col_data: pd.Series) -> str:
+    """Type métier d'une colonne (voir infer_semantic_types) ; exécutable dans un processus du pool."""
+    data_type = "Inconnu" # Valeur par défaut pour les types non gérés
+
+    if pd.api.types.is_integer_dtype(col_data):
+        data_type = "Entier"
+    elif pd.api.types.is_float_dtype(col_data):
+        data_type = "Flottant"
+    elif pd.api.types.is_datetime64_any_dtype(col_data):
+        data_type = "Date"
+    elif pd.api.types.is_object_dtype(col_data) or pd.api.types.is_string_dtype(col_data):
+        # Tenter de déduire le type Date avec des formats spécifiques pour éviter les warnings :
+        # présélection sur un échantillon, puis vérification sur les seules valeurs distinctes
+        is_date_candidate = False
+        candidates = candidate_date_formats(col_data)
+        value_counts = col_data.value_counts(dropna=True, sort=False) if candidates else None
+        for fmt in candidates:
+            try:
+                valid_count = count_date_matches(value_counts, fmt)
+                # Heuristique: si plus de 50% des valeurs sont des dates valides, inférer comme Date
+                if valid_count / len(col_data) > 0.5 and valid_count > 0:
+                    data_type = "Date"
+                    is_date_candidate = True
+                    break # Un format a fonctionné, on sort de la boucle des formats
+            except Exception: # Capture les erreurs inattendues lors de la conversion avec format spécifique
+                continue # Essayer le format suivant
+        
+        if not is_date_candidate:
+            # Si aucun format spécifique n'a fonctionné, ou si le ratio est trop bas,
+            # on tente une dernière fois sans format spécifique (où le warning pourrait apparaître si non géré)
+            # ou on considère directement que c'est du texte.
+            # Pour V1, on va dire que si les formats courants ne marchent pas, c'est Texte.
+            data_type = "Texte"
+    else:
+        # Pour les autres dtypes (ex: boolean, category), par défaut à Texte pour V1
+        data_type = "Texte"
+
+    return data_type
+
+def detect_sensitive_data(
+    df: pd.DataFrame,
+    column_profiles: List[Dict[str, Any]],
+    pii_engine: str = "python",
+    workers: int = 1,
+    executor: str = "thread"
+) -> Tuple[bool, List[Dict[str, Any]]]:
     """
     Scanne le contenu du DataFrame pour identifier la présence potentielle de Données Personnelles (PII/DCP) (F-05).
 
     Args:
         df (pd.DataFrame): Le DataFrame à analyser.
         column_profiles (List[Dict[str, Any]]): Liste des profils de colonnes (avec data_type_detected).
+        pii_engine (str): Moteur de recherche des expressions régulières (voir scan_pii_values).
+        workers (int): Nombre de colonnes scannées en parallèle (1 : séquentiel).
+        executor (str): "thread" ou "process" (voir map_columns).
 
     Returns:
         Tuple[bool, List[Dict[str, Any]]]:
             - True si des données sensibles sont détectées, False sinon.
             - Liste de dictionnaires des colonnes détectées et des types de PII.
     """
-    EMAIL_REGEX = r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+"
-    PHONE_REGEX = r"\b(?:\+33|0)[1-9](?:[\s.-]?\d{2}){4}\b"
-    # Ajout de la regex pour NIR (Numéro d'Inscription au Répertoire) - Exemple simplifié
-    # Un NIR français a 13 chiffres + 2 clés, ou 15 chiffres.
-    # Regex simplifiée: commence par 1 ou 2, puis 12 chiffres (pour couvrir les 13+2 et 15)
-    # Pour une validation stricte, il faudrait une regex plus complexe et une validation de la clé.
-    NIR_REGEX = r"^[12]\d{12}$" 
+    # On ne scanne que les colonnes qui ont été détectées comme du texte
+    text_columns = [col["column_name"] for col in column_profiles if col.get("data_type_detected") == "Texte"]
+    # Recherche sur les valeurs distinctes, une alternation de toutes les regex par valeur
+    tasks = [(df[col_name], None, pii_engine) for col_name in text_columns]
+    found_types = map_columns(scan_pii_values, tasks, workers, executor)
 
+    detected_columns = [
+        {"column_name": col_name, "pii_types": pii_types}
+        for col_name, pii_types in zip(text_columns, found_types)
+        if pii_types
+    ]
 
-    detected_columns = []
+    contains_sensitive_data = len(detected_columns) > 0
+    return contains_sensitive_data, detected_columns
 
-    for col in column_profiles:
-        # On ne scanne que les colonnes qui ont été détectées comme du texte
-        if col.get("data_type_detected") != "Texte":
-            continue 
 
-        col_name = col["column_name"]
-        # Convertir la colonne en string pour appliquer les regex, gérer les NaN
-        col_data_str = df[col_name].astype(str).fillna('') 
+# ---------------------------------------------------------------------------
+# Mode streaming : accumulateurs fusionnables par colonne (F-03 / F-04 / F-05)
+# ---------------------------------------------------------------------------
+
+def _merge_chunk_dtypes(current: Any, new: Any) -> Any:
+    """
+    Combine les dtypes observés sur deux blocs d'une même colonne, comme le ferait
+    une lecture complète : int + float -> float, numérique + texte -> texte, sinon object.
+    """
+    if current is None or current == new:
+        return new
+    if pd.api.types.is_string_dtype(current) and not pd.api.types.is_object_dtype(current):
+        return current
+    if pd.api.types.is_string_dtype(new) and not pd.api.types.is_object_dtype(new):
+        return new
+    numeric_types = (current, new)
+    if all(pd.api.types.is_numeric_dtype(t) and not pd.api.types.is_bool_dtype(t) for t in numeric_types):
+        return np.result_type(current, new)
+    return np.dtype('object')
+
+def _dtype_kind(dtype: Any) -> str:
+    """Famille d'un dtype, utilisée pour repérer les colonnes lues différemment selon les blocs."""
+    if pd.api.types.is_bool_dtype(dtype):
+        return "bool"
+    if pd.api.types.is_numeric_dtype(dtype):
+        return "numeric"
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "datetime"
+    return "text"
+
+class ColumnProfileAccumulator:
+    """
+    Accumulateur fusionnable des métriques d'une colonne lue par blocs (mode streaming).
+
+    Chaque bloc alimente en une passe les compteurs nécessaires au profilage (F-03),
+    au typage sémantique (F-04) et à la détection PII (F-05). Deux accumulateurs d'une
+    même colonne peuvent être fusionnés (merge), ce qui permet de répartir la lecture
+    entre plusieurs blocs ou plusieurs processus.
+
+    Les comptes de valeurs distinctes sont exacts : leur mémoire dépend de la cardinalité
+    de la colonne, et non du nombre de lignes. Avec `hll_precision`, le nombre de valeurs
+    distinctes est estimé par un sketch HyperLogLog fusionnable ; avec `kll_k`, les quantiles
+    numériques le sont par un sketch KLL, et avec `heavy_hitters_capacity` les valeurs
+    fréquentes des colonnes texte par un résumé Misra-Gries. Lorsque le sketch HyperLogLog
+    est combiné au sketch propre au type de la colonne (KLL ou Misra-Gries), les comptes de
+    valeurs ne sont plus conservés : la mémoire de la colonne devient fixe. `pii_engine`
+    choisit le moteur de recherche des PII (voir scan_pii_values).
+    """
+
+    def __init__(
+        self,
+        column_name: str,
+        original_name: Optional[str] = None,
+        hll_precision: Optional[int] = None,
+        kll_k: Optional[int] = None,
+        heavy_hitters_capacity: Optional[int] = None,
+        pii_engine: str = "python"
+    ):
+        self.column_name = column_name
+        self.original_name = original_name if original_name is not None else column_name
+        self.dtype = None
+        self.total_rows = 0
+        self.missing_count = 0
+        self.value_counts: Optional[pd.Series] = None # valeurs non nulles -> occurrences
+        self.distinct_sketch = HyperLogLog(hll_precision) if hll_precision is not None else None
+        self.quantile_sketch = KLLSketch(kll_k) if kll_k is not None else None
+        self.heavy_hitters = HeavyHittersSketch(heavy_hitters_capacity) if heavy_hitters_capacity is not None else None
+        # Familles de dtype ("numeric", "text", ...) des blocs contenant au moins une valeur
+        self.value_kinds = set()
+        # Moments numériques, fusionnés selon l'algorithme de Chan et al.
+        self.numeric_count = 0
+        self.numeric_mean = 0.0
+        self.numeric_m2 = 0.0
+        self.numeric_min = None
+        self.numeric_max = None
+        self.datetime_min = None
+        self.datetime_max = None
+        # F-04 : nombre de valeurs reconnues par format de date (blocs texte uniquement)
+        self.date_format_counts = {fmt: 0 for fmt in COMMON_DATE_FORMATS}
+        # F-05 : types de PII rencontrés
+        self.pii_types = set()
+        self.pii_engine = pii_engine
+
+    def _add_value_counts(self, counts: pd.Series) -> None:
+        if self.value_counts is None:
+            self.value_counts = counts
+        elif not counts.empty:
+            # sort=False conserve l'ordre de première apparition (départage des ex aequo)
+            self.value_counts = pd.concat([self.value_counts, counts]).groupby(level=0, sort=False).sum()
+
+    def _merge_moments(self, count: int, mean: float, m2: float, minimum: Any, maximum: Any) -> None:
+        if count == 0:
+            return
+        total = self.numeric_count + count
+        delta = mean - self.numeric_mean
+        self.numeric_mean += delta * count / total
+        self.numeric_m2 += m2 + delta ** 2 * self.numeric_count * count / total
+        self.numeric_count = total
+        self.numeric_min = minimum if self.numeric_min is None else min(self.numeric_min, minimum)
+        self.numeric_max = maximum if self.numeric_max is None else max(self.numeric_max, maximum)
+
+    @property
+    def has_type_conflict(self) -> bool:
+        """
+        True si la colonne a été lue comme numérique dans certains blocs et comme texte dans d'autres.
+        Les valeurs de ces blocs ne sont alors plus comparables : la colonne doit être relue
+        avec son dtype final (voir AuditRunner._run_streaming_stages).
+        """
+        return len(self.value_kinds) > 1
+
+    def update(self, col_data: pd.Series) -> None:
+        """Intègre un bloc de valeurs de la colonne."""
+        self.dtype = _merge_chunk_dtypes(self.dtype, col_data.dtype)
+        self.total_rows += len(col_data)
+        missing_count = int(col_data.isna().sum())
+        self.missing_count += missing_count
+        if missing_count < len(col_data):
+            self.value_kinds.add(_dtype_kind(col_data.dtype))
+        is_numeric = pd.api.types.is_numeric_dtype(col_data)
+        is_text = pd.api.types.is_object_dtype(col_data) or pd.api.types.is_string_dtype(col_data)
+        # Comptes de valeurs inutiles si les distincts et les métriques propres au type sont estimés
+        type_sketch = self.quantile_sketch if is_numeric else self.heavy_hitters if is_text else None
+        value_counts = None
+        if self.distinct_sketch is None or type_sketch is None:
+            value_counts = col_data.value_counts(dropna=True, sort=False)
+            self._add_value_counts(value_counts)
+        if self.distinct_sketch is not None:
+            self.distinct_sketch.update(col_data)
+
+        if is_numeric:
+            values = col_data.dropna().astype('float64')
+            if not values.empty:
+                mean = float(values.mean())
+                self._merge_moments(len(values), mean, float(((values - mean) ** 2).sum()), float(values.min()), float(values.max()))
+                if self.quantile_sketch is not None:
+                    self.quantile_sketch.update(values.to_numpy())
+        elif pd.api.types.is_datetime64_any_dtype(col_data):
+            values = col_data.dropna()
+            if not values.empty:
+                self.datetime_min = values.min() if self.datetime_min is None else min(self.datetime_min, values.min())
+                self.datetime_max = values.max() if self.datetime_max is None else max(self.datetime_max, values.max())
+        elif is_text:
+            if self.heavy_hitters is not None:
+                self.heavy_hitters.update(col_data)
+            # Formats présélectionnés sur un échantillon du bloc, ou déjà reconnus dans un bloc précédent
+            candidates = set(candidate_date_formats(col_data))
+            candidates.update(fmt for fmt, count in self.date_format_counts.items() if count > 0)
+            if candidates and value_counts is None:
+                value_counts = col_data.value_counts(dropna=True, sort=False)
+            for fmt in candidates:
+                try:
+                    self.date_format_counts[fmt] += count_date_matches(value_counts, fmt)
+                except Exception:
+                    continue
+            # Un type déjà rencontré n'a plus besoin d'être recherché dans les blocs suivants
+            self.pii_types.update(scan_pii_values(col_data, exclude=self.pii_types, engine=self.pii_engine))
+
+    def merge(self, other: "ColumnProfileAccumulator") -> "ColumnProfileAccumulator":
+        """Fusionne l'accumulateur d'une autre portion de la même colonne dans celui-ci."""
+        if other.dtype is not None:
+            self.dtype = _merge_chunk_dtypes(self.dtype, other.dtype)
+        self.total_rows += other.total_rows
+        self.missing_count += other.missing_count
+        self.value_kinds |= other.value_kinds
+        if other.value_counts is not None:
+            self._add_value_counts(other.value_counts)
+        if self.distinct_sketch is not None and other.distinct_sketch is not None:
+            self.distinct_sketch.merge(other.distinct_sketch)
+        if self.quantile_sketch is not None and other.quantile_sketch is not None:
+            self.quantile_sketch.merge(other.quantile_sketch)
+        if self.heavy_hitters is not None and other.heavy_hitters is not None:
+            self.heavy_hitters.merge(other.heavy_hitters)
+        self._merge_moments(other.numeric_count, other.numeric_mean, other.numeric_m2, other.numeric_min, other.numeric_max)
+        for bound in ("datetime_min", "datetime_max"):
+            mine, theirs = getattr(self, bound), getattr(other, bound)
+            if theirs is not None:
+                pick = min if bound == "datetime_min" else max
+                setattr(self, bound, theirs if mine is None else pick(mine, theirs))
+        for fmt, count in other.date_format_counts.items():
+            self.date_format_counts[fmt] = self.date_format_counts.get(fmt, 0) + count
+        self.pii_types |= other.pii_types
+        return self
+
+    def to_state(self) -> Dict[str, Any]:
+        """
+        État de l'accumulateur en données simples (scalaires, listes, dictionnaires et tableaux
+        numpy numériques), sans objet Python arbitraire : il peut être enregistré puis relu sans
+        pickle (audit incrémental).
+        """
+        def timestamp(value: Any) -> Optional[str]:
+            return None if value is None else pd.Timestamp(value).isoformat()
+
+        return {
+            "column_name": self.column_name,
+            "original_name": self.original_name,
+            "dtype": None if self.dtype is None else str(self.dtype),
+            "total_rows": self.total_rows,
+            "missing_count": self.missing_count,
+            "value_counts": None if self.value_counts is None else series_to_state(self.value_counts),
+            "distinct_sketch": None if self.distinct_sketch is None else self.distinct_sketch.to_state(),
+            "quantile_sketch": None if self.quantile_sketch is None else self.quantile_sketch.to_state(),
+            "heavy_hitters": None if self.heavy_hitters is None else self.heavy_hitters.to_state(),
+            "value_kinds": sorted(self.value_kinds),
+            "numeric_count": self.numeric_count,
+            "numeric_mean": self.numeric_mean,
+            "numeric_m2": self.numeric_m2,
+            "numeric_min": self.numeric_min,
+            "numeric_max": self.numeric_max,
+            "datetime_min": timestamp(self.datetime_min),
+            "datetime_max": timestamp(self.datetime_max),
+            "date_format_counts": dict(self.date_format_counts),
+            "pii_types": sorted(self.pii_types),
+            "pii_engine": self.pii_engine,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "ColumnProfileAccumulator":
+        """
+        Reconstruit un accumulateur à partir de to_state.
+
+        Raises:
+            KeyError, TypeError, ValueError: Si l'état est incomplet ou incohérent.
+        """
+        def number(value: Any) -> Optional[float]:
+            return None if value is None else float(value)
+
+        accumulator = cls(str(state["column_name"]), str(state["original_name"]), pii_engine=str(state["pii_engine"]))
+        accumulator.dtype = None if state["dtype"] is None else pd.api.types.pandas_dtype(state["dtype"])
+        accumulator.total_rows = int(state["total_rows"])
+        accumulator.missing_count = int(state["missing_count"])
+        if state["value_counts"] is not None:
+            accumulator.value_counts = series_from_state(state["value_counts"])
+        if state["distinct_sketch"] is not None:
+            accumulator.distinct_sketch = HyperLogLog.from_state(state["distinct_sketch"])
+        if state["quantile_sketch"] is not None:
+            accumulator.quantile_sketch = KLLSketch.from_state(state["quantile_sketch"])
+        if state["heavy_hitters"] is not None:
+            accumulator.heavy_hitters = HeavyHittersSketch.from_state(state["heavy_hitters"])
+        accumulator.value_kinds = {str(kind) for kind in state["value_kinds"]}
+        accumulator.numeric_count = int(state["numeric_count"])
+        accumulator.numeric_mean = float(state["numeric_mean"])
+        accumulator.numeric_m2 = float(state["numeric_m2"])
+        accumulator.numeric_min = number(state["numeric_min"])
+        accumulator.numeric_max = number(state["numeric_max"])
+        for bound in ("datetime_min", "datetime_max"):
+            setattr(accumulator, bound, None if state[bound] is None else pd.Timestamp(state[bound]))
+        accumulator.date_format_counts = {str(fmt): int(count) for fmt, count in state["date_format_counts"].items()}
+        accumulator.pii_types = {str(pii_type) for pii_type in state["pii_types"]}
+        return accumulator
+
+    def to_profile(self) -> Dict[str, Any]:
+        """Produit le profil de la colonne, au même format que profile_dataframe_columns (F-03)."""
+        total_rows = self.total_rows
+        counts = self.value_counts if self.value_counts is not None else pd.Series(dtype="int64")
+        missing_ratio = self.missing_count / total_rows if total_rows > 0 else 0.0
+        distinct_estimation = {}
+        if self.distinct_sketch is not None:
+            distinct_estimation = {"distinct_count_estimation": self.distinct_sketch.summary(total_rows)}
+            unique_count = distinct_estimation["distinct_count_estimation"].pop("estimate")
+        else:
+            unique_count = len(counts) + (1 if self.missing_count > 0 else 0) # nunique(dropna=False)
+        unique_ratio = unique_count / total_rows if total_rows > 0 else 0.0
+
+        type_specific_metrics = {}
+        dtype = self.dtype if self.dtype is not None else np.dtype('object')
+
+        if pd.api.types.is_numeric_dtype(dtype):
+            if self.numeric_count > 0:
+                std = float(np.sqrt(self.numeric_m2 / (self.numeric_count - 1))) if self.numeric_count > 1 else float('nan')
+                type_specific_metrics = {
+                    "min": round(self.numeric_min, 4),
+                    "max": round(self.numeric_max, 4),
+                    "mean": round(self.numeric_mean, 4),
+                    "std": round(std, 4),
+                }
+                if self.quantile_sketch is not None:
+                    type_specific_metrics.update(sketch_quantile_metrics(self.quantile_sketch))
+                else:
+                    numeric_counts = counts.groupby(counts.index.astype('float64')).sum().sort_index()
+                    values = numeric_counts.index.to_numpy(dtype='float64')
+                    occurrences = numeric_counts.to_numpy()
+                    type_specific_metrics.update({
+                        "median": round(weighted_quantile(values, occurrences, 0.5), 4),
+                        "q1": round(weighted_quantile(values, occurrences, 0.25), 4),
+                        "q3": round(weighted_quantile(values, occurrences, 0.75), 4),
+                    })
+            else:
+                type_specific_metrics = {key: float('nan') for key in ("min", "max", "mean", "std", "median", "q1", "q3")}
+                if self.quantile_sketch is not None:
+                    type_specific_metrics.update(sketch_quantile_metrics(self.quantile_sketch))
+        elif pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+            if self.heavy_hitters is not None:
+                type_specific_metrics.update(heavy_hitter_metrics(self.heavy_hitters))
+            else:
+                non_null = counts.sum()
+                top = counts.sort_values(ascending=False, kind='stable').head(5)
+                type_specific_metrics["top_frequencies"] = {str(k): round(v / non_null, 4) for k, v in top.items()}
+                modes = counts[counts == counts.max()].index.tolist() if not counts.empty else []
+                type_specific_metrics["most_frequent_value"] = str(smallest_value(modes)) if modes else None
+        elif pd.api.types.is_datetime64_any_dtype(dtype):
+            type_specific_metrics = {
+                "min_date": str(self.datetime_min) if self.datetime_min is not None else None,
+                "max_date": str(self.datetime_max) if self.datetime_max is not None else None,
+            }
+
+        return {
+            "column_name": self.column_name,
+            "original_name": self.original_name,
+            "pandas_dtype": str(dtype),
+            "metrics": {
+                "missing_values_ratio": round(missing_ratio, 4),
+                "unique_values_ratio": round(unique_ratio, 4),
+                "total_unique_values": int(unique_count),
+                **distinct_estimation,
+                **type_specific_metrics
+            }
+        }
+
+    def infer_semantic_type(self) -> str:
+        """Déduit le type métier de la colonne, selon les règles de infer_semantic_types (F-04)."""
+        dtype = self.dtype if self.dtype is not None else np.dtype('object')
+        if pd.api.types.is_integer_dtype(dtype):
+            return "Entier"
+        if pd.api.types.is_float_dtype(dtype):
+            return "Flottant"
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return "Date"
+        if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+            for fmt in COMMON_DATE_FORMATS:
+                valid_count = self.date_format_counts.get(fmt, 0)
+                # Heuristique: si plus de 50% des valeurs sont des dates valides, inférer comme Date
+                if self.total_rows > 0 and valid_count > 0 and valid_count / self.total_rows > 0.5:
+                    return "Date"
+        return "Texte"
+
+
+def accumulate_dataframe_columns(
+    df: pd.DataFrame,
+    accumulators: Optional[Dict[str, ColumnProfileAccumulator]] = None,
+    header_map: Optional[Dict[str, str]] = None,
+    **accumulator_options: Any
+) -> Dict[str, ColumnProfileAccumulator]:
+    """
+    Alimente les accumulateurs de colonnes avec un bloc du fichier (mode streaming).
+
+    Args:
+        df (pd.DataFrame): Le bloc à intégrer (en-têtes déjà normalisés).
+        accumulators (Optional[Dict[str, ColumnProfileAccumulator]]): Accumulateurs existants,
+                                                                      créés au premier bloc si None.
+        header_map (Optional[Dict[str, str]]): Mappage {original_name: normalized_name}.
+        **accumulator_options: Options transmises aux accumulateurs créés (ex: hll_precision).
+
+    Returns:
+        Dict[str, ColumnProfileAccumulator]: Accumulateurs par colonne, dans l'ordre des colonnes.
+    """
+    if accumulators is None:
+        reverse_header_map = {v: k for k, v in header_map.items()} if header_map else {}
+        accumulators = {
+            col_name: ColumnProfileAccumulator(col_name, reverse_header_map.get(col_name, col_name), **accumulator_options)
+            for col_name in df.columns
+        }
+    for col_name in df.columns:
+        accumulators[col_name].update(df[col_name])
+    return accumulators
+
+def profile_accumulated_columns(accumulators: Dict[str, ColumnProfileAccumulator]) -> List[Dict[str, Any]]:
+    """
+    Équivalent streaming de profile_dataframe_columns (F-03).
+
+    Args:
+        accumulators (Dict[str, ColumnProfileAccumulator]): Accumulateurs alimentés par tous les blocs.
+
+    Returns:
+        List[Dict[str, Any]]: Profils de colonnes, au même format que profile_dataframe_columns.
+    """
+    return [accumulator.to_profile() for accumulator in accumulators.values()]
+
+def infer_accumulated_semantic_types(
+    profiled_columns: List[Dict[str, Any]],
+    accumulators: Dict[str, ColumnProfileAccumulator]
+) -> List[Dict[str, Any]]:
+    """
+    Équivalent streaming de infer_semantic_types (F-04).
+
+    Args:
+        profiled_columns (List[Dict[str, Any]]): Profils générés par profile_accumulated_columns.
+        accumulators (Dict[str, ColumnProfileAccumulator]): Accumulateurs alimentés par tous les blocs.
+
+    Returns:
+        List[Dict[str, Any]]: La liste des profils complétée avec le champ "data_type_detected".
+    """
+    for col_profile in profiled_columns:
+        col_profile["data_type_detected"] = accumulators[col_profile["column_name"]].infer_semantic_type()
+    return profiled_columns
+
+def detect_accumulated_sensitive_data(
+    accumulators: Dict[str, ColumnProfileAccumulator],
+    column_profiles: List[Dict[str, Any]]
+) -> Tuple[bool, List[Dict[str, Any]]]:
+    """
+    Équivalent streaming de detect_sensitive_data (F-05) : seules les colonnes typées "Texte"
+    sont retenues, avec les types de PII rencontrés dans leurs blocs.
 
-        pii_types = []
-        if col_data_str.str.contains(EMAIL_REGEX, regex=True, na=False).any():
-            pii_types.append("EMAIL")
-        if col_data_str.str.contains(PHONE_REGEX, regex=True, na=False).any():
-            pii_types.append("PHONE")
-        if col_data_str.str.contains(NIR_REGEX, regex=True, na=False).any():
-            pii_types.append("NIR")
+    Args:
+        accumulators (Dict[str, ColumnProfileAccumulator]): Accumulateurs alimentés par tous les blocs.
+        column_profiles (List[Dict[str, Any]]): Liste des profils de colonnes (avec data_type_detected).
 
+    Returns:
+        Tuple[bool, List[Dict[str, Any]]]:
+            - True si des données sensibles sont détectées, False sinon.
+            - Liste de dictionnaires des colonnes détectées et des types de PII.
+    """
+    detected_columns = []
+    for col in column_profiles:
+        if col.get("data_type_detected") != "Texte":
+            continue
+        found = accumulators[col["column_name"]].pii_types
+        pii_types = [pii_type for pii_type in PII_PATTERNS if pii_type in found]
         if pii_types:
             detected_columns.append({
-                "column_name": col_name,
+                "column_name": col["column_name"],
                 "pii_types": pii_types
             })
-
-    contains_sensitive_data = len(detected_columns) > 0
-    return contains_sensitive_data, detected_columns
+    return len(detected_columns) > 0, detected_columns
@@ -0,0 +1,124 @@
+# VeriQual/tools/common/report_cache.py
+
+import os
+import json
+import time
+import hashlib
+from typing import Any, Dict, Optional
+
+# Taille des blocs lus pour calculer l'empreinte de contenu d'un fichier
+FINGERPRINT_BLOCK_SIZE = 1 << 20
+# Un fichier modifié moins de 2 s avant l'enregistrement de son empreinte peut encore l'avoir été
+# dans le même intervalle de résolution de mtime : sa taille et sa date ne suffisent pas à le reconnaître
+RACY_MTIME_MARGIN_NS = 2_000_000_000
+
+
+def file_content_fingerprint(filepath: str) -> str:
+    """Empreinte BLAKE2b (128 bits) du contenu d'un fichier, lu par blocs."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(FINGERPRINT_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _write_json_atomically(path: str, data: Any, indent: Optional[int] = None) -> None:
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    with open(temporary_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent)
+    os.replace(temporary_path, path)
+
+
+class ReportCache:
+    """
+    Cache disque des rapports d'audit, indexé par l'empreinte du contenu du fichier audité et
+    par une clé de configuration (profil de score, options, version du moteur).
+
+    Un index {chemin: taille, mtime, empreinte} évite de relire un fichier inchangé : l'empreinte
+    n'est recalculée que si sa taille ou sa date de modification a changé. Le cache est borné
+    à `max_size_bytes` : au-delà, les rapports les moins récemment utilisés sont supprimés.
+    """
+
+    INDEX_FILE = "index.json"
+    REPORTS_DIR = "reports"
+
+    def __init__(self, cache_dir: str, max_size_bytes: int):
+        self.cache_dir = cache_dir
+        self.max_size_bytes = max_size_bytes
+        self.reports_dir = os.path.join(cache_dir, self.REPORTS_DIR)
+        os.makedirs(self.reports_dir, exist_ok=True)
+        self._index_path = os.path.join(cache_dir, self.INDEX_FILE)
+        self._index = self._load_index()
+
+    def _load_index(self) -> Dict[str, list]:
+        try:
+            with open(self._index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            return index if isinstance(index, dict) else {}
+        except (OSError, ValueError):
+            # Index absent ou corrompu : les empreintes seront simplement recalculées
+            return {}
+
+    def fingerprint(self, filepath: str) -> str:
+        """
+        Empreinte du contenu d'un fichier, reprise de l'index si sa taille et sa date de
+        modification n'ont pas changé depuis son calcul.
+        """
+        key = os.path.abspath(filepath)
+        stat = os.stat(filepath)
+        entry = self._index.get(key)
+        if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns and stat.st_mtime_ns < entry[2] - RACY_MTIME_MARGIN_NS:
+            return entry[3]
+        fingerprint = file_content_fingerprint(filepath)
+        self._index[key] = [stat.st_size, stat.st_mtime_ns, time.time_ns(), fingerprint]
+        return fingerprint
+
+    def _report_path(self, fingerprint: str, config_key: str) -> str:
+        return os.path.join(self.reports_dir, f"{fingerprint}_{config_key}.json")
+
+    def get(self, fingerprint: str, config_key: str) -> Optional[Dict[str, Any]]:
+        """Rapport en cache pour ce contenu et cette configuration, ou None."""
+        path = self._report_path(fingerprint, config_key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                report = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # Date d'accès pour l'éviction LRU (atime n'est pas fiable sur tous les systèmes)
+        os.utime(path)
+        return report
+
+    def put(self, fingerprint: str, config_key: str, report: Dict[str, Any]) -> None:
+        """Enregistre un rapport (écriture atomique)."""
+        _write_json_atomically(self._report_path(fingerprint, config_key), report)
+
+    def evict(self) -> int:
+        """
+        Supprime les rapports les moins récemment utilisés jusqu'à revenir sous `max_size_bytes`.
+
+        Returns:
+            int: Nombre de rapports supprimés.
+        """
+        entries = []
+        with os.scandir(self.reports_dir) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith('.json'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        total_size = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_size -= size
+            removed += 1
+        return removed
+
+    def save(self) -> None:
+        """Enregistre l'index des empreintes (les fichiers disparus en sont retirés)."""
+        self._index = {path: entry for path, entry in self._index.items() if os.path.exists(path)}
+        _write_json_atomically(self._index_path, self._index)
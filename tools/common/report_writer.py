@@ -0,0 +1,128 @@
+# VeriQual/tools/common/report_writer.py
+
+import os
+import json
+import uuid
+import threading
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+try: # Dépendance optionnelle : sérialiseur JSON compilé
+    import orjson
+except ImportError:
+    orjson = None
+
+# Sérialiseur d'un rapport : (rapport, pretty) -> octets UTF-8
+ReportSerializer = Callable[[Dict[str, Any], bool], bytes]
+
+
+def _serialize_json(report: Dict[str, Any], pretty: bool) -> bytes:
+    if pretty:
+        return json.dumps(report, ensure_ascii=False, indent=2).encode('utf-8')
+    # Sans indentation, le module json utilise son encodeur C
+    return json.dumps(report, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _serialize_orjson(report: Dict[str, Any], pretty: bool) -> bytes:
+    # orjson écrit null pour NaN et l'infini (le module json écrit NaN, hors norme JSON)
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(report, option=option)
+
+
+# Sérialiseurs disponibles, par nom (voir register_report_serializer)
+REPORT_SERIALIZERS: Dict[str, ReportSerializer] = {"json": _serialize_json}
+if orjson is not None:
+    REPORT_SERIALIZERS["orjson"] = _serialize_orjson
+
+
+def register_report_serializer(name: str, serializer: ReportSerializer) -> None:
+    """
+    Ajoute (ou remplace) un sérialiseur de rapports, utilisable par son nom dans l'option
+    `report_serializer`. Avec `batch_workers` > 1, l'enregistrement doit avoir lieu à l'import
+    d'un module pour être connu des processus du pool.
+    """
+    REPORT_SERIALIZERS[name] = serializer
+
+
+def resolve_report_serializer(name: str) -> ReportSerializer:
+    """
+    Sérialiseur de nom `name` ; "auto" désigne orjson s'il est installé, json sinon.
+
+    Raises:
+        ValueError: Si aucun sérialiseur de ce nom n'est disponible.
+    """
+    if name == "auto":
+        name = "orjson" if "orjson" in REPORT_SERIALIZERS else "json"
+    if name not in REPORT_SERIALIZERS:
+        hint = " (paquet orjson non installé)" if name == "orjson" else ""
+        raise ValueError(f"Sérialiseur de rapports inconnu : {name}{hint} (disponibles : auto, {', '.join(REPORT_SERIALIZERS)}).")
+    return REPORT_SERIALIZERS[name]
+
+
+def write_report(report: Dict[str, Any], output_path: str, serializer: str = "json", pretty: bool = True) -> None:
+    """
+    Écrit un rapport JSON de façon atomique : jamais de rapport partiel, même si le processus
+    est interrompu.
+
+    Args:
+        report (Dict[str, Any]): Le rapport d'audit.
+        output_path (str): Chemin du fichier à écrire.
+        serializer (str): Nom du sérialiseur (voir resolve_report_serializer).
+        pretty (bool): Rapport indenté (lisible) plutôt que compact.
+    """
+    data = resolve_report_serializer(serializer)(report, pretty)
+    temporary_path = output_path + ".tmp"
+    with open(temporary_path, 'wb') as f:
+        f.write(data)
+    os.replace(temporary_path, output_path)
+
+
+def report_summary(report: Dict[str, Any]) -> Dict[str, Any]:
+    """Éléments d'un rapport repris dans le journal d'un lot (score, dimensions, erreurs structurelles)."""
+    file_info = report.get("file_info", {})
+    return {
+        "global_score": report.get("quality_score", {}).get("global_score"),
+        "total_rows": file_info.get("total_rows"),
+        "total_columns": file_info.get("total_columns"),
+        "contains_sensitive_data": report.get("sensitive_data_report", {}).get("contains_sensitive_data"),
+        "structural_errors": [error.get("error_code") for error in report.get("structural_errors", [])],
+    }
+
+
+class BatchSummaryWriter:
+    """
+    Journal NDJSON des résultats d'un lot : une ligne JSON par fichier, ajoutée en fin de
+    fichier (et vidée sur disque) dès que son résultat est connu. Le journal d'un lot
+    interrompu reste donc exploitable, et les lots successifs s'y ajoutent, distingués par
+    leur identifiant `batch_id`.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.batch_id = f"{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}-{uuid.uuid4().hex[:8]}"
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, 'a', encoding='utf-8')
+        self._lock = threading.Lock()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Ajoute une ligne au journal (horodatée, avec l'identifiant du lot)."""
+        line = json.dumps(
+            {"batch_id": self.batch_id, "completed_at": datetime.now(timezone.utc).isoformat(timespec='milliseconds'), **record},
+            ensure_ascii=False, separators=(',', ':'), default=str
+        )
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "BatchSummaryWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
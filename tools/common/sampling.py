@@ -0,0 +1,120 @@
+# VeriQual/tools/common/sampling.py
+
+import math
+import numpy as np
+import pandas as pd
+from io import StringIO
+from typing import Optional, Tuple
+
+# Quantile de la loi normale pour les intervalles de confiance à 95 %
+Z_95 = 1.96
+
+
+class ReservoirSampler:
+    """
+    Échantillon aléatoire simple sans remise de `sample_size` lignes, constitué au fil des
+    blocs d'un fichier : chaque ligne reçoit une clé aléatoire et les lignes de plus petites
+    clés sont conservées. La mémoire est bornée par la taille de l'échantillon et le tirage
+    ne dépend que de `seed` et de l'ordre des lignes (pas de la taille des blocs).
+    """
+
+    def __init__(self, sample_size: int, seed: int = 0):
+        self.sample_size = sample_size
+        self.rows_seen = 0
+        self._rng = np.random.default_rng(seed)
+        self._sample: Optional[pd.DataFrame] = None
+        self._keys = np.empty(0, dtype='float64')
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Intègre un bloc de lignes."""
+        chunk = chunk.set_axis(pd.RangeIndex(self.rows_seen, self.rows_seen + len(chunk)))
+        keys = self._rng.random(len(chunk))
+        self.rows_seen += len(chunk)
+        sample = chunk if self._sample is None else pd.concat([self._sample, chunk])
+        keys = np.concatenate([self._keys, keys])
+        if len(keys) > self.sample_size:
+            kept = np.argpartition(keys, self.sample_size - 1)[:self.sample_size]
+            sample, keys = sample.iloc[kept], keys[kept]
+        self._sample, self._keys = sample, keys
+
+    def result(self) -> Optional[pd.DataFrame]:
+        """L'échantillon, dans l'ordre des lignes du fichier (None si aucun bloc reçu)."""
+        return self._sample.sort_index() if self._sample is not None else None
+
+
+class SystematicSampler:
+    """
+    Échantillon systématique : une ligne toutes les `step` lignes à partir d'un rang de départ
+    tiré au hasard (reproductible par `seed`). Le pas est déduit du nombre de lignes attendu ;
+    l'échantillon est tronqué à `sample_size` lignes si ce nombre est sous-estimé.
+    """
+
+    def __init__(self, sample_size: int, expected_rows: int, seed: int = 0):
+        self.sample_size = sample_size
+        self.step = max(1, expected_rows // sample_size)
+        self.start = int(np.random.default_rng(seed).integers(0, self.step))
+        self.rows_seen = 0
+        self._parts = []
+        self._size = 0
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Intègre un bloc de lignes."""
+        positions = np.arange(self.rows_seen, self.rows_seen + len(chunk))
+        self.rows_seen += len(chunk)
+        selected = (positions >= self.start) & ((positions - self.start) % self.step == 0)
+        if self._size < self.sample_size and selected.any():
+            part = chunk.set_axis(pd.RangeIndex(positions[0], positions[-1] + 1))[selected]
+            part = part.iloc[:self.sample_size - self._size]
+            self._parts.append(part)
+            self._size += len(part)
+
+    def result(self) -> Optional[pd.DataFrame]:
+        """L'échantillon, dans l'ordre des lignes du fichier (None si aucun bloc reçu)."""
+        if self.rows_seen == 0:
+            return None
+        return pd.concat(self._parts) if self._parts else None
+
+
+def retype_sample(sample: pd.DataFrame) -> pd.DataFrame:
+    """
+    Redonne à un échantillon lu en texte les types que pandas aurait inférés à la lecture
+    du fichier (les blocs sont lus en texte pour que leurs lignes restent comparables).
+    """
+    return pd.read_csv(StringIO(sample.to_csv(index=False)))
+
+
+def proportion_confidence_interval(successes: int, n: int, population: Optional[int] = None, z: float = Z_95) -> Tuple[float, float]:
+    """
+    Intervalle de confiance de Wilson d'une proportion estimée sur un échantillon, avec
+    correction pour population finie.
+
+    Args:
+        successes (int): Nombre de cas observés dans l'échantillon.
+        n (int): Taille de l'échantillon.
+        population (Optional[int]): Taille de la population échantillonnée (None : infinie).
+        z (float): Quantile de la loi normale (1.96 pour 95 %).
+
+    Returns:
+        Tuple[float, float]: Bornes inférieure et supérieure, arrondies à 4 décimales.
+    """
+    if n == 0:
+        return 0.0, 1.0
+    p = successes / n
+    if population is not None and n >= population:
+        # Échantillon exhaustif : la proportion est exacte
+        return round(p, 4), round(p, 4)
+    n_eff = n if population is None or population <= 1 else n * (population - 1) / (population - n)
+    denominator = 1 + z * z / n_eff
+    centre = (p + z * z / (2 * n_eff)) / denominator
+    half_width = z * math.sqrt(p * (1 - p) / n_eff + z * z / (4 * n_eff * n_eff)) / denominator
+    return round(max(0.0, centre - half_width), 4), round(min(1.0, centre + half_width), 4)
+
+
+def undetected_prevalence_upper_bound(n: int, confidence: float = 0.95) -> float:
+    """
+    Proportion maximale (au niveau de confiance donné) de lignes porteuses d'une caractéristique
+    jamais observée dans un échantillon de n lignes : 1 - (1 - confidence) ** (1 / n).
+    """
+    if n == 0:
+        return 1.0
+    return round(1 - (1 - confidence) ** (1 / n), 4)
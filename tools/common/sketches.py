@@ -0,0 +1,384 @@
+# VeriQual/tools/common/sketches.py
+
+import math
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, List
+from tools.common.hashing import hash_series_values
+
+# Capacité minimale d'un compacteur KLL (largeur minimale retenue par Apache DataSketches, dont
+# l'analyse fournit la borne d'erreur de KLLSketch.rank_error_bound)
+KLL_MIN_CAPACITY = 8
+
+
+def _count_leading_zeros(values: np.ndarray) -> np.ndarray:
+    """Nombre de zéros de tête de chaque entier uint64 (valeurs non nulles)."""
+    values = values.copy()
+    zeros = np.zeros(len(values), dtype=np.uint8)
+    for shift in (32, 16, 8, 4, 2, 1):
+        mask = values < np.uint64(1 << (64 - shift))
+        zeros[mask] += shift
+        values[mask] <<= np.uint64(shift)
+    return zeros
+
+
+class HyperLogLog:
+    """
+    Estimateur HyperLogLog du nombre de valeurs distinctes d'une colonne.
+
+    La mémoire est fixe (2**precision registres d'un octet, soit 16 Ko pour la précision
+    par défaut de 14) quelle que soit la cardinalité. L'erreur-type relative de l'estimation
+    vaut 1.04 / sqrt(2**precision) (environ 0.81 % en précision 14). Deux sketches de même
+    précision se fusionnent par maximum registre à registre, ce qui permet de combiner les
+    blocs d'un fichier ou les résultats de plusieurs processus.
+    """
+
+    def __init__(self, precision: int = 14):
+        if not 4 <= precision <= 18:
+            raise ValueError(f"Précision HyperLogLog invalide : {precision} (attendu entre 4 et 18).")
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update_hashes(self, hashes: np.ndarray) -> None:
+        """Intègre des empreintes 64 bits."""
+        if len(hashes) == 0:
+            return
+        hashes = hashes.astype(np.uint64, copy=False)
+        indexes = (hashes >> np.uint64(64 - self.precision)).astype(np.int64)
+        # Bit sentinelle : le rang est borné même si les bits restants sont tous nuls
+        remaining = (hashes << np.uint64(self.precision)) | np.uint64(1 << (self.precision - 1))
+        ranks = _count_leading_zeros(remaining) + 1
+        np.maximum.at(self.registers, indexes, ranks)
+
+    def update(self, values: pd.Series) -> None:
+        """Intègre les valeurs d'un bloc (les nulls comptent pour une valeur distincte, comme nunique(dropna=False))."""
+        # Pas de factorisation préalable : elle reconstruirait la table des valeurs distinctes
+        self.update_hashes(hash_series_values(values, categorize=False))
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """Fusionne un autre sketch de même précision dans celui-ci."""
+        if other.precision != self.precision:
+            raise ValueError("Impossible de fusionner des sketches HyperLogLog de précisions différentes.")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def to_state(self) -> Dict[str, Any]:
+        """État du sketch en données simples (précision et tableau des registres)."""
+        return {"precision": self.precision, "registers": self.registers}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "HyperLogLog":
+        """Reconstruit un sketch à partir de to_state."""
+        sketch = cls(int(state["precision"]))
+        registers = np.asarray(state["registers"], dtype=np.uint8)
+        if registers.shape != sketch.registers.shape:
+            raise ValueError("Registres HyperLogLog incohérents avec la précision.")
+        sketch.registers = registers.copy()
+        return sketch
+
+    @property
+    def relative_standard_error(self) -> float:
+        """Erreur-type relative théorique de l'estimation."""
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def estimate(self) -> float:
+        """Estimation du nombre de valeurs distinctes."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw_estimate = alpha * m * m / float(np.sum(np.ldexp(1.0, -self.registers.astype(np.int64))))
+        empty_registers = int(np.count_nonzero(self.registers == 0))
+        # Correction petites cardinalités (comptage linéaire)
+        if raw_estimate <= 2.5 * m and empty_registers > 0:
+            return m * math.log(m / empty_registers)
+        return raw_estimate
+
+    def summary(self, upper_bound: int) -> Dict[str, Any]:
+        """
+        Estimation arrondie et intervalle de confiance à 95 %, bornés par `upper_bound`
+        (le nombre de lignes : il ne peut y avoir plus de valeurs distinctes que de lignes).
+
+        Returns:
+            Dict[str, Any]: method, precision, estimate, relative_standard_error, confidence_interval_95.
+        """
+        estimate = min(self.estimate(), upper_bound)
+        margin = 1.96 * self.relative_standard_error * estimate
+        return {
+            "method": "hyperloglog",
+            "precision": self.precision,
+            "estimate": int(round(estimate)),
+            "relative_standard_error": round(self.relative_standard_error, 4),
+            "confidence_interval_95": [
+                int(max(0, math.floor(estimate - margin))),
+                int(min(upper_bound, math.ceil(estimate + margin))),
+            ],
+        }
+
+
+def series_to_state(series: pd.Series) -> Dict[str, Any]:
+    """
+    Comptes d'occurrences (value_counts, compteurs Misra-Gries) en données simples : index
+    numérique ou booléen en tableau numpy, autres index (texte) en liste de valeurs.
+    """
+    index = series.index
+    return {
+        "index": index.to_numpy() if index.dtype.kind in "biuf" else index.tolist(),
+        "index_dtype": str(index.dtype),
+        "index_name": index.name,
+        "values": series.to_numpy(),
+        "name": series.name,
+    }
+
+
+def series_from_state(state: Dict[str, Any]) -> pd.Series:
+    """Reconstruit des comptes d'occurrences à partir de series_to_state."""
+    index = pd.Index(state["index"], dtype=pd.api.types.pandas_dtype(state["index_dtype"]), name=state["index_name"])
+    return pd.Series(np.asarray(state["values"], dtype='int64'), index=index, name=state["name"])
+
+
+def value_counts(values: pd.Series, sort: bool = True) -> pd.Series:
+    """
+    Nombre d'occurrences des valeurs non nulles d'une colonne (Series.value_counts). Pour une
+    colonne catégorielle, les catégories absentes sont écartées et les ex aequo gardent l'ordre
+    de première apparition, comme pour la même colonne lue en texte.
+    """
+    if not isinstance(values.dtype, pd.CategoricalDtype):
+        return values.value_counts(sort=sort)
+    codes = values.cat.codes.to_numpy()
+    present = codes[codes >= 0]
+    order = pd.unique(present)
+    counts = np.bincount(present, minlength=len(values.cat.categories))[order]
+    result = pd.Series(counts, index=values.cat.categories.take(order), name="count")
+    return result.sort_values(ascending=False, kind='stable') if sort else result
+
+
+def weighted_quantile(values: np.ndarray, weights: np.ndarray, q: float) -> float:
+    """
+    Quantile à partir de valeurs triées et de leurs poids (nombres d'occurrences),
+    avec l'interpolation linéaire de pandas : exact lorsque tous les poids sont réels.
+    """
+    cumulative = np.cumsum(weights)
+    position = (cumulative[-1] - 1) * q
+    lower, upper = int(np.floor(position)), int(np.ceil(position))
+    lower_value = values[np.searchsorted(cumulative, lower, side='right')]
+    upper_value = values[np.searchsorted(cumulative, upper, side='right')]
+    return float(lower_value + (position - lower) * (upper_value - lower_value))
+
+
+class KLLSketch:
+    """
+    Sketch de quantiles KLL (Karnin, Lang, Liberty) pour les colonnes numériques.
+
+    Le sketch conserve une hiérarchie de compacteurs dont la capacité décroît géométriquement
+    (facteur 2/3), sans descendre sous KLL_MIN_CAPACITY : la mémoire est de l'ordre de 3 * k
+    valeurs, quelle que soit la taille de la colonne. Erreur de rang normalisée, pour un quantile
+    donné et avec une confiance de 99 % : environ 2.296 / k**0.9723, soit ~1.33 % pour k = 200.
+    Cette borne est celle qu'établit la bibliothèque Apache DataSketches pour la même
+    paramétrisation (largeur minimale de compacteur 8) ; c'est une borne empirique à 99 %, pas
+    une garantie déterministe. Tant qu'aucune compaction n'a eu lieu, les quantiles sont exacts.
+
+    Les compactions tirent leur décalage d'un générateur initialisé par `seed` : le résultat est
+    reproductible pour une même séquence de blocs. Deux sketches de même k se fusionnent
+    niveau par niveau (blocs d'un fichier, processus parallèles).
+    """
+
+    def __init__(self, k: int = 200, seed: int = 0):
+        if k < 8:
+            raise ValueError(f"Paramètre k du sketch KLL invalide : {k} (minimum 8).")
+        self.k = k
+        self.count = 0
+        self.min_value = None
+        self.max_value = None
+        self.levels: List[np.ndarray] = [np.empty(0, dtype='float64')]
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def rank_error_bound(self) -> float:
+        """Erreur de rang normalisée d'un quantile (confiance 99 %, borne d'Apache DataSketches)."""
+        return 2.296 / self.k ** 0.9723
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(KLL_MIN_CAPACITY, int(math.ceil(self.k * (2.0 / 3.0) ** depth)))
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) >= self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0, dtype='float64'))
+                items = np.sort(items)
+                # Un élément est laissé de côté si l'effectif est impair
+                kept = items[-1:] if len(items) % 2 else items[:0]
+                paired = items[:len(items) - len(kept)]
+                offset = int(self._rng.integers(0, 2))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], paired[offset::2]])
+                self.levels[level] = kept
+            level += 1
+
+    def update(self, values: np.ndarray) -> None:
+        """Intègre un bloc de valeurs numériques non nulles."""
+        values = np.asarray(values, dtype='float64')
+        if len(values) == 0:
+            return
+        self.count += len(values)
+        block_min, block_max = float(values.min()), float(values.max())
+        self.min_value = block_min if self.min_value is None else min(self.min_value, block_min)
+        self.max_value = block_max if self.max_value is None else max(self.max_value, block_max)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """Fusionne un autre sketch dans celui-ci."""
+        if other.count == 0:
+            return self
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0, dtype='float64'))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self.min_value = other.min_value if self.min_value is None else min(self.min_value, other.min_value)
+        self.max_value = other.max_value if self.max_value is None else max(self.max_value, other.max_value)
+        self._compress()
+        return self
+
+    def to_state(self) -> Dict[str, Any]:
+        """État du sketch en données simples, générateur des compactions compris (reprise reproductible)."""
+        return {
+            "k": self.k,
+            "count": self.count,
+            "min_value": self.min_value,
+            "max_value": self.max_value,
+            "levels": list(self.levels),
+            "rng_state": self._rng.bit_generator.state,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "KLLSketch":
+        """Reconstruit un sketch à partir de to_state."""
+        sketch = cls(int(state["k"]))
+        sketch.count = int(state["count"])
+        sketch.min_value = None if state["min_value"] is None else float(state["min_value"])
+        sketch.max_value = None if state["max_value"] is None else float(state["max_value"])
+        sketch.levels = [np.asarray(items, dtype='float64') for items in state["levels"]]
+        if not sketch.levels or any(items.ndim != 1 for items in sketch.levels):
+            raise ValueError("Niveaux du sketch KLL invalides.")
+        sketch._rng.bit_generator.state = state["rng_state"]
+        return sketch
+
+    def quantile(self, q: float) -> float:
+        """Estimation du quantile q (0 <= q <= 1) ; NaN si le sketch est vide."""
+        if self.count == 0:
+            return float('nan')
+        if q <= 0:
+            return self.min_value
+        if q >= 1:
+            return self.max_value
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items), 2 ** level, dtype='int64') for level, items in enumerate(self.levels)])
+        order = np.argsort(values, kind='stable')
+        return weighted_quantile(values[order], weights[order], q)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict[str, Any]: method, k, rank_error_bound et is_exact (aucune compaction effectuée).
+        """
+        return {
+            "method": "kll",
+            "k": self.k,
+            "rank_error_bound": round(self.rank_error_bound, 4),
+            "is_exact": len(self.levels) == 1,
+        }
+
+
+class HeavyHittersSketch:
+    """
+    Résumé Misra-Gries des valeurs les plus fréquentes d'une colonne (heavy hitters).
+
+    Au plus `capacity` compteurs sont conservés. Lorsqu'un bloc fait dépasser cette capacité,
+    tous les compteurs sont diminués du (capacity + 1)-ième plus grand, et ceux qui tombent à
+    zéro sont supprimés. Chaque compteur sous-estime donc la fréquence réelle d'au plus
+    `error` occurrences, avec error <= total / (capacity + 1) : toute valeur plus fréquente
+    que ce seuil est garantie d'être présente. Deux résumés se fusionnent en additionnant
+    leurs compteurs puis en réappliquant la réduction (erreurs cumulées).
+    """
+
+    def __init__(self, capacity: int = 64):
+        if capacity < 1:
+            raise ValueError(f"Capacité du résumé de valeurs fréquentes invalide : {capacity}.")
+        self.capacity = capacity
+        self.total = 0
+        self.error = 0
+        self.counters = pd.Series(dtype='int64')
+
+    def _update_counts(self, counts: pd.Series) -> None:
+        if counts.empty:
+            return
+        if self.counters.empty:
+            merged = counts
+        else:
+            # sort=False conserve l'ordre de première apparition (départage des ex aequo)
+            merged = pd.concat([self.counters, counts]).groupby(level=0, sort=False).sum()
+        if len(merged) > self.capacity:
+            threshold = int(merged.nlargest(self.capacity + 1).iloc[-1])
+            merged = merged - threshold
+            merged = merged[merged > 0]
+            self.error += threshold
+        self.counters = merged.astype('int64')
+
+    def update(self, values: pd.Series) -> None:
+        """Intègre les valeurs non nulles d'un bloc (table de comptage bornée par la taille du bloc)."""
+        values = values.dropna()
+        self.total += len(values)
+        self._update_counts(value_counts(values, sort=False))
+
+    def merge(self, other: "HeavyHittersSketch") -> "HeavyHittersSketch":
+        """Fusionne un autre résumé dans celui-ci."""
+        self.total += other.total
+        self.error += other.error
+        self._update_counts(other.counters)
+        return self
+
+    def to_state(self) -> Dict[str, Any]:
+        """État du résumé en données simples."""
+        return {"capacity": self.capacity, "total": self.total, "error": self.error, "counters": series_to_state(self.counters)}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "HeavyHittersSketch":
+        """Reconstruit un résumé à partir de to_state."""
+        sketch = cls(int(state["capacity"]))
+        sketch.total = int(state["total"])
+        sketch.error = int(state["error"])
+        sketch.counters = series_from_state(state["counters"])
+        return sketch
+
+    def top(self, n: int = 5) -> pd.Series:
+        """Les n valeurs les plus fréquentes et leur nombre d'occurrences (borne inférieure)."""
+        return self.counters.sort_values(ascending=False, kind='stable').head(n)
+
+    def most_frequent(self) -> Any:
+        """Valeur la plus fréquente (la plus petite en cas d'égalité, comme Series.mode) ; None si vide."""
+        if self.counters.empty:
+            return None
+        return smallest_value(self.counters[self.counters == self.counters.max()].index.tolist())
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict[str, Any]: method, capacity et max_frequency_error (sous-estimation maximale
+                            d'une fréquence relative).
+        """
+        return {
+            "method": "misra_gries",
+            "capacity": self.capacity,
+            "max_frequency_error": round(self.error / self.total, 4) if self.total else 0.0,
+        }
+
+
+def smallest_value(values: List[Any]) -> Any:
+    """Plus petite valeur d'une liste (première si les valeurs ne sont pas comparables)."""
+    try:
+        return sorted(values)[0]
+    except TypeError:
+        return values[0]